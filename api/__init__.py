@@ -4,3 +4,5 @@ from .articles import router as articles_router
 from .debate import router as debate_router
 from .shorts import router as shorts_router
 from .users import router as users_router
+from .admin import router as admin_router
+from .feed import router as feed_router
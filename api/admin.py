@@ -0,0 +1,89 @@
+"""
+Admin API Router - 파이프라인 운영 관리
+"""
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.database import get_db
+from api.schemas import (
+    PipelineFailureResponse, RedriveRequest, RedriveResponse, LLMUsageResponse,
+    ProfileFileResponse
+)
+from api.common import verify_admin_secret
+from services import dead_letter
+from services.llm_ledger import summarize_usage
+from core.profiling import list_profiles, resolve_profile
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(verify_admin_secret)]
+)
+
+
+@router.get("/failures", response_model=List[PipelineFailureResponse])
+def get_pipeline_failures(
+    stage: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db)
+):
+    """파이프라인 실패/데드레터 항목 조회"""
+    if stage and stage not in dead_letter.STAGES:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 단계입니다: {stage}")
+    return dead_letter.list_failures(db, stage=stage, status=status, limit=limit)
+
+
+@router.post("/failures/redrive", response_model=RedriveResponse)
+def redrive_pipeline_failures(request: RedriveRequest, db: Session = Depends(get_db)):
+    """
+    실패 항목 재처리 요청
+
+    실패 기록을 삭제하여 다음 파이프라인 실행 시 다시 작업 대상이 되도록 합니다.
+    """
+    if request.stage and request.stage not in dead_letter.STAGES:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 단계입니다: {request.stage}")
+    count = dead_letter.redrive(
+        db,
+        stage=request.stage,
+        item_id=request.item_id,
+        status=request.status
+    )
+    return RedriveResponse(redriven=count)
+
+
+@router.get("/llm-usage", response_model=List[LLMUsageResponse])
+def get_llm_usage(
+    days: int = Query(7, ge=1, le=settings.llm_usage_max_days),
+    stage: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """일자/단계별 LLM 호출 수, 토큰 사용량, 예상 비용, p50/p95 지연시간"""
+    return summarize_usage(db, days=days, stage=stage)
+
+
+@router.get("/profiles", response_model=List[ProfileFileResponse])
+def get_profiles():
+    """
+    저장된 프로파일 목록
+
+    - *.folded: X-Profile 요청의 샘플링 결과 (speedscope/flamegraph.pl로 열기)
+    - *.prof: 파이프라인 단계 cProfile 결과 (pstats/snakeviz로 열기)
+    """
+    return list_profiles()
+
+
+@router.get("/profiles/{name}")
+def download_profile(name: str):
+    """프로파일 파일 다운로드"""
+    path = resolve_profile(name)
+    if not path:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    return FileResponse(path, filename=name, media_type="application/octet-stream")
@@ -3,13 +3,15 @@ Articles API Router
 """
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, joinedload
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.database import get_db, Article
+from core.database import get_async_db, Article
 from api.schemas import ArticleListResponse, ArticleDetailResponse
 from api.common import translate_category_to_korean
 
@@ -17,20 +19,21 @@ router = APIRouter(prefix="/articles", tags=["Articles"])
 
 
 @router.get("", response_model=List[ArticleListResponse])
-def get_all_articles(
+async def get_all_articles(
     category: Optional[str] = None,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     모든 기사 목록 조회 (카테고리 필터 가능)
     """
-    query = db.query(Article).options(joinedload(Article.source))
+    # 목록은 본문을 쓰지 않으므로 읽지 않음 (본문은 압축 저장 - 읽으면 이벤트 루프에서 해제)
+    query = select(Article).options(joinedload(Article.source), defer(Article.body))
     
     if category:
-        query = query.filter(Article.category == category)
+        query = query.where(Article.category == category)
         
-    articles = query.order_by(Article.crawled_at.desc()).limit(limit).all()
+    articles = (await db.scalars(query.order_by(Article.crawled_at.desc()).limit(limit))).all()
     
     return [
         ArticleListResponse(
@@ -46,11 +49,11 @@ def get_all_articles(
 
 
 @router.get("/{article_id}", response_model=ArticleDetailResponse)
-def get_article_detail(article_id: int, db: Session = Depends(get_db)):
+async def get_article_detail(article_id: int, db: AsyncSession = Depends(get_async_db)):
     """기사 상세 조회 (본문 포함)"""
-    article = db.query(Article).options(
-        joinedload(Article.source)
-    ).filter(Article.id == article_id).first()
+    article = await db.scalar(
+        select(Article).options(joinedload(Article.source)).where(Article.id == article_id)
+    )
     
     if not article:
         raise HTTPException(status_code=404, detail="기사를 찾을 수 없습니다.")
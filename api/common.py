@@ -1,4 +1,12 @@
 from typing import Optional
+from fastapi import Header, HTTPException
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+
 
 def translate_category_to_korean(category: Optional[str]) -> Optional[str]:
     """영어 카테고리를 한국어로 번역"""
@@ -22,3 +30,17 @@ def translate_category_to_korean(category: Optional[str]) -> Optional[str]:
     }
     
     return category_map.get(category.lower(), category)
+
+
+def check_cron_secret(secret: Optional[str]) -> bool:
+    """Cron/관리자 시크릿 키 검증 (실패 시 HTTPException)"""
+    if not settings.cron_secret_key:
+        raise HTTPException(status_code=500, detail="CRON_SECRET_KEY가 서버에 설정되지 않았습니다.")
+    if secret != settings.cron_secret_key:
+        raise HTTPException(status_code=403, detail="잘못된 접근입니다 (Invalid Secret).")
+    return True
+
+
+def verify_admin_secret(x_cron_secret: Optional[str] = Header(None)) -> bool:
+    """관리자 엔드포인트용 시크릿 검증 (X-Cron-Secret 헤더)"""
+    return check_cron_secret(x_cron_secret)
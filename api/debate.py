@@ -1,8 +1,10 @@
 """
 AI Debate API Router - 긍정/중립/부정 관점 토론
 """
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Response, status
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request, Response, status
 from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import List, Optional, Dict
@@ -13,8 +15,10 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.database import get_db, Debate
+from core.database import get_db, get_async_db, Debate
 from services.debate_service import DebateService
+from services.snapshots import snapshot_store
+from services.archive import archive_store
 
 router = APIRouter(prefix="/debate", tags=["AI Debate"])
 
@@ -61,24 +65,35 @@ class DebateStatusResponse(BaseModel):
 
 
 @router.get("/{topic_id}", response_model=DebateResponse)
-def get_debate(
+async def get_debate(
+    request: Request,
     topic_id: int, 
     background_tasks: BackgroundTasks,
     response: Response,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 토픽에 대한 AI 토론 조회
     
     토론이 없으면 202 Accepted를 반환하고 백그라운드에서 생성합니다.
     클라이언트는 202 응답을 받으면 잠시 후 다시 요청해야 합니다.
+    생성된 토론의 스냅샷(services/snapshots.py)이 있으면 파일로 응답합니다.
     """
-    service = DebateService()
-    
+    snapshot = snapshot_store.response(request, f"debate/{topic_id}")
+    if snapshot is not None:
+        return snapshot
+
     # Check if debate exists
-    debate_content = service.get_debate(topic_id, db)
+    debate = await build_debate_response(topic_id, db)
     
-    if not debate_content:
+    if debate is None:
+        # 보관된 토픽은 새로 생성하지 않고 보관 파일의 토론으로 응답 (느린 경로)
+        record = await archive_store.load_topic(topic_id, db)
+        if record is not None:
+            if record.get("debate") is None:
+                raise HTTPException(status_code=404, detail="보관된 토픽에는 토론이 없습니다.")
+            return _debate_response(topic_id, record["debate"])
+
         # Generate debate asynchronously if not exists
         def generate_in_background():
             try:
@@ -102,6 +117,18 @@ def get_debate(
             )
         )
     
+    return debate
+
+
+async def build_debate_response(topic_id: int, db: AsyncSession) -> Optional[DebateResponse]:
+    """생성된 토론 응답 (없으면 None - 스냅샷 생성에도 사용)"""
+    debate_content = await DebateService().get_debate_async(topic_id, db)
+    if not debate_content:
+        return None
+    return _debate_response(topic_id, debate_content)
+
+
+def _debate_response(topic_id: int, debate_content: Dict) -> DebateResponse:
     return DebateResponse(
         topic_id=topic_id,
         topic_headline=debate_content["topic_headline"],
@@ -112,14 +139,16 @@ def get_debate(
 
 
 @router.post("/{topic_id}/regenerate", response_model=DebateResponse)
-def regenerate_debate(topic_id: int, db: Session = Depends(get_db)):
+def regenerate_debate(topic_id: int, force: bool = False, db: Session = Depends(get_db)):
     """
-    기존 토론을 삭제하고 새로 생성
+    토론을 새로 생성해 기존 토론을 교체 (생성에 실패하면 기존 토론 유지)
+    
+    관련 기사가 바뀌지 않았으면 기존 토론을 그대로 반환합니다. (force=true로 강제 재생성)
     """
     service = DebateService()
     
     try:
-        debate_content = service.regenerate_debate(topic_id, db)
+        debate_content = service.regenerate_debate(topic_id, db, force=force)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -137,15 +166,56 @@ def regenerate_debate(topic_id: int, db: Session = Depends(get_db)):
     )
 
 
+@router.get("/{topic_id}/rounds/{round_number}", response_model=DebateRound)
+async def get_debate_round(topic_id: int, round_number: int, db: AsyncSession = Depends(get_async_db)):
+    """토론의 한 라운드만 조회 (1부터, DB에서 해당 라운드만 JSON 추출)"""
+    if round_number < 1:
+        raise HTTPException(status_code=404, detail="라운드를 찾을 수 없습니다.")
+    row = (await db.execute(
+        select(Debate.content_json[("rounds", round_number - 1)]).where(Debate.topic_id == topic_id)
+    )).first()
+    if row is None:
+        archived = await _archived_debate(topic_id, db)
+        if archived is None:
+            raise HTTPException(status_code=404, detail="토론이 아직 생성되지 않았습니다.")
+        rounds = archived.get("rounds") or []
+        row = (rounds[round_number - 1] if round_number <= len(rounds) else None,)
+    if row[0] is None:
+        raise HTTPException(status_code=404, detail="라운드를 찾을 수 없습니다.")
+    return row[0]
+
+
+@router.get("/{topic_id}/conclusion", response_model=Conclusion)
+async def get_debate_conclusion(topic_id: int, db: AsyncSession = Depends(get_async_db)):
+    """토론 결론만 조회 (DB에서 conclusion만 JSON 추출)"""
+    row = (await db.execute(
+        select(Debate.content_json["conclusion"]).where(Debate.topic_id == topic_id)
+    )).first()
+    if row is None:
+        archived = await _archived_debate(topic_id, db)
+        row = (archived.get("conclusion") if archived else None,)
+    if row[0] is None:
+        raise HTTPException(status_code=404, detail="토론이 아직 생성되지 않았습니다.")
+    return row[0]
+
+
+async def _archived_debate(topic_id: int, db: AsyncSession) -> Optional[Dict]:
+    """보관된 토픽의 토론 문서 (보관되지 않았거나 토론이 없으면 None)"""
+    record = await archive_store.load_topic(topic_id, db)
+    return record.get("debate") if record else None
+
+
 @router.get("/{topic_id}/status", response_model=DebateStatusResponse)
-def check_debate_status(topic_id: int, db: Session = Depends(get_db)):
-    """토론 존재 여부 확인"""
-    debate = db.query(Debate).filter(Debate.topic_id == topic_id).first()
-    
+async def check_debate_status(topic_id: int, db: AsyncSession = Depends(get_async_db)):
+    """토론 존재 여부 확인 (운영 테이블에 있으면 토론 문서는 읽지 않음)"""
+    has_debate = (await db.execute(select(Debate.id).where(Debate.topic_id == topic_id))).first() is not None
+    if not has_debate:
+        has_debate = await _archived_debate(topic_id, db) is not None
+
     return DebateStatusResponse(
         topic_id=topic_id,
-        has_debate=debate is not None,
-        message="토론이 존재합니다." if debate else "토론이 아직 생성되지 않았습니다."
+        has_debate=has_debate,
+        message="토론이 존재합니다." if has_debate else "토론이 아직 생성되지 않았습니다."
     )
 
 
@@ -159,8 +229,7 @@ def generate_debate_async(
     비동기로 토론 생성 (백그라운드 작업)
     """
     # Check if already exists
-    debate = db.query(Debate).filter(Debate.topic_id == topic_id).first()
-    if debate:
+    if db.query(Debate.id).filter(Debate.topic_id == topic_id).first():
         return {"message": "토론이 이미 존재합니다.", "topic_id": topic_id}
     
     def generate_in_background():
@@ -0,0 +1,181 @@
+"""
+Feed API Router - 관심 키워드/편향 필터 기반 개인화 피드
+"""
+import asyncio
+import json
+import logging
+import re
+from typing import AsyncIterator, Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.database import get_async_db, AsyncSessionLocal
+from api.schemas import FeedResponse, FeedItemResponse, FeedArticleResponse, StreamTokenResponse
+from api.common import translate_category_to_korean
+from auth import create_stream_token, get_current_user, get_stream_token_user
+from services.auth_cache import CurrentUser
+from services.keyword_matcher import topic_keyword_index, parse_keywords
+from services.keyword_watch import keyword_watch, Subscription, WatchCapacityExceeded
+
+router = APIRouter(prefix="/feed", tags=["Feed"])
+
+_TOKEN_PARAM = re.compile(r"([?&]token=)[^&\s]*")
+
+
+class _RedactTokenFilter(logging.Filter):
+    """uvicorn 접근 로그에서 ?token= 값을 가림 (잘못 넣은 액세스 토큰도 로그에 남지 않도록)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.args, tuple) and len(record.args) >= 3 and isinstance(record.args[2], str):
+            args = list(record.args)
+            args[2] = _TOKEN_PARAM.sub(r"\1***", args[2])
+            record.args = tuple(args)
+        return True
+
+
+logging.getLogger("uvicorn.access").addFilter(_RedactTokenFilter())
+
+
+@router.get("", response_model=FeedResponse)
+async def get_feed(
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    로그인 사용자의 개인화 피드 (services/keyword_matcher.py의 메모리 색인 사용)
+
+    - User.keywords와 매칭된 토픽을 관련도 × 최신성 순으로 반환 (키워드가 없으면 최신 토픽)
+    - 기사별 ai_bias_score가 User.bias_filter_level을 넘는 기사는 제외
+    """
+    limit = min(limit, settings.feed_max_page_size)
+    await topic_keyword_index.ensure_fresh(db)
+
+    keywords = parse_keywords(current_user.keywords)
+    entries = topic_keyword_index.feed(keywords, current_user.bias_filter_level)
+
+    items = [
+        FeedItemResponse(
+            topic_id=entry.topic.topic_id,
+            created_at=entry.topic.created_at,
+            ai_neutral_headline=entry.topic.display_headline,
+            category=translate_category_to_korean(entry.topic.category),
+            image_url=next((a.image_url for a in entry.articles if a.image_url), None),
+            matched_keywords=entry.matched_keywords,
+            score=round(entry.score, 4),
+            articles=[
+                FeedArticleResponse(
+                    article_id=article.article_id,
+                    title=article.title,
+                    category=translate_category_to_korean(article.category),
+                    ai_bias_score=article.ai_bias_score
+                )
+                for article in entry.articles
+            ]
+        )
+        for entry in entries[offset:offset + limit]
+    ]
+    return FeedResponse(
+        keywords=keywords,
+        bias_filter_level=current_user.bias_filter_level,
+        total=len(entries),
+        offset=offset,
+        limit=limit,
+        items=items
+    )
+
+
+def format_sse(event: str, data: Dict, event_id: Optional[str] = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+@router.post("/stream-token", response_model=StreamTokenResponse)
+async def issue_stream_token(current_user: CurrentUser = Depends(get_current_user)):
+    """
+    실시간 알림 스트림 전용 토큰 발급 (/feed/stream?token=)
+
+    URL은 접근 로그/프록시 로그에 남으므로 1일짜리 액세스 토큰 대신 이 토큰을 넣습니다.
+    연결할 때만 확인하므로 짧게 유지하고, 재연결 전에 새로 발급받습니다. 일반 API 인증에는 쓸 수 없습니다.
+    """
+    expires_in = settings.keyword_watch_stream_token_seconds
+    return StreamTokenResponse(token=create_stream_token(current_user.email, expires_in), expires_in=expires_in)
+
+
+async def get_stream_user(request: Request, token: Optional[str] = Query(None)) -> CurrentUser:
+    """
+    스트림 연결 사용자 (Authorization 헤더의 액세스 토큰 또는 ?token=의 스트림 전용 토큰)
+
+    브라우저 EventSource는 헤더를 지정할 수 없어 쿼리 파라미터도 허용하되, 로그에 남아도 되도록
+    POST /feed/stream-token으로 받은 짧은 토큰만 받습니다 (액세스 토큰은 401).
+    연결이 유지되는 동안 DB 세션을 잡고 있지 않도록 인증에만 세션을 잠깐 사용합니다.
+    """
+    authorization = request.headers.get("authorization", "")
+    async with AsyncSessionLocal() as db:
+        if authorization.lower().startswith("bearer "):
+            return await get_current_user(authorization[len("bearer "):], db)
+        if not token:
+            raise HTTPException(status_code=401, detail="로그인이 필요합니다.", headers={"WWW-Authenticate": "Bearer"})
+        return await get_stream_token_user(token, db)
+
+
+async def _watch_events(request: Request, subscription: Subscription) -> AsyncIterator[str]:
+    # 구독은 라우트에서 등록 (한도 초과를 응답 헤더를 보내기 전에 503으로 알리도록) - 여기서는 전달과 해제만
+    try:
+        yield format_sse("ready", {"keywords": list(subscription.keywords)})
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=settings.keyword_watch_heartbeat_seconds
+                )
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": ping\n\n"
+                continue
+            dropped = subscription.take_dropped()
+            if dropped:
+                yield format_sse("lagged", {"dropped": dropped})
+            yield format_sse(event.event, event.data, event.event_id)
+    finally:
+        keyword_watch.unsubscribe(subscription)
+
+
+@router.get("/stream")
+async def watch_keywords(request: Request, current_user: CurrentUser = Depends(get_stream_user)):
+    """
+    관심 키워드 실시간 알림 (Server-Sent Events, services/keyword_watch.py)
+
+    - event: article - 키워드가 제목/카테고리에 나타난 새 기사
+    - event: topic - 키워드가 헤드라인/기사 제목에 나타난 새 토픽
+    - event: lagged - 연결이 느려 버려진 이벤트 수
+    """
+    keywords = parse_keywords(current_user.keywords)
+    if not keywords:
+        raise HTTPException(status_code=400, detail="관심 키워드를 먼저 설정하세요.")
+    try:
+        subscription = keyword_watch.subscribe(current_user.id, keywords)
+    except WatchCapacityExceeded:
+        raise HTTPException(
+            status_code=503, detail="실시간 알림 연결 수가 한도에 도달했습니다. 잠시 후 다시 시도하세요.",
+            headers={"Retry-After": "30"}
+        )
+
+    return StreamingResponse(
+        _watch_events(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # 스트림이 시작되기 전에 연결이 끊겨도 구독이 남지 않도록 (unsubscribe는 여러 번 불러도 됨)
+        background=BackgroundTask(keyword_watch.unsubscribe, subscription)
+    )
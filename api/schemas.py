@@ -104,6 +104,39 @@ class TopicViewResponse(BaseModel):
     article: Optional[ArticleInTopicResponse] = None  # 단일 기사 객체만 반환
 
 
+# --- Feed Schemas ---
+class FeedArticleResponse(BaseModel):
+    article_id: int
+    title: str
+    category: Optional[str] = None
+    ai_bias_score: Optional[float] = None
+
+
+class FeedItemResponse(BaseModel):
+    topic_id: int
+    created_at: Optional[datetime.datetime] = None
+    ai_neutral_headline: Optional[str] = None
+    category: Optional[str] = None
+    image_url: Optional[str] = None
+    matched_keywords: List[str]
+    score: float
+    articles: List[FeedArticleResponse]
+
+
+class FeedResponse(BaseModel):
+    keywords: List[str]
+    bias_filter_level: Optional[int] = None
+    total: int
+    offset: int
+    limit: int
+    items: List[FeedItemResponse]
+
+
+class StreamTokenResponse(BaseModel):
+    token: str
+    expires_in: int
+
+
 # --- Short Schemas ---
 class ShortResponse(BaseModel):
     topic_id: int
@@ -149,3 +182,46 @@ class DebateResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+# --- Admin Schemas ---
+class PipelineFailureResponse(BaseModel):
+    stage: str
+    item_id: int
+    attempts: int
+    status: str
+    last_error: Optional[str] = None
+    next_eligible_at: Optional[datetime.datetime] = None
+    updated_at: Optional[datetime.datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class RedriveRequest(BaseModel):
+    stage: Optional[str] = None
+    item_id: Optional[int] = None
+    status: Optional[str] = "dead"  # None이면 재시도 대기 중인 항목도 포함
+
+
+class RedriveResponse(BaseModel):
+    redriven: int
+
+
+class LLMUsageResponse(BaseModel):
+    day: datetime.date
+    stage: str
+    calls: int
+    errors: int
+    cache_hits: int
+    prompt_tokens: int
+    completion_tokens: int
+    cost_usd: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+
+
+class ProfileFileResponse(BaseModel):
+    name: str
+    size_bytes: int
+    created_at: datetime.datetime
@@ -1,47 +1,76 @@
 """
 Shorts API Router
 """
-import json
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.database import get_db, Short
+from core.database import get_db, get_async_db, Short
 from api.schemas import ShortResponse
 from services.content_service import ContentService
+from services.snapshots import snapshot_store
+from services.archive import archive_store
 
 router = APIRouter(prefix="/shorts", tags=["Shorts"])
 
+# 숏폼 문서(Short.content_json)에서 응답에 쓰는 필드
+SHORT_RESPONSE_FIELDS = ("title", "script", "hashtags", "image_url")
+
 
 @router.get("/{topic_id}", response_model=ShortResponse)
-def get_shorts(topic_id: int, db: Session = Depends(get_db)):
-    """토픽에 대한 숏폼 콘텐츠 조회"""
-    short = db.query(Short).filter(Short.topic_id == topic_id).first()
-    
-    if not short:
-        raise HTTPException(status_code=404, detail="아직 생성된 숏폼이 없습니다.")
-        
-    data = json.loads(short.content_json)
-    
+async def get_shorts(request: Request, topic_id: int, db: AsyncSession = Depends(get_async_db)):
+    """토픽에 대한 숏폼 콘텐츠 조회 (스냅샷이 있으면 파일로 응답)"""
+    snapshot = snapshot_store.response(request, f"shorts/{topic_id}")
+    if snapshot is not None:
+        return snapshot
+
+    short = await build_short_response(topic_id, db)
+    if short is None:
+        # 보관된 토픽의 숏폼은 보관 파일에서 읽음 (느린 경로)
+        record = await archive_store.load_topic(topic_id, db)
+        if record is None or record.get("short") is None:
+            raise HTTPException(status_code=404, detail="아직 생성된 숏폼이 없습니다.")
+        short = _short_response(topic_id, *(record["short"].get(field) for field in SHORT_RESPONSE_FIELDS))
+    return short
+
+
+async def build_short_response(topic_id: int, db: AsyncSession) -> Optional[ShortResponse]:
+    """숏폼 응답 생성 (없으면 None) - 응답에 필요한 필드만 DB에서 JSON 추출"""
+    row = (await db.execute(
+        select(*(Short.content_json[field] for field in SHORT_RESPONSE_FIELDS)).where(Short.topic_id == topic_id)
+    )).first()
+    if row is None:
+        return None
+    return _short_response(topic_id, *row)
+
+
+def _short_response(topic_id: int, title, script, hashtags, image_url) -> ShortResponse:
     return ShortResponse(
         topic_id=topic_id,
-        title=data.get("title", "제목 없음"),
-        script=data.get("script", "내용 없음"),
-        hashtags=data.get("hashtags", []),
-        image_url=data.get("image_url")
+        title=title if title is not None else "제목 없음",
+        script=script if script is not None else "내용 없음",
+        hashtags=hashtags if hashtags is not None else [],
+        image_url=image_url
     )
 
 
 @router.post("/{topic_id}/generate", response_model=ShortResponse)
-def generate_short(topic_id: int, db: Session = Depends(get_db)):
-    """숏폼 콘텐츠 생성 또는 재생성"""
+def generate_short(topic_id: int, force: bool = False, db: Session = Depends(get_db)):
+    """
+    숏폼 콘텐츠 생성 또는 재생성
+    
+    관련 기사가 바뀌지 않았으면 기존 숏폼을 그대로 반환합니다. (force=true로 강제 재생성)
+    """
     service = ContentService()
     
     try:
-        result = service.generate_short(topic_id, db)
+        result = service.generate_short(topic_id, db, force=force)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
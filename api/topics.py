@@ -1,16 +1,26 @@
 """
 Topics API Router
 """
-import datetime
+from types import SimpleNamespace
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, HTTPException, Depends, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.database import get_db, Topic, Article
+from core.config import settings
+from core.database import get_async_db, Topic, Article, Source, TopicStats
+from core.metrics import record_cache
+from services.event_bus import event_bus, TOPICS_CREATED, TOPICS_UPDATED, ARTICLES_UPDATED, RESYNC
+from services.snapshots import snapshot_store, topic_list_key
+from services.archive import archive_store
+from services import trending
+from services.content_hash import TOPIC_SUMMARY_ARTICLE_LIMIT
+from services.content_service import build_topic_body
 from api.schemas import (
     TopicListResponse, TopicViewResponse, 
     ArticleInTopicResponse, TopicArticleSimple
@@ -26,155 +36,192 @@ import time
 topic_cache = {}
 CACHE_TTL = 300  # 5분
 
-from collections import Counter
+# 파이프라인이 토픽/기사를 바꾸면 TTL을 기다리지 않고 비움 (services/event_bus.py)
+event_bus.subscribe(
+    (TOPICS_CREATED, TOPICS_UPDATED, ARTICLES_UPDATED, RESYNC),
+    lambda event: topic_cache.clear()
+)
+
 
 @router.get("", response_model=List[TopicListResponse])
-def get_all_topics(
+async def get_all_topics(
+    request: Request,
     sort_by: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     모든 토픽 목록 조회 (최적화됨 + 캐싱)
-    - sort_by=trending: 최근 24시간 내 기사 수가 많은 순
+    - sort_by=trending: 최근 TRENDING_WINDOW_HOURS(기본 24시간) 기사 수를 시간 감쇠해 많은 순
+    - 파이프라인이 만든 정적 스냅샷(services/snapshots.py)이 있으면 파일로 응답
     """
+    snapshot = snapshot_store.response(request, topic_list_key(sort_by))
+    if snapshot is not None:
+        return snapshot
+
     # 캐시 키 생성 및 확인
     cache_key = f"topics_list_{sort_by}"
     if cache_key in topic_cache:
         data, expire_time = topic_cache[cache_key]
         if time.time() < expire_time:
+            record_cache("topics_list", hit=True)
             return data
+    record_cache("topics_list", hit=False)
+
+    response = await build_topic_list(sort_by, db)
+    # 캐시에 저장
+    topic_cache[cache_key] = (response, time.time() + CACHE_TTL)
+    return response
+
 
+async def build_topic_list(sort_by: Optional[str], db: AsyncSession) -> List[TopicListResponse]:
+    """토픽 목록 응답 생성 (캐시 없이 DB에서 - 스냅샷 생성에도 사용)"""
+    # 카테고리/썸네일/기사 수는 topic_stats 한 행에서 읽음 (services/topic_stats.py)
+    query = (
+        select(Topic, TopicStats).outerjoin(TopicStats, TopicStats.topic_id == Topic.id)
+        .options(defer(Topic.body))
+    )
     if sort_by == "trending":
-        cutoff_time = datetime.datetime.utcnow() - datetime.timedelta(hours=24)
-        topics = db.query(Topic).options(
-            joinedload(Topic.articles)
-        ).filter(Topic.created_at >= cutoff_time).all()
-        
-        # 기사가 있는 토픽만 필터링하고 기사 수로 정렬
-        topics = [t for t in topics if t.articles]
-        topics.sort(key=lambda x: len(x.articles), reverse=True)
-        topics = topics[:5]
+        # 집계 기간 안의 시간 버킷 기사 수(감쇠 적용)가 큰 순 - trending_score 인덱스 스캔 (services/trending.py)
+        query = query.where(
+            TopicStats.trending_bucket_at >= trending.window_start(), TopicStats.trending_score != None
+        ).order_by(TopicStats.trending_score.desc(), TopicStats.topic_id.desc()).limit(settings.trending_limit)
     else:
-        topics = db.query(Topic).options(
-            joinedload(Topic.articles)
-        ).order_by(Topic.id.desc()).limit(20).all()
+        query = query.order_by(Topic.id.desc()).limit(20)
+    rows = (await db.execute(query)).all()
+
+    articles_by_topic = {}
+    if rows:
+        article_rows = await db.execute(
+            select(Article.topic_id, Article.id, Article.title, Article.category, Article.reporter_name)
+            .where(Article.topic_id.in_([topic.id for topic, _ in rows]))
+            .order_by(Article.id)
+        )
+        for topic_id, article_id, title, category, reporter_name in article_rows:
+            articles_by_topic.setdefault(topic_id, []).append(
+                TopicArticleSimple(
+                    article_id=article_id,
+                    title=title,
+                    category=translate_category_to_korean(category),
+                    reporter_name=reporter_name
+                )
+            )
 
     response = []
-    for topic in topics:
-        articles = topic.articles
-        if not articles and sort_by != "trending":
-             # trending이 아닐 때도 기사 없는 토픽은 제외하고 싶다면 주석 해제
-             # continue
-             pass
-
-        thumb_url = next((art.image_url for art in articles if art.image_url), None)
-        
+    for topic, stats in rows:
+        article_list = articles_by_topic.get(topic.id, [])
+
         display_title = topic.ai_neutral_headline
-        if not display_title and articles:
-            display_title = articles[0].title
-
-        # 토픽 카테고리 결정 (가장 많이 나타나는 카테고리)
-        categories = [art.category for art in articles if art.category]
-        topic_category = None
-        if categories:
-            most_common_category = Counter(categories).most_common(1)[0][0]
-            topic_category = translate_category_to_korean(most_common_category)
-
-        article_list = [
-            TopicArticleSimple(
-                article_id=art.id,
-                title=art.title,
-                category=translate_category_to_korean(art.category),
-                reporter_name=art.reporter_name
-            )
-            for art in articles
-        ]
+        if not display_title and article_list:
+            display_title = article_list[0].title
 
         response.append(
             TopicListResponse(
                 topic_id=topic.id,
                 created_at=topic.created_at,
-                category=topic_category,
+                category=translate_category_to_korean(stats.category) if stats else None,
                 articles=article_list,
-                image_url=thumb_url,
+                image_url=stats.thumb_url if stats else None,
                 ai_neutral_headline=display_title,
                 ai_summary=topic.ai_summary
             )
         )
         
-    # 캐시에 저장
-    topic_cache[cache_key] = (response, time.time() + CACHE_TTL)
     return response
 
 
 @router.get("/{topic_id}", response_model=TopicViewResponse)
-def get_topic_view(topic_id: int, db: Session = Depends(get_db)):
-    """토픽 상세 조회 (좌/중/우 기사 분류 포함)"""
-    topic = db.query(Topic).filter(Topic.id == topic_id).first()
-    if not topic:
-        raise HTTPException(status_code=404, detail="토픽을 찾을 수 없습니다.")
-        
-    articles_in_topic = db.query(Article).options(
-        joinedload(Article.source)
-    ).filter(Article.topic_id == topic_id).all()
-    
-    # 토픽의 카테고리 결정 (가장 많이 나타나는 카테고리 사용)
-    from collections import Counter
-    categories = [art.category for art in articles_in_topic if art.category]
-    topic_category = None
-    if categories:
-        most_common_category = Counter(categories).most_common(1)[0][0]
-        topic_category = translate_category_to_korean(most_common_category)
-    
-    result = {
-        "articles_left": [],
-        "articles_center": [],
-        "articles_right": [],
-        "articles_unknown": []
-    }
-    
-    for article in articles_in_topic:
-        source_name = article.source.name if article.source else "알수없음"
-        bias_label = article.source.bias_label if article.source else "unknown"
-
-        response_article = ArticleInTopicResponse(
+async def get_topic_view(request: Request, topic_id: int, db: AsyncSession = Depends(get_async_db)):
+    """토픽 상세 조회 (좌/중/우 기사 분류 포함, 스냅샷이 있으면 파일로 응답)"""
+    snapshot = snapshot_store.response(request, f"topics/{topic_id}")
+    if snapshot is not None:
+        return snapshot
+
+    view = await build_topic_view(topic_id, db)
+    if view is None:
+        # 보관된 토픽은 보관 파일에서 읽음 (느린 경로)
+        record = await archive_store.load_topic(topic_id, db)
+        if record is None:
+            raise HTTPException(status_code=404, detail="토픽을 찾을 수 없습니다.")
+        view = build_archived_topic_view(record)
+    return view
+
+
+async def build_topic_view(topic_id: int, db: AsyncSession) -> Optional[TopicViewResponse]:
+    """토픽 상세 응답 생성 (없으면 None)"""
+    # 토픽/집계/대표 기사/언론사를 한 행으로 조회 (대표 기사는 topic_stats에 저장된 중립 우선 첫 기사)
+    row = (await db.execute(
+        select(Topic, TopicStats, Article, Source)
+        .outerjoin(TopicStats, TopicStats.topic_id == Topic.id)
+        .outerjoin(Article, Article.id == TopicStats.representative_article_id)
+        .outerjoin(Source, Source.id == Article.source_id)
+        .where(Topic.id == topic_id)
+        # 대표 기사 본문(압축)과 예전 토픽 본문 사본은 응답에 쓰지 않으므로 읽지 않음
+        .options(defer(Article.body), defer(Topic.body))
+    )).first()
+    if row is None:
+        return None
+    topic, stats, article, source = row
+
+    representative_article = None
+    if article is not None:
+        representative_article = ArticleInTopicResponse(
             article_id=article.id,
             original_title=article.title,
             original_url=article.url,
-            source_name=source_name,
+            source_name=source.name if source else "알수없음",
             reporter_name=article.reporter_name,
             ai_alternative_title=article.ai_alternative_title,
             ai_bias_score=article.ai_bias_score,
             ai_reporter_summary=article.ai_reporter_summary
         )
-        
-        if bias_label == 'left':
-            result["articles_left"].append(response_article)
-        elif bias_label == 'center':
-            result["articles_center"].append(response_article)
-        elif bias_label == 'right':
-            result["articles_right"].append(response_article)
-        else:
-            result["articles_unknown"].append(response_article)
-
-    # 단 하나의 대표 기사만 선택 (우선순위: 중립 -> 아무거나)
-    representative_article = None
-    if result["articles_center"]:
-        representative_article = result["articles_center"][0]
-    elif articles_in_topic:
-        # 중립이 없으면 전체 중 첫 번째
-        # articles_in_topic은 이미 DB 쿼리 결과이므로 재활용
-        # 하지만 스키마 변환이 필요하므로 result 리스트들 중 하나에서 가져오는게 빠름
-        all_converted = (result["articles_left"] + result["articles_right"] + 
-                         result["articles_unknown"])
-        if all_converted:
-            representative_article = all_converted[0]
+
+    # 토픽 본문은 저장하지 않고 요약 입력 기사로 만듦 (기사 본문과 중복 저장하지 않음)
+    input_articles = (await db.execute(
+        select(Article.title, Article.body)
+        .where(Article.topic_id == topic_id)
+        .order_by(Article.id.desc())
+        .limit(TOPIC_SUMMARY_ARTICLE_LIMIT)
+    )).all()
 
     return TopicViewResponse(
         topic_id=topic_id,
         ai_neutral_headline=topic.ai_neutral_headline,
         ai_core_summary=topic.ai_summary,
-        category=topic_category,
-        topic_body=topic.body,
+        category=translate_category_to_korean(stats.category) if stats else None,
+        topic_body=build_topic_body(input_articles) if input_articles else None,
         article=representative_article  # 단일 기사 객체 반환
     )
+
+
+def build_archived_topic_view(record: dict) -> TopicViewResponse:
+    """보관된 토픽 묶음(services/archive.py)으로 토픽 상세 응답 생성"""
+    topic, stats = record["topic"], record.get("stats") or {}
+    articles = record.get("articles") or []
+
+    representative_article = None
+    article = next((a for a in articles if a["id"] == stats.get("representative_article_id")), None)
+    if article is not None:
+        representative_article = ArticleInTopicResponse(
+            article_id=article["id"],
+            original_title=article["title"],
+            original_url=article["url"],
+            source_name=article.get("source_name") or "알수없음",
+            reporter_name=article.get("reporter_name"),
+            ai_alternative_title=article.get("ai_alternative_title"),
+            ai_bias_score=article.get("ai_bias_score"),
+            ai_reporter_summary=article.get("ai_reporter_summary")
+        )
+
+    # 상세 경로와 같은 요약 입력 기사 (최근 기사 순)
+    input_articles = [
+        SimpleNamespace(title=a.get("title"), body=a.get("body"))
+        for a in articles[::-1][:TOPIC_SUMMARY_ARTICLE_LIMIT]
+    ]
+    return TopicViewResponse(
+        topic_id=topic["id"],
+        ai_neutral_headline=topic.get("ai_neutral_headline"),
+        ai_core_summary=topic.get("ai_summary"),
+        category=translate_category_to_korean(stats.get("category")),
+        topic_body=build_topic_body(input_articles) if input_articles else None,
+        article=representative_article
+    )
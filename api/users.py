@@ -10,6 +10,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.database import get_db, User
 from api.schemas import UserCreate, UserResponse
+from services.auth_cache import token_user_cache
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -30,6 +31,8 @@ def create_or_update_user(user: UserCreate, db: Session = Depends(get_db)):
         
     db.commit()
     db.refresh(db_user)
+    # 캐시된 로그인 사용자 정보(키워드/편향 필터)가 이전 값으로 남지 않도록 삭제
+    token_user_cache.invalidate_user(db_user.id)
     return db_user
 
 
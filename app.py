@@ -2,22 +2,28 @@
 Harmoni AI News API - Main Application
 리팩토링된 모듈화 구조
 """
+import math
 import os
 import sys
+from typing import Optional
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Response
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
-import requests
 
 # Core imports
 from core.config import settings
-from core.database import create_db_tables
+from core.compression import dictionaries
+from core.database import async_engine, create_db_tables
+from core.http_clients import http_clients
+from core.metrics import PrometheusMiddleware, render_metrics
+from core.profiling import ProfilingMiddleware
+from core.query_budget import QueryBudgetMiddleware
 
 # API routers
 from api.topics import router as topics_router
@@ -25,14 +31,17 @@ from api.articles import router as articles_router
 from api.debate import router as debate_router
 from api.shorts import router as shorts_router
 from api.users import router as users_router
+from api.admin import router as admin_router
+from api.feed import router as feed_router
+from api.common import check_cron_secret
 import auth
+from services.naver_search import naver_search, NaverSearchError, SearchQuotaExceeded
+from services.keyword_watch import keyword_watch
+from services.event_bus import event_bus
+from services.topic_stats import backfill_topic_stats
 
-# Background task imports
-from crawler import run_crawl_and_save_to_db
-from cluster import run_topic_clustering
-from services.content_service import generate_ai_content, generate_article_details, generate_shorts
-from classify_articles import classify_articles_by_topic
-from services.debate_service import generate_debates_for_all_topics
+# Pipeline runner
+from pipeline import run_pipeline, STAGE_NAMES
 
 
 @asynccontextmanager
@@ -41,7 +50,12 @@ async def lifespan(app: FastAPI):
     # Startup
     print(">>> 서버 시작: DB 테이블 확인 중...")
     create_db_tables(checkfirst=True)
+    backfill_topic_stats()
+    # 요청 처리 중(이벤트 루프)에 압축 사전을 읽지 않도록 미리 로드
+    dictionaries.load()
     print(">>> DB 확인 완료.")
+    http_clients.start()
+    event_bus.start()
     
     if not settings.naver_client_id or not settings.naver_client_secret:
         print("!!! 경고: NAVER API 키가 설정되지 않았습니다.")
@@ -49,7 +63,11 @@ async def lifespan(app: FastAPI):
         print("!!! 경고: Perplexity API 키가 설정되지 않았습니다.")
     
     yield
-    # Shutdown (if needed)
+    # Shutdown
+    event_bus.stop()
+    await keyword_watch.close()
+    await http_clients.aclose()
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -68,6 +86,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# --- 요청/DB 계측 (/metrics), 쿼리 예산 검사 (QUERY_DEBUG), 요청 단위 프로파일링 (X-Profile) ---
+app.add_middleware(QueryBudgetMiddleware)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(PrometheusMiddleware)
+
 # --- 라우터 등록 ---
 app.include_router(auth.router)
 app.include_router(topics_router)
@@ -75,90 +98,70 @@ app.include_router(articles_router)
 app.include_router(debate_router)
 app.include_router(shorts_router)
 app.include_router(users_router)
+app.include_router(admin_router)
+app.include_router(feed_router)
 
 # 기존 /topic/{id} 엔드포인트 호환성을 위한 별칭
 from api.topics import get_topic_view
-from core.database import get_db
-from sqlalchemy.orm import Session
+from core.database import get_async_db
+from sqlalchemy.ext.asyncio import AsyncSession
 
 @app.get("/topic/{topic_id}")
-def get_topic_alias(topic_id: int, db: Session = Depends(get_db)):
+async def get_topic_alias(request: Request, topic_id: int, db: AsyncSession = Depends(get_async_db)):
     """기존 /topic/{id} 엔드포인트 호환성"""
-    return get_topic_view(topic_id, db)
+    return await get_topic_view(request, topic_id, db)
 
 
 # --- 자동화 파이프라인 ---
-def run_all_background_tasks():
+def run_all_background_tasks(profile_stage: Optional[str] = None):
     """전체 파이프라인 실행"""
-    print("🚀 [Cron] 전체 파이프라인 시작")
-    try:
-        print(">> 1. 크롤링 실행")
-        run_crawl_and_save_to_db()
-        
-        print(">> 2. 뉴스 군집화 실행")
-        run_topic_clustering()
-        
-        print(">> 3. 토픽 헤드라인/요약 생성")
-        generate_ai_content()
-        
-        print(">> 4. 기사 관점(좌/중/우) 분류")
-        classify_articles_by_topic()
-        
-        print(">> 5. 기사 상세(편향점수/대체제목/감정) 분석")
-        generate_article_details()
-        
-        print(">> 6. 숏폼 대본 생성")
-        generate_shorts()
-        
-        print(">> 7. AI 토론 생성")
-        generate_debates_for_all_topics()
-        
-        print("✅ [Cron] 전체 파이프라인 성공적으로 완료")
-    except Exception as e:
-        print(f"❌ [Cron] 파이프라인 실행 중 오류 발생: {e}")
+    run_pipeline(profile_stage=profile_stage)
 
 
 def verify_cron_secret(secret: str):
     """Cron 시크릿 키 검증"""
-    if not settings.cron_secret_key:
-        raise HTTPException(status_code=500, detail="CRON_SECRET_KEY가 서버에 설정되지 않았습니다.")
-    if secret != settings.cron_secret_key:
-        raise HTTPException(status_code=403, detail="잘못된 접근입니다 (Invalid Secret).")
-    return True
+    return check_cron_secret(secret)
 
 
 @app.post("/run-tasks/{secret}")
 def trigger_cron_jobs(
     background_tasks: BackgroundTasks,
+    profile_stage: Optional[str] = None,
     is_verified: bool = Depends(verify_cron_secret)
 ):
-    """자동화 파이프라인 실행 트리거"""
+    """
+    자동화 파이프라인 실행 트리거
+
+    - profile_stage: 지정한 단계만 cProfile로 측정해 profiles/에 저장
+    """
+    if profile_stage and profile_stage not in STAGE_NAMES:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 단계입니다: {profile_stage}")
     if is_verified:
-        background_tasks.add_task(run_all_background_tasks)
+        background_tasks.add_task(run_all_background_tasks, profile_stage)
         return Response(status_code=202, content="백그라운드 작업이 시작되었습니다.")
 
 
 @app.get("/search")
-def search_naver_news(query: str):
-    """네이버 뉴스 검색"""
+async def search_naver_news(query: str):
+    """네이버 뉴스 검색 (TTL 캐시 + 동일 요청 병합 + 호출 한도, services/naver_search.py)"""
     if not query:
         raise HTTPException(status_code=400, detail="'query' 파라미터가 필요합니다.")
     if not settings.naver_client_id or not settings.naver_client_secret:
         raise HTTPException(status_code=503, detail="서버에 Naver API 키가 설정되지 않았습니다.")
 
-    url = "https://openapi.naver.com/v1/search/news.json"
-    headers = {
-        "X-Naver-Client-Id": settings.naver_client_id,
-        "X-Naver-Client-Secret": settings.naver_client_secret
-    }
-    params = {"query": query, "display": 10, "sort": "sim"}
-
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=5)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        raise HTTPException(status_code=502, detail=f"Naver API 오류: {e}")
+        return await naver_search.search(query)
+    except SearchQuotaExceeded as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
+    except NaverSearchError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 메트릭 (요청 지연시간, SQL 통계, 커넥션 풀, 캐시 적중률)"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
 
 
 @app.get("/favicon.ico", include_in_schema=False)
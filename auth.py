@@ -4,18 +4,22 @@ from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from pydantic import BaseModel
-import httpx
 
-from core.database import get_db, User
+from core.database import get_async_db, User
+from core.http_clients import http_clients
+from services.auth_cache import CurrentUser, token_user_cache
+from services.password_hashing import PasswordHashingBusy, hash_password, needs_rehash, verify_password
 
 # --- [설정] 환경변수에서 가져오기 ---
 SECRET_KEY = os.environ.get("SECRET_KEY", "dev_secret_key_1234") # 배포 시 꼭 변경!
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 # 1일
+# 실시간 알림 스트림 전용 토큰 (URL에 넣는 짧은 토큰 - 일반 API 인증에는 쓸 수 없음)
+STREAM_TOKEN_SCOPE = "feed_stream"
 
 GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID")
 GOOGLE_CLIENT_SECRET = os.environ.get("GOOGLE_CLIENT_SECRET")
@@ -26,7 +30,6 @@ NAVER_CLIENT_SECRET = os.environ.get("NAVER_CLIENT_SECRET")
 NAVER_REDIRECT_URI = "https://sdhs-webapp-2025.onrender.com//auth/naver/callback" # 배포 시 실제 도메인으로 변경
 
 # --- [준비] ---
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -43,11 +46,8 @@ class UserCreate(BaseModel):
     username: str
 
 # --- [유틸리티 함수] ---
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password):
-    return pwd_context.hash(password)
+def hashing_busy_exception(e: PasswordHashingBusy) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
 
 def create_access_token(data: dict):
     to_encode = data.copy()
@@ -56,14 +56,31 @@ def create_access_token(data: dict):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def create_stream_token(email: str, expires_seconds: int) -> str:
+    expire = datetime.utcnow() + timedelta(seconds=expires_seconds)
+    return jwt.encode({"sub": email, "scope": STREAM_TOKEN_SCOPE, "exp": expire}, SECRET_KEY, algorithm=ALGORITHM)
+
+async def get_or_create_oauth_user(db: AsyncSession, email: str, name: str, provider: str) -> User:
+    """소셜 로그인 사용자 조회, 없으면 생성 (이벤트 루프를 막지 않도록 async 세션 사용)"""
+    user = await db.scalar(select(User).where(User.email == email))
+    if not user:
+        user = User(email=email, username=name, provider=provider)
+        db.add(user)
+        await db.commit()  # expire_on_commit=False라 커밋 후 속성을 다시 조회하지 않음
+    return user
+
 # --- [API 1] 자체 회원가입 ---
 @router.post("/signup", response_model=Token)
-def signup(user: UserCreate, db: Session = Depends(get_db)):
-    db_user = db.query(User).filter(User.email == user.email).first()
+async def signup(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    db_user = await db.scalar(select(User).where(User.email == user.email))
     if db_user:
         raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다.")
     
-    hashed_pw = get_password_hash(user.password)
+    # bcrypt는 전용 스레드 풀에서 실행 (이벤트 루프를 막지 않음)
+    try:
+        hashed_pw = await hash_password(user.password)
+    except PasswordHashingBusy as e:
+        raise hashing_busy_exception(e)
     new_user = User(
         email=user.email,
         hashed_password=hashed_pw,
@@ -71,8 +88,7 @@ def signup(user: UserCreate, db: Session = Depends(get_db)):
         provider="local"
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
     
     # 토큰 발급
     access_token = create_access_token(data={"sub": new_user.email, "name": new_user.username})
@@ -80,11 +96,19 @@ def signup(user: UserCreate, db: Session = Depends(get_db)):
 
 # --- [API 2] 자체 로그인 (Form 데이터) ---
 @router.post("/token", response_model=Token)
-def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
     # OAuth2PasswordRequestForm은 username 필드에 이메일을 받음
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
-        raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 잘못되었습니다.")
+    user = await db.scalar(select(User).where(User.email == form_data.username))
+    try:
+        valid = user is not None and await verify_password(form_data.password, user.hashed_password)
+        if not valid:
+            raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 잘못되었습니다.")
+        # BCRYPT_ROUNDS를 바꾼 경우 로그인 성공 시 새 work factor로 다시 저장
+        if needs_rehash(user.hashed_password):
+            user.hashed_password = await hash_password(form_data.password)
+            await db.commit()
+    except PasswordHashingBusy as e:
+        raise hashing_busy_exception(e)
     
     access_token = create_access_token(data={"sub": user.email, "name": user.username})
     return {"access_token": access_token, "token_type": "bearer", "username": user.username, "email": user.email}
@@ -97,37 +121,32 @@ def login_google():
     }
 
 @router.get("/google/callback")
-async def auth_google_callback(code: str, db: Session = Depends(get_db)):
-    async with httpx.AsyncClient() as client:
-        # 1. 토큰 교환
-        token_res = await client.post("https://oauth2.googleapis.com/token", data={
-            "client_id": GOOGLE_CLIENT_ID,
-            "client_secret": GOOGLE_CLIENT_SECRET,
-            "code": code,
-            "grant_type": "authorization_code",
-            "redirect_uri": GOOGLE_REDIRECT_URI,
-        })
-        token_data = token_res.json()
-        access_token = token_data.get("access_token")
-        
-        # 2. 사용자 정보 조회
-        user_info_res = await client.get("https://www.googleapis.com/oauth2/v1/userinfo", headers={"Authorization": f"Bearer {access_token}"})
-        user_info = user_info_res.json()
-        
-        email = user_info.get("email")
-        name = user_info.get("name")
+async def auth_google_callback(code: str, db: AsyncSession = Depends(get_async_db)):
+    client = http_clients.get_async("google_oauth")  # 공유 커넥션 풀 (core/http_clients.py)
+    # 1. 토큰 교환
+    token_res = await client.post("https://oauth2.googleapis.com/token", data={
+        "client_id": GOOGLE_CLIENT_ID,
+        "client_secret": GOOGLE_CLIENT_SECRET,
+        "code": code,
+        "grant_type": "authorization_code",
+        "redirect_uri": GOOGLE_REDIRECT_URI,
+    })
+    token_data = token_res.json()
+    access_token = token_data.get("access_token")
+    
+    # 2. 사용자 정보 조회
+    user_info_res = await client.get("https://www.googleapis.com/oauth2/v1/userinfo", headers={"Authorization": f"Bearer {access_token}"})
+    user_info = user_info_res.json()
+    
+    email = user_info.get("email")
+    name = user_info.get("name")
+    
+    # 3. DB 저장 또는 로그인 처리
+    user = await get_or_create_oauth_user(db, email, name, "google")
         
-        # 3. DB 저장 또는 로그인 처리
-        user = db.query(User).filter(User.email == email).first()
-        if not user:
-            user = User(email=email, username=name, provider="google")
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-            
-        # 4. 자체 JWT 토큰 발급
-        jwt_token = create_access_token(data={"sub": user.email, "name": user.username})
-        return {"access_token": jwt_token, "token_type": "bearer", "username": user.username, "email": user.email}
+    # 4. 자체 JWT 토큰 발급
+    jwt_token = create_access_token(data={"sub": user.email, "name": user.username})
+    return {"access_token": jwt_token, "token_type": "bearer", "username": user.username, "email": user.email}
 
 # --- [API 4] 네이버 로그인 ---
 @router.get("/naver/login")
@@ -137,48 +156,70 @@ def login_naver():
     }
 
 @router.get("/naver/callback")
-async def auth_naver_callback(code: str, state: str, db: Session = Depends(get_db)):
-    async with httpx.AsyncClient() as client:
-        # 1. 토큰 교환
-        token_res = await client.get(f"https://nid.naver.com/oauth2.0/token?grant_type=authorization_code&client_id={NAVER_CLIENT_ID}&client_secret={NAVER_CLIENT_SECRET}&code={code}&state={state}")
-        token_data = token_res.json()
-        access_token = token_data.get("access_token")
-        
-        # 2. 사용자 정보 조회
-        user_info_res = await client.get("https://openapi.naver.com/v1/nid/me", headers={"Authorization": f"Bearer {access_token}"})
-        user_info = user_info_res.json().get("response")
-        
-        email = user_info.get("email")
-        name = user_info.get("name")
+async def auth_naver_callback(code: str, state: str, db: AsyncSession = Depends(get_async_db)):
+    client = http_clients.get_async("naver_oauth")  # 공유 커넥션 풀 (core/http_clients.py)
+    # 1. 토큰 교환
+    token_res = await client.get(f"https://nid.naver.com/oauth2.0/token?grant_type=authorization_code&client_id={NAVER_CLIENT_ID}&client_secret={NAVER_CLIENT_SECRET}&code={code}&state={state}")
+    token_data = token_res.json()
+    access_token = token_data.get("access_token")
+    
+    # 2. 사용자 정보 조회
+    user_info_res = await client.get("https://openapi.naver.com/v1/nid/me", headers={"Authorization": f"Bearer {access_token}"})
+    user_info = user_info_res.json().get("response")
+    
+    email = user_info.get("email")
+    name = user_info.get("name")
+    
+    # 3. DB 처리
+    user = await get_or_create_oauth_user(db, email, name, "naver")
         
-        # 3. DB 처리
-        user = db.query(User).filter(User.email == email).first()
-        if not user:
-            user = User(email=email, username=name, provider="naver")
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-            
-        # 4. 토큰 발급
-        jwt_token = create_access_token(data={"sub": user.email, "name": user.username})
-        return {"access_token": jwt_token, "token_type": "bearer", "username": user.username, "email": user.email}
+    # 4. 토큰 발급
+    jwt_token = create_access_token(data={"sub": user.email, "name": user.username})
+    return {"access_token": jwt_token, "token_type": "bearer", "username": user.username, "email": user.email}
 
 # --- [유틸리티] 현재 로그인한 사용자 가져오기 ---
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> CurrentUser:
+    """
+    토큰의 사용자 정보 (services/auth_cache.py에 짧게 캐시)
+
+    캐시에 있으면 JWT 디코딩/DB 조회 없이 반환합니다.
+    """
+    cached = token_user_cache.get(token)
+    if cached is not None:
+        return cached
+
+    payload = _decode_token(token, scope=None)
+    current_user = await _load_token_user(payload, db)
+    token_user_cache.set(token, current_user, token_expires_at=payload.get("exp"))
+    return current_user
+
+
+async def get_stream_token_user(token: str, db: AsyncSession) -> CurrentUser:
+    """스트림 전용 토큰(create_stream_token)의 사용자 (일반 액세스 토큰은 거절, 캐시하지 않음)"""
+    return await _load_token_user(_decode_token(token, scope=STREAM_TOKEN_SCOPE), db)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="자격 증명이 유효하지 않습니다.",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _decode_token(token: str, scope: Optional[str]) -> dict:
+    """JWT 검증 (scope가 다른 토큰은 거절 - 스트림 토큰을 일반 API에 쓸 수 없음)"""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
     except JWTError:
-        raise credentials_exception
-        
-    user = db.query(User).filter(User.email == email).first()
+        raise _credentials_exception()
+    if payload.get("sub") is None or payload.get("scope") != scope:
+        raise _credentials_exception()
+    return payload
+
+
+async def _load_token_user(payload: dict, db: AsyncSession) -> CurrentUser:
+    user = await db.scalar(select(User).where(User.email == payload["sub"]))
     if user is None:
-        raise credentials_exception
-    return user
\ No newline at end of file
+        raise _credentials_exception()
+    return CurrentUser.from_user(user)
@@ -0,0 +1,3 @@
+"""
+Benchmarks - LLM 라우트 A/B, corpus 적재, API 부하, 파이프라인 단계 측정
+"""
@@ -0,0 +1,202 @@
+"""
+API Load Benchmark - 주요 읽기 API의 동시 요청 처리량/지연시간 측정
+
+benchmarks/seed_corpus.py로 적재한 DB를 대상으로 uvicorn을 별도 프로세스로 띄우고
+(또는 --base-url로 이미 실행 중인 서버를 지정) 엔드포인트별로 동시 요청을 보냅니다.
+토픽/토론 id는 DB 전체에서 무작위로 골라 캐시에 유리한 id만 반복 조회하지 않도록 합니다.
+
+사용법:
+    python benchmarks/api_load.py --concurrency 16 --requests 500
+    python benchmarks/api_load.py --database-url postgresql://user:pw@localhost/news_bench --workers 4
+"""
+import argparse
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import REPO_DIR, configure_database, database_label, latency_summary, write_results
+
+# (시나리오 이름, 경로 생성 함수) - ids: {"topic": [...], "debate": [...]}
+SCENARIOS: Dict[str, Callable[[Dict[str, List[int]], random.Random], str]] = {
+    "GET /topics": lambda ids, rng: "/topics",
+    "GET /topics?sort_by=trending": lambda ids, rng: "/topics?sort_by=trending",
+    "GET /topics/{id}": lambda ids, rng: f"/topics/{rng.choice(ids['topic'])}",
+    "GET /articles": lambda ids, rng: "/articles?limit=100",
+    "GET /articles?category": lambda ids, rng: f"/articles?category={rng.choice(['politics', 'economy', 'society'])}",
+    "GET /debate/{id}": lambda ids, rng: f"/debate/{rng.choice(ids['debate'])}",
+}
+
+
+def sample_ids(sample_size: int, seed: int) -> Dict[str, List[int]]:
+    """DB 전체 범위에서 조회할 토픽/토론 id 표본 추출"""
+    from sqlalchemy import func
+    from core.database import SessionLocal, Topic, Debate
+
+    rng = random.Random(seed)
+    db = SessionLocal()
+    try:
+        ids = {}
+        for name, column in (("topic", Topic.id), ("debate", Debate.topic_id)):
+            low, high = db.query(func.min(column), func.max(column)).one()
+            if low is None:
+                raise RuntimeError("적재된 데이터가 없습니다. 먼저 benchmarks/seed_corpus.py를 실행하세요.")
+            candidates = {rng.randint(low, high) for _ in range(sample_size * 2)}
+            found = [row[0] for row in db.query(column).filter(column.in_(candidates)).all()]
+            ids[name] = found[:sample_size] or [low]
+        return ids
+    finally:
+        db.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int) -> Tuple[subprocess.Popen, str]:
+    """현재 환경변수(DATABASE_URL 등)로 uvicorn 실행 후 응답할 때까지 대기"""
+    port = _free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning", "--no-access-log",
+        ],
+        cwd=REPO_DIR
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"서버 실행 실패 (exit {process.returncode})")
+        try:
+            requests.get(base_url + "/", timeout=1)
+            return process, base_url
+        except requests.RequestException:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("서버가 60초 안에 응답하지 않습니다.")
+
+
+def run_scenario(
+    base_url: str,
+    make_path: Callable,
+    ids: Dict[str, List[int]],
+    total: int,
+    concurrency: int,
+    warmup: int,
+    seed: int
+) -> Dict:
+    """total건을 concurrency개 스레드로 나눠 요청"""
+    local = threading.local()
+    rng_lock = threading.Lock()
+    rng = random.Random(seed)
+
+    def request_once(_) -> Tuple[float, int]:
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        with rng_lock:
+            path = make_path(ids, rng)
+        started = time.perf_counter()
+        try:
+            status = session.get(base_url + path, timeout=30).status_code
+        except requests.RequestException:
+            status = 0
+        return (time.perf_counter() - started) * 1000, status
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(request_once, range(warmup)))
+        started = time.perf_counter()
+        samples = list(pool.map(request_once, range(total)))
+        elapsed = time.perf_counter() - started
+
+    statuses: Dict[str, int] = {}
+    for _, status in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    errors = sum(n for status, n in statuses.items() if not status.startswith("2"))
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 1) if elapsed else 0.0,
+        "errors": errors,
+        "statuses": statuses,
+        **latency_summary([latency for latency, _ in samples]),
+    }
+
+
+def run_api_load(
+    base_url: Optional[str] = None,
+    scenarios: Optional[List[str]] = None,
+    total: int = 500,
+    concurrency: int = 16,
+    warmup: int = 20,
+    workers: int = 1,
+    seed: int = 0
+) -> List[Dict]:
+    ids = sample_ids(sample_size=500, seed=seed)
+    process = None
+    if base_url is None:
+        process, base_url = start_server(workers)
+    try:
+        results = []
+        for name in scenarios or list(SCENARIOS):
+            result = run_scenario(base_url, SCENARIOS[name], ids, total, concurrency, warmup, seed)
+            results.append({"scenario": name, **result})
+            print(
+                f"  . {name:<30} {result['throughput_rps']:>8.1f} req/s  "
+                f"p50 {result['latency_p50_ms']:.1f}ms  p95 {result['latency_p95_ms']:.1f}ms  "
+                f"errors {result['errors']}"
+            )
+        return results
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 동시 요청 부하 벤치마크")
+    parser.add_argument("--database-url", default=None, help="대상 DB (기본: benchmarks/results/bench.db)")
+    parser.add_argument("--base-url", default=None, help="이미 실행 중인 서버 (없으면 uvicorn을 직접 실행)")
+    parser.add_argument("--workers", type=int, default=1, help="직접 실행할 uvicorn worker 수")
+    parser.add_argument("--scenarios", default=None, help=f"쉼표 구분 (기본: 전체) {list(SCENARIOS)}")
+    parser.add_argument("--requests", type=int, default=500, help="시나리오당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--warmup", type=int, default=20, help="측정 전 워밍업 요청 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    args = parser.parse_args()
+
+    database_url = configure_database(args.database_url)
+    scenarios = [s.strip() for s in args.scenarios.split(",")] if args.scenarios else None
+    for name in scenarios or []:
+        if name not in SCENARIOS:
+            parser.error(f"알 수 없는 시나리오입니다: {name}")
+
+    print(f">>> API 부하 벤치마크: {database_label(database_url)}, 동시 {args.concurrency}, 시나리오당 {args.requests}건")
+    results = run_api_load(
+        args.base_url, scenarios, args.requests, args.concurrency, args.warmup, args.workers, args.seed
+    )
+    output = write_results("api_load", {
+        "database": database_label(database_url),
+        "workers": args.workers,
+        "results": results,
+    }, args.output)
+    print(f"\n>>> 결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark 공통 유틸 - 백분위수 계산, 벤치마크용 DB 설정, 결과 JSON 저장
+"""
+import datetime
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+DEFAULT_OUTPUT_DIR = os.path.join(BENCHMARK_DIR, "results")
+# 벤치마크 기본 DB (운영 데이터 news.db와 분리)
+DEFAULT_DATABASE_URL = f"sqlite:///{os.path.join(DEFAULT_OUTPUT_DIR, 'bench.db')}"
+
+sys.path.insert(0, REPO_DIR)
+
+
+def percentile(values: List[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def latency_summary(latencies_ms: List[float]) -> Dict[str, float]:
+    return {
+        "latency_p50_ms": round(percentile(latencies_ms, 50), 2),
+        "latency_p95_ms": round(percentile(latencies_ms, 95), 2),
+        "latency_p99_ms": round(percentile(latencies_ms, 99), 2),
+        "latency_max_ms": round(max(latencies_ms), 2) if latencies_ms else 0.0,
+    }
+
+
+def configure_database(database_url: Optional[str]) -> str:
+    """
+    벤치마크 대상 DB 지정 - core.database import 전에 호출해야 합니다.
+
+    core.database는 import 시점의 DATABASE_URL/USE_SQLITE로 엔진을 만들기 때문입니다.
+    """
+    database_url = database_url or DEFAULT_DATABASE_URL
+    if database_url.startswith("sqlite:///"):
+        os.makedirs(os.path.dirname(os.path.abspath(database_url[len("sqlite:///"):])), exist_ok=True)
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.pop("USE_SQLITE", None)
+    return database_url
+
+
+def database_label(database_url: str) -> str:
+    """결과에 남길 DB URL (비밀번호 가림)"""
+    from sqlalchemy.engine import make_url
+    return make_url(database_url).render_as_string(hide_password=True)
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+            capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def write_results(name: str, payload: Dict, output: Optional[str] = None) -> str:
+    """결과 JSON 저장 (기본: benchmarks/results/<name>_<시각>.json) 후 경로 반환"""
+    if output is None:
+        os.makedirs(DEFAULT_OUTPUT_DIR, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = os.path.join(DEFAULT_OUTPUT_DIR, f"{name}_{stamp}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "benchmark": name,
+            "created_at": datetime.datetime.now().isoformat(),
+            "git_revision": git_revision(),
+            **payload,
+        }, f, ensure_ascii=False, indent=2)
+    return output
@@ -0,0 +1,152 @@
+"""
+Pipeline Timing Benchmark - 파이프라인 단계별 소요 시간 측정 (스텁 서버 사용)
+
+stubs/server.py를 백그라운드로 띄워 네이버 페이지와 LLM을 대체하고, 비어 있는 벤치마크 DB에서
+크롤링 → 군집화 → AI 보강 단계를 순서대로 실행하며 단계별 시간/LLM 호출 수/쿼리 수를 기록합니다.
+
+사용법:
+    python benchmarks/pipeline_timing.py
+    python benchmarks/pipeline_timing.py --per-press 5 --llm-latency-ms 800 --llm-jitter-ms 300
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import DEFAULT_OUTPUT_DIR, configure_database, database_label, latency_summary, write_results
+from stubs.server import StubConfig, start_stub_server, stub_environment
+
+DEFAULT_PIPELINE_DATABASE_URL = f"sqlite:///{os.path.join(DEFAULT_OUTPUT_DIR, 'pipeline_bench.db')}"
+
+
+def _row_counts() -> Dict[str, int]:
+    from sqlalchemy import func
+    from core.database import SessionLocal, Article, Topic, Short, Debate
+
+    db = SessionLocal()
+    try:
+        return {
+            "articles": db.query(func.count(Article.id)).scalar(),
+            "topics": db.query(func.count(Topic.id)).scalar(),
+            "summarized_topics": db.query(func.count(Topic.id)).filter(Topic.ai_summary.isnot(None)).scalar(),
+            "shorts": db.query(func.count(Short.id)).scalar(),
+            "debates": db.query(func.count(Debate.id)).scalar(),
+        }
+    finally:
+        db.close()
+
+
+def time_crawl_parse(repeat: int) -> Dict:
+    """랭킹 페이지/기사 페이지 수집+파싱 시간 (DB 저장 제외)"""
+    import crawler
+
+    ranking_ms, article_ms = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        items = crawler.get_ranking_news_items()
+        ranking_ms.append((time.perf_counter() - started) * 1000)
+        for item in items:
+            started = time.perf_counter()
+            crawler.get_article_content(item["webUrl"])
+            article_ms.append((time.perf_counter() - started) * 1000)
+    return {
+        "ranking_page": latency_summary(ranking_ms),
+        "article_page": latency_summary(article_ms),
+        "articles_parsed": len(article_ms),
+    }
+
+
+def time_stages(server, stages: List[str]) -> List[Dict]:
+    """단계별 실행 시간, 스텁 LLM 호출 수, SQL 실행 수"""
+    from core.query_budget import QueryCounter
+    from pipeline import run_stage
+
+    results = []
+    for name in stages:
+        completions_before = server.stats.get("completion", 0)
+        started = time.perf_counter()
+        error = None
+        with QueryCounter(f"stage {name}") as counter:
+            try:
+                run_stage(name)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+        seconds = time.perf_counter() - started
+        results.append({
+            "stage": name,
+            "seconds": round(seconds, 3),
+            "llm_calls": server.stats.get("completion", 0) - completions_before,
+            "queries": counter.count,
+            "error": error,
+            "rows_after": _row_counts(),
+        })
+        print(f"  . {name:<16} {seconds:>8.2f}s  LLM {results[-1]['llm_calls']}회  쿼리 {counter.count}회")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파이프라인 단계별 시간 측정 (스텁 서버)")
+    parser.add_argument("--database-url", default=DEFAULT_PIPELINE_DATABASE_URL,
+                        help="측정용 DB (매 실행마다 초기화됨)")
+    parser.add_argument("--stages", default=None, help="실행할 단계 (쉼표 구분, 기본: 전체)")
+    parser.add_argument("--per-press", type=int, default=2, help="랭킹 페이지 언론사별 기사 수")
+    parser.add_argument("--parse-repeat", type=int, default=3, help="크롤링 파싱 측정 반복 횟수")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="스텁 LLM 응답 지연")
+    parser.add_argument("--llm-jitter-ms", type=float, default=0.0, help="스텁 LLM 응답 지연 편차(±)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="스텁 LLM 오류 주입 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    args = parser.parse_args()
+
+    config = StubConfig(
+        seed=args.seed,
+        per_press=args.per_press,
+        llm_latency_ms=args.llm_latency_ms,
+        llm_jitter_ms=args.llm_jitter_ms,
+        error_rate=args.error_rate,
+    )
+    server = start_stub_server(config)
+    # 설정(core.config)은 import 시점에 환경변수를 읽으므로 앱 모듈 import 전에 지정
+    os.environ.update(stub_environment(server.base_url))
+    database_url = configure_database(args.database_url)
+
+    from core.database import Base, engine, create_db_tables
+    from pipeline import STAGE_NAMES
+    from services.llm_ledger import ledger
+
+    stages = [s.strip() for s in args.stages.split(",")] if args.stages else STAGE_NAMES
+    for name in stages:
+        if name not in STAGE_NAMES:
+            parser.error(f"알 수 없는 단계입니다: {name}")
+
+    Base.metadata.drop_all(bind=engine)
+    create_db_tables(checkfirst=True)
+
+    print(f">>> 파이프라인 벤치마크: {database_label(database_url)}, 스텁 {server.base_url}")
+    try:
+        crawl_parse = time_crawl_parse(args.parse_repeat)
+        stage_results = time_stages(server, stages)
+    finally:
+        ledger.flush()
+        server.shutdown()
+
+    output = write_results("pipeline_timing", {
+        "database": database_label(database_url),
+        "stub": {
+            "per_press": args.per_press,
+            "llm_latency_ms": args.llm_latency_ms,
+            "llm_jitter_ms": args.llm_jitter_ms,
+            "error_rate": args.error_rate,
+        },
+        "crawl_parse": crawl_parse,
+        "stages": stage_results,
+        "stub_stats": server.stats,
+    }, args.output)
+    print(f"\n>>> 결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
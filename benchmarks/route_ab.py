@@ -0,0 +1,186 @@
+"""
+LLM Route A/B Harness - 작업별 모델 라우트의 지연시간/출력 유효성 비교
+
+고정된 로컬 프롬프트 세트(route_prompts.json)를 설정된 라우트와 비교 모델로 각각 호출해
+작업/모델별 p50/p95 지연시간, 완료 토큰 p50/p99(로컬 토크나이저 기준 - max_tokens 상한 여유 확인용)와
+유효 응답 비율을 출력하고 JSON으로 저장합니다.
+
+사용법:
+    python benchmarks/route_ab.py
+    python benchmarks/route_ab.py --tasks classify,short --models sonar,sonar-pro --repeat 3
+"""
+import argparse
+import json
+import time
+from typing import Dict, List, Optional
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import BENCHMARK_DIR, percentile, write_results
+from core.config import settings, LLMRoute
+from services.ai_client import get_ai_client
+from services.llm_ledger import ledger
+from services.prompt_builder import count_tokens
+
+DEFAULT_PROMPTS = os.path.join(BENCHMARK_DIR, "route_prompts.json")
+# 벤치마크 호출은 실제 파이프라인 단계와 구분해 원장에 기록
+LEDGER_STAGE = "route_ab"
+
+
+def validate_output(content: str, case: Dict, structured: bool) -> Optional[str]:
+    """
+    응답 유효성 검사
+
+    Returns:
+        오류 사유 (유효하면 None)
+    """
+    client = get_ai_client()
+    try:
+        data = json.loads(content) if structured else client.extract_json(content)
+    except (ValueError, TypeError) as e:
+        return f"json: {e}"
+    if not isinstance(data, dict):
+        return "json: not an object"
+
+    for key in case.get("required_keys", []):
+        if data.get(key) in (None, "", [], {}):
+            return f"missing: {key}"
+    for key, allowed in case.get("allowed_values", {}).items():
+        if str(data.get(key)).lower() not in allowed:
+            return f"invalid {key}: {data.get(key)}"
+    return None
+
+
+def run_case(case: Dict, route: LLMRoute) -> Dict:
+    """프롬프트 1건을 지정한 라우트로 호출"""
+    client = get_ai_client()
+    schema = case.get("schema")
+    response_format = None
+    if schema:
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {"name": case["name"], "schema": schema}
+        }
+
+    started = time.perf_counter()
+    try:
+        content = client.chat(
+            case["system"], case["user"], response_format,
+            stage=LEDGER_STAGE, route=route
+        )
+    except Exception as e:
+        return {
+            "latency_ms": (time.perf_counter() - started) * 1000,
+            "completion_tokens": None,
+            "valid": False,
+            "error": type(e).__name__
+        }
+
+    latency_ms = (time.perf_counter() - started) * 1000
+    error = validate_output(content, case, structured=bool(schema))
+    return {
+        "latency_ms": latency_ms, "completion_tokens": count_tokens(content or ""),
+        "valid": error is None, "error": error
+    }
+
+
+def candidate_routes(task: str, models: List[str]) -> Dict[str, LLMRoute]:
+    """설정된 라우트 + 비교 모델 (max_tokens/temperature는 설정값 유지)"""
+    configured = settings.llm_route(task)
+    routes = {f"{configured.model} (configured)": configured}
+    for model in models:
+        if model != configured.model:
+            routes[model] = configured.model_copy(update={"model": model})
+    return routes
+
+
+def run_benchmark(prompts: Dict[str, List[Dict]], tasks: List[str], models: List[str], repeat: int) -> List[Dict]:
+    results = []
+    for task in tasks:
+        cases = prompts.get(task, [])
+        if not cases:
+            print(f"!!! [{task}] 프롬프트가 없어 건너뜀")
+            continue
+
+        for label, route in candidate_routes(task, models).items():
+            runs = []
+            failures: Dict[str, int] = {}
+            for case in cases:
+                for _ in range(repeat):
+                    run = run_case(case, route)
+                    runs.append(run)
+                    if run["error"]:
+                        failures[run["error"]] = failures.get(run["error"], 0) + 1
+
+            latencies = [r["latency_ms"] for r in runs]
+            completion_tokens = [r["completion_tokens"] for r in runs if r["completion_tokens"] is not None]
+            valid = sum(1 for r in runs if r["valid"])
+            results.append({
+                "task": task,
+                "route": label,
+                "model": route.model,
+                "max_tokens": route.max_tokens,
+                "temperature": route.temperature,
+                "calls": len(runs),
+                "valid": valid,
+                "valid_ratio": round(valid / len(runs), 3) if runs else 0.0,
+                "latency_p50_ms": round(percentile(latencies, 50), 1),
+                "latency_p95_ms": round(percentile(latencies, 95), 1),
+                "completion_tokens_p50": round(percentile(completion_tokens, 50)) if completion_tokens else None,
+                "completion_tokens_p99": round(percentile(completion_tokens, 99)) if completion_tokens else None,
+                "failures": failures,
+            })
+            print(f"  . [{task}] {label}: {valid}/{len(runs)} valid, p50 {results[-1]['latency_p50_ms']}ms")
+    return results
+
+
+def print_table(results: List[Dict]) -> None:
+    header = (
+        f"{'task':<16} {'route':<24} {'valid':>9} {'p50(ms)':>10} {'p95(ms)':>10} "
+        f"{'out p99':>8} {'max_tok':>8}"
+    )
+    print("\n" + header)
+    print("-" * len(header))
+    for row in results:
+        valid = f"{row['valid']}/{row['calls']}"
+        print(
+            f"{row['task']:<16} {row['route']:<24} {valid:>9} "
+            f"{row['latency_p50_ms']:>10.1f} {row['latency_p95_ms']:>10.1f} "
+            f"{row['completion_tokens_p99'] or '-':>8} {row['max_tokens'] or '-':>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 라우트 A/B 비교")
+    parser.add_argument("--prompts", default=DEFAULT_PROMPTS, help="프롬프트 세트 JSON 경로")
+    parser.add_argument("--tasks", default=None, help="비교할 작업 (쉼표 구분, 기본: 전체)")
+    parser.add_argument("--models", default="sonar,sonar-pro", help="비교할 모델 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=1, help="프롬프트당 반복 횟수")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    args = parser.parse_args()
+
+    with open(args.prompts, encoding="utf-8") as f:
+        prompts = json.load(f)
+
+    tasks = args.tasks.split(",") if args.tasks else list(prompts.keys())
+    models = [m.strip() for m in args.models.split(",") if m.strip()]
+
+    print(f">>> 라우트 A/B 시작: 작업 {tasks}, 비교 모델 {models}, 반복 {args.repeat}회")
+    try:
+        results = run_benchmark(prompts, tasks, models, max(args.repeat, 1))
+    finally:
+        ledger.flush()
+    print_table(results)
+
+    output = write_results("route_ab", {
+        "repeat": args.repeat,
+        "token_prices": settings.llm_token_prices,
+        "results": results,
+    }, args.output)
+    print(f"\n>>> 결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark Suite - corpus 적재 + API 부하 + 파이프라인 단계 측정을 한 번에 실행
+
+DB 엔진은 프로세스당 하나(import 시점 결정)이므로 DB별로 하위 프로세스를 실행하고,
+결과를 하나의 JSON으로 합쳐 커밋 간 비교할 수 있게 저장합니다.
+
+사용법:
+    python benchmarks/run_suite.py --articles 10000
+    python benchmarks/run_suite.py --articles 100000 \\
+        --database-url sqlite:///benchmarks/results/bench.db \\
+        --database-url postgresql://user:pw@localhost/news_bench
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import BENCHMARK_DIR, DEFAULT_DATABASE_URL, database_label, write_results
+
+
+def _run(script: str, arguments: List[str]) -> Dict:
+    """하위 벤치마크 실행 후 결과 JSON 반환"""
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, "result.json")
+        command = [sys.executable, os.path.join(BENCHMARK_DIR, script), *arguments]
+        if script != "seed_corpus.py":
+            command += ["--output", output]
+        subprocess.run(command, check=True)
+        if not os.path.exists(output):
+            return {}
+        with open(output, encoding="utf-8") as f:
+            return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크 전체 실행")
+    parser.add_argument("--database-url", action="append", default=None,
+                        help="대상 DB (여러 번 지정 가능, 기본: benchmarks/results/bench.db)")
+    parser.add_argument("--articles", type=int, default=10_000, help="적재할 기사 수")
+    parser.add_argument("--requests", type=int, default=500, help="API 시나리오당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="API 동시 요청 수")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker 수")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="스텁 LLM 응답 지연")
+    parser.add_argument("--skip-pipeline", action="store_true", help="파이프라인 단계 측정 생략")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    args = parser.parse_args()
+
+    runs = []
+    for database_url in args.database_url or [DEFAULT_DATABASE_URL]:
+        print(f"\n===== {database_label(database_url)} =====")
+        _run("seed_corpus.py", ["--database-url", database_url, "--articles", str(args.articles)])
+        api_load = _run("api_load.py", [
+            "--database-url", database_url,
+            "--requests", str(args.requests),
+            "--concurrency", str(args.concurrency),
+            "--workers", str(args.workers),
+        ])
+        runs.append({
+            "database": database_label(database_url),
+            "articles": args.articles,
+            "api_load": api_load.get("results", []),
+        })
+
+    pipeline = {}
+    if not args.skip_pipeline:
+        print("\n===== pipeline =====")
+        pipeline = _run("pipeline_timing.py", ["--llm-latency-ms", str(args.llm_latency_ms)])
+        for key in ("benchmark", "created_at", "git_revision"):
+            pipeline.pop(key, None)
+
+    output = write_results("suite", {
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "workers": args.workers,
+        "runs": runs,
+        "pipeline": pipeline,
+    }, args.output)
+    print(f"\n>>> 결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
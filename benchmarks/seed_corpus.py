@@ -0,0 +1,239 @@
+"""
+Corpus Seeder - 벤치마크용 synthetic corpus(언론사/토픽/기사/숏폼/토론)를 DB에 적재
+
+stubs/corpus.py의 결정적 가짜 기사를 사용하므로 같은 --seed면 항상 같은 데이터가 만들어집니다.
+이미 --articles 이상 적재된 DB는 다시 적재하지 않습니다 (--reset으로 초기화).
+
+사용법:
+    python benchmarks/seed_corpus.py --articles 10000
+    python benchmarks/seed_corpus.py --articles 1000000 --database-url postgresql://user:pw@localhost/news_bench
+"""
+import argparse
+import datetime
+import math
+import os
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import configure_database, database_label
+from stubs import corpus
+
+NEWS_BASE_URL = "https://n.news.naver.com"
+CATEGORY_CODES = {
+    "정치": "politics", "경제": "economy", "사회": "society",
+    "생활/문화": "culture", "세계": "world", "IT/과학": "tech",
+}
+SENTIMENTS = ["positive", "neutral", "negative"]
+
+
+def _short_content(article: Dict) -> Dict:
+    subject = corpus.EVENTS[article["event"]]["subject"]
+    return {
+        "title": f"{subject}, 1분 요약",
+        "script": " ".join(corpus.EVENTS[article["event"]]["facts"]),
+        "hashtags": [f"#{subject.replace(' ', '')}", "#뉴스", "#요약"],
+        "image_url": article["image_url"],
+    }
+
+
+def _debate_content(article: Dict, headline: str) -> Dict:
+    event = corpus.EVENTS[article["event"]]
+    speakers = [("positive", "진보 논객"), ("neutral", "중도 논객"), ("negative", "보수 논객")]
+    return {
+        "topic_headline": headline,
+        "debaters": {
+            key: {"name": name, "stance": key, "avatar_color": color}
+            for (key, name), color in zip(speakers, ["#3b82f6", "#6b7280", "#ef4444"])
+        },
+        "rounds": [
+            {
+                "round_number": number,
+                "theme": theme,
+                "statements": [
+                    {"speaker": key, "content": f"{event['facts'][i % len(event['facts'])]} {corpus.FILLER[i]}"}
+                    for i, (key, _) in enumerate(speakers)
+                ],
+            }
+            for number, theme in enumerate(["쟁점 정리", "반론", "마무리 발언"], start=1)
+        ],
+        "conclusion": {
+            "summary": event["facts"][0],
+            "key_points": list(event["facts"]),
+            "recommendation": corpus.FRAMINGS["center"],
+        },
+    }
+
+
+def seed_corpus(
+    articles: int,
+    articles_per_topic: int = len(corpus.PRESSES),
+    content_ratio: float = 0.5,
+    days: int = 30,
+    seed: int = 0,
+    batch_size: int = 5000,
+    reset: bool = False
+) -> Dict:
+    """
+    synthetic corpus 적재
+
+    Args:
+        articles: 기사 수
+        articles_per_topic: 토픽당 기사 수 (기본: 언론사 수 - 한 사건을 모든 언론사가 다룸)
+        content_ratio: 숏폼/토론까지 생성된 토픽 비율
+        days: 토픽 생성 시각을 분산시킬 기간 (최근 N일)
+        seed: corpus seed
+        batch_size: INSERT 배치 크기
+        reset: 기존 테이블을 지우고 다시 적재
+
+    Returns:
+        적재 건수와 소요 시간
+    """
+    from sqlalchemy import func, insert
+    from core.database import (
+        Base, SessionLocal, engine, create_db_tables,
+        Source, Topic, Article, Short, Debate
+    )
+    from services.topic_stats import refresh_topic_stats
+    from services.trending import record_article_buckets
+
+    if reset:
+        Base.metadata.drop_all(bind=engine)
+    create_db_tables(checkfirst=True)
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        existing = db.query(func.count(Article.id)).scalar()
+        if existing >= articles:
+            print(f">>> 이미 기사 {existing}건이 적재되어 있어 건너뜀 (--reset으로 초기화)")
+            return {"articles": existing, "skipped": True}
+        if existing:
+            raise RuntimeError(f"기사 {existing}건이 일부만 적재된 DB입니다. --reset으로 초기화하세요.")
+
+        source_ids = {}
+        for _, press in corpus.PRESSES:
+            source = db.query(Source).filter(Source.name == press).first()
+            if not source:
+                source = Source(name=press, bias_label=corpus.PRESS_BIAS.get(press, "center"))
+                db.add(source)
+                db.flush()
+            source_ids[press] = source.id
+        db.commit()
+
+        now = datetime.datetime.utcnow()
+        topic_count = math.ceil(articles / articles_per_topic)
+        span = datetime.timedelta(days=days)
+        content_every = max(1, round(1 / content_ratio)) if content_ratio > 0 else 0
+        counts = {"sources": len(source_ids), "topics": 0, "articles": 0, "shorts": 0, "debates": 0}
+
+        for first_topic in range(0, topic_count, max(1, batch_size // articles_per_topic)):
+            last_topic = min(topic_count, first_topic + max(1, batch_size // articles_per_topic))
+            topic_rows: List[Dict] = []
+            leads: List[Dict] = []
+            for t in range(first_topic, last_topic):
+                lead = corpus.synthetic_article(t * articles_per_topic, seed)
+                event = corpus.EVENTS[lead["event"]]
+                leads.append(lead)
+                topic_rows.append({
+                    # 최근 토픽일수록 id가 크도록 과거 → 현재 순으로 생성
+                    "created_at": now - span * (1 - (t + 1) / topic_count),
+                    "ai_neutral_headline": event["titles"][0],
+                    "ai_summary": " ".join(event["facts"][:2]),
+                })
+            topic_ids = list(db.scalars(
+                insert(Topic).returning(Topic.id, sort_by_parameter_order=True), topic_rows
+            ))
+
+            article_rows, short_rows, debate_rows = [], [], []
+            for offset, (topic_id, topic_row, lead) in enumerate(zip(topic_ids, topic_rows, leads)):
+                t = first_topic + offset
+                for index in range(t * articles_per_topic, min(articles, (t + 1) * articles_per_topic)):
+                    article = corpus.synthetic_article(index, seed)
+                    article_rows.append({
+                        "title": article["title"],
+                        "url": NEWS_BASE_URL + article["path"],
+                        "body": article["body"],
+                        "image_url": article["image_url"],
+                        "crawled_at": topic_row["created_at"] - datetime.timedelta(minutes=index % 60),
+                        "category": CATEGORY_CODES.get(article["section"], "etc"),
+                        "reporter_name": article["reporter_name"],
+                        "source_id": source_ids[article["press"]],
+                        "topic_id": topic_id,
+                        "ai_alternative_title": f"{corpus.EVENTS[article['event']]['subject']} 관련 보도",
+                        "ai_bias_score": float(index % 11),
+                        "ai_reporter_summary": corpus.FRAMINGS[corpus.PRESS_BIAS.get(article["press"], "center")],
+                        "sentiment": SENTIMENTS[index % len(SENTIMENTS)],
+                    })
+                if content_every and t % content_every == 0:
+                    short_rows.append({
+                        "topic_id": topic_id,
+                        "content_json": _short_content(lead),
+                    })
+                    debate_rows.append({
+                        "topic_id": topic_id,
+                        "content_json": _debate_content(lead, topic_row["ai_neutral_headline"]),
+                    })
+
+            db.execute(insert(Article), article_rows)
+            if short_rows:
+                db.execute(insert(Short), short_rows)
+                db.execute(insert(Debate), debate_rows)
+            record_article_buckets(db, [(row["topic_id"], row["crawled_at"]) for row in article_rows])
+            refresh_topic_stats(db, topic_ids)
+            db.commit()
+
+            counts["topics"] += len(topic_ids)
+            counts["articles"] += len(article_rows)
+            counts["shorts"] += len(short_rows)
+            counts["debates"] += len(debate_rows)
+            print(f"  . 기사 {counts['articles']}/{articles}건 적재")
+
+        if engine.dialect.name == "postgresql":
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.exec_driver_sql("ANALYZE")
+        else:
+            with engine.begin() as conn:
+                conn.exec_driver_sql("ANALYZE")
+
+        seconds = time.perf_counter() - started
+        return {
+            **counts,
+            "seconds": round(seconds, 2),
+            "articles_per_second": round(counts["articles"] / seconds, 1) if seconds else 0.0,
+            "skipped": False,
+        }
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 synthetic corpus 적재")
+    parser.add_argument("--database-url", default=None, help="대상 DB (기본: benchmarks/results/bench.db)")
+    parser.add_argument("--articles", type=int, default=10_000, help="기사 수 (1만~100만)")
+    parser.add_argument("--articles-per-topic", type=int, default=len(corpus.PRESSES), help="토픽당 기사 수")
+    parser.add_argument("--content-ratio", type=float, default=0.5, help="숏폼/토론이 있는 토픽 비율")
+    parser.add_argument("--days", type=int, default=30, help="토픽 생성 시각 분산 기간(일)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--reset", action="store_true", help="기존 테이블 삭제 후 다시 적재")
+    args = parser.parse_args()
+
+    database_url = configure_database(args.database_url)
+    print(f">>> corpus 적재 시작: {database_label(database_url)}, 기사 {args.articles}건")
+    result = seed_corpus(
+        args.articles,
+        articles_per_topic=args.articles_per_topic,
+        content_ratio=args.content_ratio,
+        days=args.days,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        reset=args.reset
+    )
+    print(f">>> 완료: {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,92 +1,158 @@
 import os
-import json
-from openai import OpenAI
+import time
 from dotenv import load_dotenv
+from sqlalchemy.orm import joinedload
 from core.database import SessionLocal, Article, Topic, Source
+from services.bias_classifier import LocalBiasClassifier, DEFAULT_SOURCE_NAME
+from services.stages import STAGE_CLASSIFY
+from services.prompt_builder import ArticleSection, build_context, record_prompt_tokens
+from services.ai_client import get_ai_client
+from services.llm_ledger import ledger
+from services.event_bus import event_bus, TOPICS_UPDATED
+from services.topic_stats import refresh_topic_stats
 
 # Load environment variables
 load_dotenv()
 
 PPLX_API_KEY = os.environ.get("PPLX_API_KEY")
 if not PPLX_API_KEY:
-    print("!!! 오류: PPLX_API_KEY 환경 변수가 없습니다.")
-    exit()
+    print("!!! 경고: PPLX_API_KEY 환경 변수가 없습니다. 로컬 분류기 결과만 사용합니다.")
 
-client = OpenAI(api_key=PPLX_API_KEY, base_url="https://api.perplexity.ai")
+COMMIT_BATCH_SIZE = 50
+
+def classify_with_llm(article, headline):
+    body_text = build_context(STAGE_CLASSIFY, [ArticleSection(header="", body=article.body or "", footer="")])
+    prompt = f"""
+    이 뉴스는 '{headline}'라는 사건에 대한 기사야.
+    아래 기사 내용을 분석해서 '언론사 이름'과 '정치적 관점(bias)'을 판단해줘.
+
+    [기사 정보]
+    제목: {article.title}
+    본문요약: {body_text}
+    링크: {article.url}
+
+    [지시사항]
+    1. press_name: 기사의 어조와 출처를 분석해 한국 언론사 이름을 정확히 추론해줘.
+    2. bias: 이 기사가 사건을 다루는 관점을 'left', 'right', 'center' 중 하나로 분류해줘.
+       - Right (보수): 한미동맹/안보 강조, 기업/시장 친화, 대북 강경, 보수 진영 옹호 (예: 조선, 중앙, 동아, 매경 등)
+       - Left (진보): 평화/인권 강조, 노동 친화, 검찰/재벌 개혁, 진보 진영 옹호 (예: 한겨레, 경향, 오마이뉴스 등)
+       - Center (중도/팩트): 기계적 중립, 단순 사실 전달, 또는 판단 불가 (예: 연합뉴스, YTN, 한국일보 등)
+    3. 반드시 아래 JSON 포맷으로만 출력해.
+
+    {{
+        "press_name": "언론사 이름",
+        "bias": "left" 또는 "right" 또는 "center"
+    }}
+    """
+
+    record_prompt_tokens(STAGE_CLASSIFY, prompt)
+    ai_client = get_ai_client()
+    content = ai_client.chat(
+        "Output valid JSON only.",
+        prompt,
+        stage=STAGE_CLASSIFY,
+        topic_id=article.topic_id,
+        article_id=article.id
+    )
+    data = ai_client.extract_json(content)
+    
+    return data.get('press_name', 'Unknown'), data.get('bias', 'center')
 
 def classify_articles_by_topic():
     db = SessionLocal()
-    topics = db.query(Topic).filter(Topic.ai_neutral_headline != None).all()
+    stats = {"total": 0, "reused": 0, "local": 0, "escalated": 0, "llm_failed": 0}
     
-    for topic in topics:
-        default_source = db.query(Source).filter(Source.name == "네이버뉴스").first()
+    try:
+        default_source = db.query(Source).filter(Source.name == DEFAULT_SOURCE_NAME).first()
         if not default_source:
-            continue
-
-        articles = db.query(Article).filter(
-            Article.topic_id == topic.id,
+            return stats
+        
+        # 헤드라인이 생성된 토픽의 미분류 기사를 한 번에 조회
+        articles = db.query(Article).join(Topic, Article.topic_id == Topic.id).options(
+            joinedload(Article.topic)
+        ).filter(
+            Topic.ai_neutral_headline != None,
             Article.source_id == default_source.id
         ).all()
         
         if not articles:
-            continue
-            
+            return stats
+        
+        # 0. 유사 중복 기사는 이미 분류된 대표 기사의 언론사를 재사용
+        canonical_ids = {art.canonical_id for art in articles if art.canonical_id}
+        canonical_sources = dict(db.query(Article.id, Article.source_id).filter(
+            Article.id.in_(canonical_ids),
+            Article.source_id != default_source.id
+        ).all()) if canonical_ids else {}
+        
+        # 언론사(관점)가 바뀐 기사의 토픽 - 끝나면 좌/중/우 집계와 대표 기사를 갱신
+        changed_topic_ids = set()
+        pending = []
         for article in articles:
-            prompt = f"""
-            이 뉴스는 '{topic.ai_neutral_headline}'라는 사건에 대한 기사야.
-            아래 기사 내용을 분석해서 '언론사 이름'과 '정치적 관점(bias)'을 판단해줘.
-            
-            [기사 정보]
-            제목: {article.title}
-            본문요약: {article.body[:300]}
-            링크: {article.url}
-            
-            [지시사항]
-            1. press_name: 기사의 어조와 출처를 분석해 한국 언론사 이름을 정확히 추론해줘.
-            2. bias: 이 기사가 사건을 다루는 관점을 'left', 'right', 'center' 중 하나로 분류해줘.
-               - Right (보수): 한미동맹/안보 강조, 기업/시장 친화, 대북 강경, 보수 진영 옹호 (예: 조선, 중앙, 동아, 매경 등)
-               - Left (진보): 평화/인권 강조, 노동 친화, 검찰/재벌 개혁, 진보 진영 옹호 (예: 한겨레, 경향, 오마이뉴스 등)
-               - Center (중도/팩트): 기계적 중립, 단순 사실 전달, 또는 판단 불가 (예: 연합뉴스, YTN, 한국일보 등)
-            3. 반드시 아래 JSON 포맷으로만 출력해.
+            stats["total"] += 1
+            if article.canonical_id in canonical_sources:
+                article.source_id = canonical_sources[article.canonical_id]
+                changed_topic_ids.add(article.topic_id)
+                stats["reused"] += 1
+                ledger.record(STAGE_CLASSIFY, cache_hit=True, article_id=article.id)
+            else:
+                pending.append(article)
+        articles = pending
+        
+        # 1. 로컬 분류기 (저장된 언론사 라벨 + BIAS_MAP으로 학습)
+        started = time.perf_counter()
+        classifier = LocalBiasClassifier()
+        trained_count = classifier.train(db)
+        predictions = classifier.predict(articles)
+        local_elapsed = time.perf_counter() - started
+        
+        sources = {source.name: source for source in db.query(Source).all()}
+        
+        def get_or_create_source(press_name, bias):
+            source = sources.get(press_name)
+            if not source:
+                source = Source(name=press_name, bias_label=bias)
+                db.add(source)
+                db.flush()
+                sources[press_name] = source
+            return source
+        
+        # 2. 신뢰도가 낮은 기사만 LLM으로 분류
+        for i, (article, prediction) in enumerate(zip(articles, predictions), 1):
+            if prediction:
+                press_name, bias = prediction.press_name, prediction.bias
+                stats["local"] += 1
+            else:
+                stats["escalated"] += 1
+                if not PPLX_API_KEY:
+                    stats["llm_failed"] += 1
+                    continue
+                try:
+                    press_name, bias = classify_with_llm(article, article.topic.ai_neutral_headline)
+                except Exception:
+                    stats["llm_failed"] += 1
+                    continue
             
-            {{
-                "press_name": "언론사 이름",
-                "bias": "left" 또는 "right" 또는 "center"
-            }}
-            """
-
-            try:
-                response = client.chat.completions.create(
-                    model="sonar-pro", 
-                    messages=[
-                        {"role": "system", "content": "Output valid JSON only."},
-                        {"role": "user", "content": prompt}
-                    ],
-                )
-                
-                content = response.choices[0].message.content
-                content = content.replace("```json", "").replace("```", "").strip()
-                start = content.find('{')
-                end = content.rfind('}') + 1
-                data = json.loads(content[start:end])
-                
-                press_name = data.get('press_name', 'Unknown')
-                bias = data.get('bias', 'center')
-                
-                source = db.query(Source).filter(Source.name == press_name).first()
-                if not source:
-                    source = Source(name=press_name, bias_label=bias)
-                    db.add(source)
-                    db.commit()
-                    db.refresh(source)
-                
-                article.source_id = source.id
+            article.source_id = get_or_create_source(press_name, bias).id
+            changed_topic_ids.add(article.topic_id)
+            if i % COMMIT_BATCH_SIZE == 0:
                 db.commit()
-                
-            except Exception as e:
-                continue
-            
-    db.close()
+        
+        db.commit()
+        if changed_topic_ids:
+            refresh_topic_stats(db, changed_topic_ids)
+            db.commit()
+            event_bus.publish(TOPICS_UPDATED, changed_topic_ids)
+        
+        escalation_rate = stats["escalated"] / stats["total"] * 100
+        print(
+            f">>> 기사 관점 분류: 총 {stats['total']}건 (학습 {trained_count}건, 로컬 {local_elapsed * 1000:.0f}ms) | "
+            f"중복 재사용 {stats['reused']}건, 로컬 {stats['local']}건, LLM 전달 {stats['escalated']}건 ({escalation_rate:.1f}%), "
+            f"LLM 실패 {stats['llm_failed']}건"
+        )
+        return stats
+    finally:
+        db.close()
 
 if __name__ == "__main__":
     if not os.environ.get("DATABASE_URL"):
@@ -2,6 +2,9 @@ from sentence_transformers import SentenceTransformer
 from sklearn.cluster import DBSCAN
 import numpy as np
 from core.database import SessionLocal, Article, Topic 
+from services.event_bus import event_bus, TOPICS_CREATED
+from services.topic_stats import refresh_topic_stats
+from services import trending
 
 def run_topic_clustering():
     try:
@@ -29,6 +32,9 @@ def run_topic_clustering():
         db.close()
         return
 
+    # 커밋 후 기사별 재조회가 일어나지 않도록 미리 읽어 둠 (인기 토픽 시간 버킷용)
+    crawled_at = [article.crawled_at for article in articles_to_cluster]
+
     try:
         new_topic_objects = {}
         for topic_label in set(labels):
@@ -38,11 +44,19 @@ def run_topic_clustering():
                 new_topic_objects[topic_label] = new_topic
         db.commit()
 
+        assigned = []
         for i, article in enumerate(articles_to_cluster):
             label = labels[i]
             if label != -1:
                 article.topic_id = new_topic_objects[label].id
+                assigned.append((article.topic_id, crawled_at[i]))
+        topic_ids = [topic.id for topic in new_topic_objects.values()]
+        db.commit()
+        trending.record_article_buckets(db, assigned)
+        trending.prune_buckets(db)
+        refresh_topic_stats(db, topic_ids)
         db.commit()
+        event_bus.publish(TOPICS_CREATED, topic_ids)
     except Exception as e:
         db.rollback()
     finally:
@@ -0,0 +1,64 @@
+"""
+pytest 공통 설정 - 테스트 DB(benchmarks/seed_corpus.py), 스텁 서버(stubs/server.py), 쿼리 예산 plugin
+
+설정(core.config)과 엔진(core.database)은 import 시점의 환경변수를 읽으므로,
+앱 모듈을 import하기 전에 임시 SQLite DB와 스텁 서버 주소를 지정합니다.
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stubs.server import StubConfig, start_stub_server, stub_environment
+
+TEST_DIR = tempfile.mkdtemp(prefix="news-test-")
+CRON_SECRET = "test-secret"
+# 테스트 corpus 크기 (토픽당 기사 수 = 언론사 수)
+CORPUS_ARTICLES = 240
+
+_stub_server = start_stub_server(StubConfig())
+os.environ.update(stub_environment(_stub_server.base_url))
+os.environ.pop("USE_SQLITE", None)
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{os.path.join(TEST_DIR, 'test.db')}",
+    "CRON_SECRET_KEY": CRON_SECRET,
+    "EVENT_BUS_BACKEND": "memory",
+    "SNAPSHOT_SERVING": "false",
+    "SNAPSHOT_DIR": os.path.join(TEST_DIR, "snapshots"),
+    "ARCHIVE_DIR": os.path.join(TEST_DIR, "archive"),
+    "PROFILE_DIR": os.path.join(TEST_DIR, "profiles"),
+})
+
+pytest_plugins = ["core.pytest_query_budget"]
+
+
+@pytest.fixture(scope="session")
+def corpus():
+    """synthetic corpus를 적재한 테스트 DB (숏폼/토론은 절반의 토픽에만 있음)"""
+    from benchmarks.seed_corpus import seed_corpus
+
+    return seed_corpus(CORPUS_ARTICLES, days=3)
+
+
+@pytest.fixture(scope="session")
+def client(corpus):
+    """앱 lifespan(테이블 확인, 이벤트 버스 등)까지 실행한 TestClient"""
+    from fastapi.testclient import TestClient
+    import app
+
+    with TestClient(app.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db(corpus):
+    from core.database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -0,0 +1,132 @@
+"""
+Text compression - 큰 텍스트 컬럼(기사 본문)을 zstd로 압축 저장하는 SQLAlchemy 타입
+
+- 값은 zstd 프레임(bytes)으로 저장되고, 읽을 때 자동으로 풀려 str로 돌아옵니다
+- 기사 본문끼리 겹치는 표현(언론사 꼬리말, 상투어 등)이 많아, 본문 표본으로 학습한 공유 사전을 쓰면
+  짧은 본문도 잘 압축됩니다. 사전은 compression_dictionaries 테이블에 저장되고(services/body_compression.py로 학습),
+  프레임 헤더의 사전 id로 어떤 사전으로 압축했는지 알 수 있어 사전을 새로 학습해도 기존 값은 그대로 읽힙니다
+- 압축 전 값(텍스트로 저장된 기존 행, 최소 크기 미만/압축 끈 상태의 UTF-8 bytes)도 그대로 읽습니다
+"""
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import zstandard
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+from core.config import settings
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# 다른 프로세스(파이프라인)가 새 사전을 학습했는지 다시 확인하는 주기(초)
+DICTIONARY_RELOAD_SECONDS = 300
+
+
+class CompressionDictionaries:
+    """zstd 공유 사전 (사전 id → 사전, 가장 최근 사전으로 압축)"""
+
+    def __init__(self):
+        self._dictionaries: Dict[int, zstandard.ZstdCompressionDict] = {}
+        self._current_id: Optional[int] = None
+        self._loader: Optional[Callable[[], List[Tuple[int, bytes]]]] = None
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def set_loader(self, loader: Callable[[], List[Tuple[int, bytes]]]) -> None:
+        """저장된 사전을 (사전 id, 사전 bytes) 오래된 순으로 돌려주는 함수 등록 (core/database.py)"""
+        self._loader = loader
+
+    def load(self) -> None:
+        if self._loader is None:
+            return
+        try:
+            rows = self._loader()
+        except Exception as e:
+            # 테이블 생성 전 등 - 사전 없이 압축
+            print(f"!!! 압축 사전을 읽을 수 없습니다: {e}")
+            rows = []
+        with self._lock:
+            for dict_id, data in rows:
+                self._dictionaries.setdefault(dict_id, zstandard.ZstdCompressionDict(data))
+            if rows:
+                self._current_id = rows[-1][0]
+            self._loaded_at = time.monotonic()
+
+    def add(self, dict_id: int, data: bytes) -> None:
+        """새로 학습한 사전을 현재 사전으로 사용"""
+        with self._lock:
+            self._dictionaries[dict_id] = zstandard.ZstdCompressionDict(data)
+            self._current_id = dict_id
+
+    def get(self, dict_id: int) -> zstandard.ZstdCompressionDict:
+        if dict_id not in self._dictionaries:
+            self.load()
+        if dict_id not in self._dictionaries:
+            raise LookupError(f"압축 사전 {dict_id}을(를) 찾을 수 없습니다.")
+        return self._dictionaries[dict_id]
+
+    def current(self) -> Optional[int]:
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > DICTIONARY_RELOAD_SECONDS:
+            self.load()
+        return self._current_id
+
+    # zstd 압축기/해제기는 스레드 간 공유할 수 없어 스레드마다 사전별로 하나씩 둠
+    def compressor(self, dict_id: Optional[int]) -> zstandard.ZstdCompressor:
+        cache = self._local.__dict__.setdefault("compressors", {})
+        key = (dict_id, settings.text_compression_level)
+        if key not in cache:
+            cache[key] = zstandard.ZstdCompressor(
+                level=settings.text_compression_level,
+                dict_data=self.get(dict_id) if dict_id else None
+            )
+        return cache[key]
+
+    def decompressor(self, dict_id: int) -> zstandard.ZstdDecompressor:
+        cache = self._local.__dict__.setdefault("decompressors", {})
+        if dict_id not in cache:
+            cache[dict_id] = zstandard.ZstdDecompressor(dict_data=self.get(dict_id) if dict_id else None)
+        return cache[dict_id]
+
+
+dictionaries = CompressionDictionaries()
+
+
+def frame_dictionary_id(value: bytes) -> Optional[int]:
+    """zstd 프레임의 사전 id (압축되지 않은 값이면 None)"""
+    if not value.startswith(ZSTD_MAGIC):
+        return None
+    return zstandard.get_frame_parameters(value).dict_id
+
+
+def compress_text(value: str) -> bytes:
+    data = value.encode("utf-8")
+    # UTF-8 텍스트는 zstd 매직 바이트(0x28 0xB5...)로 시작할 수 없어 압축하지 않은 값과 구분됨
+    if not settings.text_compression_enabled or len(data) < settings.text_compression_min_bytes:
+        return data
+    return dictionaries.compressor(dictionaries.current()).compress(data)
+
+
+def decompress_text(value: Union[bytes, memoryview, str]) -> str:
+    if isinstance(value, str):
+        return value
+    value = bytes(value)
+    dict_id = frame_dictionary_id(value)
+    if dict_id is None:
+        return value.decode("utf-8")
+    return dictionaries.decompressor(dict_id).decompress(value).decode("utf-8")
+
+
+class CompressedText(TypeDecorator):
+    """zstd 압축 텍스트 (DB에는 bytes, 파이썬에서는 str)"""
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return compress_text(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return decompress_text(value)
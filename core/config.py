@@ -3,7 +3,9 @@ Application configuration management
 """
 import os
 from functools import lru_cache
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
+from pydantic import BaseModel
 
 load_dotenv()
 
@@ -13,6 +15,13 @@ except ImportError:
     from pydantic import BaseSettings
 
 
+class LLMRoute(BaseModel):
+    """작업 종류별 LLM 호출 설정"""
+    model: str
+    max_tokens: Optional[int] = None
+    temperature: float = 0.7
+
+
 class Settings(BaseSettings):
     """Application settings"""
     
@@ -29,6 +38,64 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 60 * 24  # 1 day
     cron_secret_key: str = os.environ.get("CRON_SECRET_KEY", "")
     
+    # Password hashing (services/password_hashing.py) - bcrypt 작업 비용, 전용 스레드 수, 대기 허용 개수
+    bcrypt_rounds: int = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+    password_hash_workers: int = int(os.environ.get("PASSWORD_HASH_WORKERS", "2"))
+    password_hash_max_pending: int = int(os.environ.get("PASSWORD_HASH_MAX_PENDING", "32"))
+    
+    # Token -> user cache (services/auth_cache.py)
+    auth_user_cache_ttl_seconds: int = int(os.environ.get("AUTH_USER_CACHE_TTL_SECONDS", "60"))
+    auth_user_cache_max_entries: int = int(os.environ.get("AUTH_USER_CACHE_MAX_ENTRIES", "10000"))
+    
+    # Personalized feed (services/keyword_matcher.py) - 색인 기간, 증분 갱신 주기, 재색인 구간, 최신성 반감기
+    feed_index_window_days: int = int(os.environ.get("FEED_INDEX_WINDOW_DAYS", "14"))
+    feed_index_refresh_seconds: int = int(os.environ.get("FEED_INDEX_REFRESH_SECONDS", "30"))
+    feed_index_resync_hours: int = int(os.environ.get("FEED_INDEX_RESYNC_HOURS", "6"))
+    feed_recency_half_life_hours: float = float(os.environ.get("FEED_RECENCY_HALF_LIFE_HOURS", "24"))
+    feed_max_page_size: int = int(os.environ.get("FEED_MAX_PAGE_SIZE", "50"))
+    
+    # Keyword watch stream (services/keyword_watch.py) - 새 기사/토픽 확인 주기, 연결별 큐 크기, 동시 연결 한도, SSE keep-alive,
+    # 스트림 전용 토큰 유효 시간(초, EventSource URL에 넣는 토큰 - 연결할 때만 확인)
+    keyword_watch_poll_seconds: float = float(os.environ.get("KEYWORD_WATCH_POLL_SECONDS", "5"))
+    keyword_watch_queue_size: int = int(os.environ.get("KEYWORD_WATCH_QUEUE_SIZE", "100"))
+    keyword_watch_max_connections: int = int(os.environ.get("KEYWORD_WATCH_MAX_CONNECTIONS", "1000"))
+    keyword_watch_heartbeat_seconds: float = float(os.environ.get("KEYWORD_WATCH_HEARTBEAT_SECONDS", "15"))
+    keyword_watch_stream_token_seconds: int = int(os.environ.get("KEYWORD_WATCH_STREAM_TOKEN_SECONDS", "60"))
+    
+    # Change event bus (services/event_bus.py) - auto | postgres | table | memory
+    event_bus_backend: str = os.environ.get("EVENT_BUS_BACKEND", "auto")
+    event_bus_channel: str = os.environ.get("EVENT_BUS_CHANNEL", "harmoni_events")
+    event_bus_poll_seconds: float = float(os.environ.get("EVENT_BUS_POLL_SECONDS", "1"))
+    event_bus_retention_seconds: int = int(os.environ.get("EVENT_BUS_RETENTION_SECONDS", "3600"))
+    
+    # Static snapshots (services/snapshots.py) - 출력 디렉터리, 파일 응답 사용 여부, 상세 스냅샷 토픽 수, 보관 버전 수, Cache-Control max-age
+    snapshot_dir: str = os.environ.get("SNAPSHOT_DIR", "snapshots")
+    snapshot_serving_enabled: bool = os.environ.get("SNAPSHOT_SERVING", "true").lower() == "true"
+    snapshot_topic_limit: int = int(os.environ.get("SNAPSHOT_TOPIC_LIMIT", "500"))
+    snapshot_keep_versions: int = int(os.environ.get("SNAPSHOT_KEEP_VERSIONS", "3"))
+    snapshot_max_age_seconds: int = int(os.environ.get("SNAPSHOT_MAX_AGE_SECONDS", "60"))
+    
+    # Trending (services/trending.py) - 집계 기간, 시간 버킷 감쇠 반감기(바꾸면 services/topic_stats.py --rebuild), 반환 토픽 수
+    trending_window_hours: int = int(os.environ.get("TRENDING_WINDOW_HOURS", "24"))
+    trending_half_life_hours: float = float(os.environ.get("TRENDING_HALF_LIFE_HOURS", "6"))
+    trending_limit: int = int(os.environ.get("TRENDING_LIMIT", "5"))
+    
+    # Text compression (core/compression.py) - 기사 본문 zstd 압축 여부/레벨, 압축할 최소 크기, 공유 사전 크기/학습 표본 수
+    text_compression_enabled: bool = os.environ.get("TEXT_COMPRESSION", "true").lower() == "true"
+    text_compression_level: int = int(os.environ.get("TEXT_COMPRESSION_LEVEL", "6"))
+    text_compression_min_bytes: int = int(os.environ.get("TEXT_COMPRESSION_MIN_BYTES", "128"))
+    text_compression_dict_size: int = int(os.environ.get("TEXT_COMPRESSION_DICT_SIZE", "65536"))
+    text_compression_dict_samples: int = int(os.environ.get("TEXT_COMPRESSION_DICT_SAMPLES", "2000"))
+
+    # Retention (services/retention.py) - 보관 기준 일수(마지막 기사 기준, 0이면 보관 안 함 - 기본),
+    # 보관 파일 디렉터리(영구 볼륨 경로, 지정하지 않으면 보관/삭제하지 않음), 한 번에 옮길 토픽 수,
+    # LLM 호출 원장 보관 일수(0이면 계속 보관), SQLite incremental_vacuum 페이지 수(0이면 빈 페이지 전체)
+    retention_days: int = int(os.environ.get("RETENTION_DAYS", "0"))
+    archive_dir: str = os.environ.get("ARCHIVE_DIR", "")
+    retention_batch_size: int = int(os.environ.get("RETENTION_BATCH_SIZE", "200"))
+    llm_call_retention_days: int = int(os.environ.get("LLM_CALL_RETENTION_DAYS", "365"))
+    retention_vacuum_pages: int = int(os.environ.get("RETENTION_VACUUM_PAGES", "0"))
+    
     # Naver API
     naver_client_id: str = os.environ.get("NAVER_CLIENT_ID", "")
     naver_client_secret: str = os.environ.get("NAVER_CLIENT_SECRET", "")
@@ -48,6 +115,93 @@ class Settings(BaseSettings):
     # Perplexity AI API
     pplx_api_key: str = os.environ.get("PPLX_API_KEY", "")
     
+    # Upstream base URLs (로컬 스텁 서버 stubs/server.py로 바꿔 오프라인 실행/벤치마크)
+    naver_news_base_url: str = os.environ.get("NAVER_NEWS_BASE_URL", "https://news.naver.com")
+    naver_openapi_base_url: str = os.environ.get("NAVER_OPENAPI_BASE_URL", "https://openapi.naver.com")
+    pplx_base_url: str = os.environ.get("PPLX_BASE_URL", "https://api.perplexity.ai")
+    crawl_request_delay_seconds: float = float(os.environ.get("CRAWL_REQUEST_DELAY_SECONDS", "0.5"))
+    
+    # Naver search proxy (services/naver_search.py) - 캐시 TTL, 초당 요청 수, 일일 호출 한도(OpenAPI 기본 25,000회)
+    naver_search_cache_ttl_seconds: int = int(os.environ.get("NAVER_SEARCH_CACHE_TTL_SECONDS", "300"))
+    naver_search_cache_max_entries: int = int(os.environ.get("NAVER_SEARCH_CACHE_MAX_ENTRIES", "1000"))
+    naver_search_rate_per_second: float = float(os.environ.get("NAVER_SEARCH_RATE_PER_SECOND", "10"))
+    naver_search_daily_quota: int = int(os.environ.get("NAVER_SEARCH_DAILY_QUOTA", "25000"))
+    naver_search_max_wait_seconds: float = float(os.environ.get("NAVER_SEARCH_MAX_WAIT_SECONDS", "2"))
+    
+    # Shared HTTP clients (core/http_clients.py) - h2 패키지가 있으면 HTTP/2 사용
+    http2_enabled: bool = os.environ.get("HTTP2_ENABLED", "true").lower() == "true"
+    
+    # LLM model routing (작업 종류 -> 모델/최대 토큰/temperature)
+    # 환경변수 LLM_ROUTE_OVERRIDES='{"short": {"model": "sonar-pro", "temperature": 0.5}}' 형식(JSON)으로 작업별 덮어쓰기
+    # 긴 JSON을 만드는 작업(topic_summary/short/debate)은 잘리면 JSON이 깨져 재시도/dead-letter로 가므로
+    # benchmarks/route_ab.py의 완료 토큰 p99가 상한보다 충분히 낮다는 측정 전까지 max_tokens를 두지 않음
+    llm_default_route: LLMRoute = LLMRoute(model="sonar-pro")
+    llm_routes: Dict[str, LLMRoute] = {
+        "classify": LLMRoute(model="sonar", max_tokens=200, temperature=0.0),
+        "article_details": LLMRoute(model="sonar", max_tokens=400, temperature=0.2),
+        "topic_summary": LLMRoute(model="sonar-pro", temperature=0.3),
+        "short": LLMRoute(model="sonar", temperature=0.7),
+        "debate": LLMRoute(model="sonar-pro", temperature=0.7),
+    }
+    llm_route_overrides: Dict[str, LLMRoute] = {}
+    
+    # Pipeline retry / dead-letter
+    pipeline_max_attempts: int = int(os.environ.get("PIPELINE_MAX_ATTEMPTS", "5"))
+    pipeline_retry_base_seconds: int = int(os.environ.get("PIPELINE_RETRY_BASE_SECONDS", "300"))
+    pipeline_retry_max_seconds: int = int(os.environ.get("PIPELINE_RETRY_MAX_SECONDS", str(60 * 60 * 24)))
+    
+    # Local bias classifier (이 신뢰도 미만은 LLM으로 분류)
+    local_classifier_min_confidence: float = float(os.environ.get("LOCAL_CLASSIFIER_MIN_CONFIDENCE", "0.6"))
+    local_classifier_min_samples: int = int(os.environ.get("LOCAL_CLASSIFIER_MIN_SAMPLES", "3"))
+    
+    # Near-duplicate detection (SimHash) - 최대 해밍 거리는 밴드 인덱스가 보장하는 3 이하만 유효 (services/dedup.py에서 제한)
+    dedup_max_hamming: int = int(os.environ.get("DEDUP_MAX_HAMMING", "3"))
+    dedup_min_text_length: int = int(os.environ.get("DEDUP_MIN_TEXT_LENGTH", "80"))
+    
+    # Prompt context token budgets (단계별 기사 컨텍스트 토큰 예산)
+    # 환경변수 PROMPT_CONTEXT_BUDGET_OVERRIDES='{"debate": 3000}' 형식(JSON)으로 단계별 덮어쓰기
+    prompt_context_budgets: Dict[str, int] = {
+        "topic_summary": 2000,
+        "article_details": 500,
+        "short": 900,
+        "debate": 2000,
+        "classify": 300,
+    }
+    prompt_context_budget_overrides: Dict[str, int] = {}
+    default_prompt_context_budget: int = 1500
+    
+    # LLM call ledger - 배치 크기, flush 주기, 사용량 집계(/admin/llm-usage) 최대 기간(일)과 일자/단계별 지연시간 표본 수(최근 호출)
+    llm_ledger_batch_size: int = int(os.environ.get("LLM_LEDGER_BATCH_SIZE", "50"))
+    llm_ledger_flush_seconds: int = int(os.environ.get("LLM_LEDGER_FLUSH_SECONDS", "30"))
+    llm_usage_max_days: int = int(os.environ.get("LLM_USAGE_MAX_DAYS", "90"))
+    llm_usage_latency_samples: int = int(os.environ.get("LLM_USAGE_LATENCY_SAMPLES", "1000"))
+    # 모델별 100만 토큰당 단가(USD) [입력, 출력] - 비용 추정용
+    llm_token_prices: Dict[str, List[float]] = {
+        "sonar": [1.0, 1.0],
+        "sonar-pro": [3.0, 15.0],
+    }
+    
+    # On-demand profiling (X-Profile 헤더 + X-Cron-Secret, 파이프라인 단계 프로파일)
+    profile_dir: str = os.environ.get("PROFILE_DIR", "profiles")
+    profile_sample_interval_ms: float = float(os.environ.get("PROFILE_SAMPLE_INTERVAL_MS", "2"))
+    
+    # Query budget / N+1 detection (개발 모드에서 요청/단계별 쿼리 수와 반복 쿼리 출력)
+    query_debug: bool = os.environ.get("QUERY_DEBUG", "false").lower() == "true"
+    query_repeat_threshold: int = int(os.environ.get("QUERY_REPEAT_THRESHOLD", "3"))
+    
+    def llm_route(self, task: Optional[str]) -> LLMRoute:
+        """작업 종류별 LLM 라우트 (미지정/미등록 작업은 기본 라우트)"""
+        task = task or ""
+        if task in self.llm_route_overrides:
+            return self.llm_route_overrides[task]
+        return self.llm_routes.get(task, self.llm_default_route)
+    
+    def prompt_context_budget(self, stage: str) -> int:
+        """단계별 기사 컨텍스트 토큰 예산"""
+        if stage in self.prompt_context_budget_overrides:
+            return self.prompt_context_budget_overrides[stage]
+        return self.prompt_context_budgets.get(stage, self.default_prompt_context_budget)
+    
     @property
     def sqlalchemy_database_url(self) -> str:
         """Get SQLAlchemy-compatible database URL"""
@@ -2,14 +2,25 @@
 Database configuration and session management
 """
 import datetime
-from typing import Generator
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, ForeignKey, Float, event
+import json
+from typing import AsyncGenerator, Dict, Generator, Tuple
+from sqlalchemy import (
+    create_engine, Column, Integer, BigInteger, String, Text, DateTime, ForeignKey, Float,
+    Boolean, UniqueConstraint, Index, JSON, LargeBinary, event, inspect, text, literal, select
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker, Session
+from sqlalchemy.pool import NullPool
 
 from dotenv import load_dotenv
 import os
 
+from core.compression import CompressedText, dictionaries
+from core.metrics import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool, instrument_engine
+
 load_dotenv()
 
 # Database URL configuration
@@ -24,31 +35,106 @@ else:
         DB_URL_FROM_ENV = DB_URL_FROM_ENV.replace("postgres://", "postgresql://", 1)
     SQLALCHEMY_DATABASE_URL = DB_URL_FROM_ENV
 
+
+
+def to_async_url(url: str) -> Tuple[str, Dict]:
+    """
+    동기 DB URL을 비동기 드라이버 URL로 변환 (sqlite → aiosqlite, postgresql → asyncpg)
+
+    Returns:
+        (비동기 URL, connect_args) - asyncpg는 sslmode 쿼리 대신 ssl 인자를 사용
+    """
+    parsed = make_url(url)
+    if parsed.drivername.startswith("sqlite"):
+        return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False), {}
+
+    query = dict(parsed.query)
+    connect_args = {}
+    sslmode = query.pop("sslmode", None)
+    if sslmode and sslmode != "disable":
+        connect_args["ssl"] = sslmode
+    parsed = parsed.set(drivername="postgresql+asyncpg", query=query)
+    return parsed.render_as_string(hide_password=False), connect_args
+
+
+def _json_serializer(value) -> str:
+    # JSON 컬럼을 한글 그대로 저장 (SQLite는 텍스트로 저장되므로 \uXXXX 이스케이프만큼 커짐)
+    return json.dumps(value, ensure_ascii=False)
+
+
+# PostgreSQL은 JSONB(부분 추출/인덱스 가능), 그 외 DB는 JSON(SQLite는 텍스트 + JSON1 함수)
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _set_sqlite_pragma(dbapi_connection, connection_record):
+    # SQLite WAL 모드 활성화 (동시성 향상)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+ASYNC_DATABASE_URL, _async_connect_args = to_async_url(SQLALCHEMY_DATABASE_URL)
+
 # Create engine with proper settings
 if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
     engine = create_engine(
         SQLALCHEMY_DATABASE_URL,
-        connect_args={"check_same_thread": False}
+        connect_args={"check_same_thread": False},
+        json_serializer=_json_serializer,
+        poolclass=InstrumentedQueuePool
     )
-    
-    # SQLite WAL 모드 활성화 (동시성 향상)
-    @event.listens_for(engine, "connect")
-    def set_sqlite_pragma(dbapi_connection, connection_record):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA journal_mode=WAL")
-        cursor.execute("PRAGMA synchronous=NORMAL")
-        cursor.close()
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        json_serializer=_json_serializer,
+        poolclass=InstrumentedAsyncAdaptedQueuePool
+    )
+    event.listen(engine, "connect", _set_sqlite_pragma)
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragma)
 else:
     engine = create_engine(
         SQLALCHEMY_DATABASE_URL,
         pool_pre_ping=True,
-        pool_recycle=300
+        pool_recycle=300,
+        json_serializer=_json_serializer,
+        poolclass=InstrumentedQueuePool
+    )
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        connect_args=_async_connect_args,
+        pool_pre_ping=True,
+        pool_recycle=300,
+        json_serializer=_json_serializer,
+        poolclass=InstrumentedAsyncAdaptedQueuePool
     )
 
+# SQL 실행 횟수/시간 및 커넥션 풀 계측 (/metrics)
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 비동기 라우트용 세션 - 커밋 후 속성 접근 시 lazy load(I/O)가 일어나지 않도록 expire 안 함
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 
+def create_standalone_async_engine() -> AsyncEngine:
+    """
+    asyncio.run()으로 새 이벤트 루프를 여는 작업(파이프라인 스레드)용 비동기 엔진
+
+    공용 async_engine의 풀 커넥션은 API 서버 이벤트 루프에 묶여 있어(asyncpg) 다른 루프에서 쓸 수 없으므로,
+    커넥션을 풀에 남기지 않는 엔진을 따로 만들고 작업이 끝나면 dispose합니다.
+    """
+    standalone = create_async_engine(
+        ASYNC_DATABASE_URL,
+        connect_args=_async_connect_args,
+        json_serializer=_json_serializer,
+        poolclass=NullPool
+    )
+    instrument_engine(standalone.sync_engine)
+    return standalone
+
+
 def get_db() -> Generator[Session, None, None]:
     """Dependency to get database session"""
     db = SessionLocal()
@@ -58,6 +144,12 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get async database session (이벤트 루프에서 직접 실행되는 async 라우트용)"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 # --- Models ---
 class Source(Base):
     __tablename__ = "sources"
@@ -73,7 +165,8 @@ class Topic(Base):
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     ai_neutral_headline = Column(Text, nullable=True)
     ai_summary = Column(Text, nullable=True)
-    body = Column(Text, nullable=True)
+    body = Column(Text, nullable=True)  # 사용 안 함 - 토픽 본문은 기사에서 만듦 (services/content_service.py build_topic_body)
+    summary_input_hash = Column(String(64), nullable=True)  # 헤드라인/요약 생성에 사용된 입력 해시
     
     articles = relationship("Article", back_populates="topic")
     shorts = relationship("Short", back_populates="topic", uselist=False)
@@ -85,7 +178,7 @@ class Article(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String)
     url = Column(String, unique=True)
-    body = Column(Text)
+    body = Column(CompressedText)  # zstd 압축 저장 (core/compression.py)
     image_url = Column(Text, nullable=True)
     crawled_at = Column(DateTime, default=datetime.datetime.utcnow)
     
@@ -102,13 +195,57 @@ class Article(Base):
     ai_reporter_summary = Column(Text, nullable=True)
     sentiment = Column(String, nullable=True)
 
+    # 유사 중복 기사 탐지 (SimHash) - 중복이면 대표 기사를 가리킴
+    simhash = Column(BigInteger, nullable=True)
+    canonical_id = Column(Integer, ForeignKey("articles.id"), nullable=True, index=True)
+
+
+class TopicStats(Base):
+    """토픽별 기사 집계 (기사를 쓰는 파이프라인 단계가 갱신, services/topic_stats.py)"""
+    __tablename__ = "topic_stats"
+    # 인기 토픽 상위 N개를 인덱스 역순 스캔으로 조회
+    __table_args__ = (Index("ix_topic_stats_trending_score", "trending_score", "topic_id"),)
+    topic_id = Column(Integer, ForeignKey("topics.id"), primary_key=True)
+    article_count = Column(Integer, default=0, nullable=False)
+    category = Column(String, nullable=True)  # 가장 많은 기사 카테고리 (원본 코드)
+    thumb_url = Column(Text, nullable=True)
+    left_count = Column(Integer, default=0, nullable=False)
+    center_count = Column(Integer, default=0, nullable=False)
+    right_count = Column(Integer, default=0, nullable=False)
+    unknown_count = Column(Integer, default=0, nullable=False)
+    representative_article_id = Column(Integer, ForeignKey("articles.id"), nullable=True)
+    last_article_at = Column(DateTime, nullable=True, index=True)
+    # 감쇠 적용 기사 수의 log2 (기준 시각 고정 - 시간이 지나도 다시 계산할 필요 없음, services/trending.py)
+    trending_score = Column(Float, nullable=True)
+    trending_bucket_at = Column(DateTime, nullable=True)  # 집계 기간 안의 마지막 버킷
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+
+
+class TopicTrendBucket(Base):
+    """토픽별 시간 단위 기사 수 (기사가 토픽에 배정될 때 증가, services/trending.py)"""
+    __tablename__ = "topic_trend_buckets"
+    topic_id = Column(Integer, ForeignKey("topics.id"), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True, index=True)
+    article_count = Column(Integer, default=0, nullable=False)
+
+
+class ArticleSimhashBand(Base):
+    """SimHash 밴드 인덱스 (유사 중복 후보 조회용)"""
+    __tablename__ = "article_simhash_bands"
+    __table_args__ = (Index("ix_article_simhash_bands_band_value", "band", "value"),)
+    id = Column(Integer, primary_key=True)
+    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, index=True)
+    band = Column(Integer, nullable=False)
+    value = Column(Integer, nullable=False)
+
 
 class Short(Base):
     __tablename__ = "shorts"
     id = Column(Integer, primary_key=True, index=True)
     topic_id = Column(Integer, ForeignKey("topics.id"), unique=True)
     topic = relationship("Topic", back_populates="shorts")
-    content_json = Column(Text, nullable=False)
+    content_json = Column(JSONDocument, nullable=False)
+    input_hash = Column(String(64), nullable=True)
 
 
 class Debate(Base):
@@ -117,7 +254,8 @@ class Debate(Base):
     id = Column(Integer, primary_key=True, index=True)
     topic_id = Column(Integer, ForeignKey("topics.id"), unique=True)
     topic = relationship("Topic", back_populates="debates")
-    content_json = Column(Text, nullable=False)
+    content_json = Column(JSONDocument, nullable=False)  # {topic_headline, debaters, rounds[], conclusion}
+    input_hash = Column(String(64), nullable=True)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
 
@@ -134,9 +272,151 @@ class User(Base):
     bias_filter_level = Column(Integer, default=5)
 
 
+class PipelineFailure(Base):
+    """파이프라인 단계별 실패 기록 (재시도 백오프 / 데드레터)"""
+    __tablename__ = "pipeline_failures"
+    __table_args__ = (UniqueConstraint("stage", "item_id", name="uq_pipeline_failures_stage_item"),)
+    id = Column(Integer, primary_key=True, index=True)
+    stage = Column(String, nullable=False, index=True)
+    item_id = Column(Integer, nullable=False, index=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    next_eligible_at = Column(DateTime, nullable=True, index=True)
+    status = Column(String, default="retrying", nullable=False, index=True)  # retrying | dead
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+
+
+class LLMCall(Base):
+    """LLM 호출 원장 (추가 전용)"""
+    __tablename__ = "llm_calls"
+    id = Column(Integer, primary_key=True, index=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
+    stage = Column(String, nullable=True, index=True)
+    topic_id = Column(Integer, nullable=True)
+    article_id = Column(Integer, nullable=True)
+    model = Column(String, nullable=True)
+    prompt_tokens = Column(Integer, default=0)
+    completion_tokens = Column(Integer, default=0)
+    latency_ms = Column(Float, default=0.0)
+    cache_hit = Column(Boolean, default=False)
+    error_class = Column(String, nullable=True)
+
+
+class CompressionDictionary(Base):
+    """zstd 공유 압축 사전 (services/body_compression.py로 학습, 가장 최근 사전으로 압축)"""
+    __tablename__ = "compression_dictionaries"
+    id = Column(Integer, primary_key=True)
+    dict_id = Column(BigInteger, unique=True, nullable=False)  # zstd 프레임 헤더에 기록되는 사전 id
+    data = Column(LargeBinary, nullable=False)
+    sample_count = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+
+class ArchivedTopic(Base):
+    """보관된 토픽 색인 (토픽 묶음은 보관 파일의 zstd 프레임, services/archive.py)"""
+    __tablename__ = "archived_topics"
+    topic_id = Column(Integer, primary_key=True, autoincrement=False)
+    created_at = Column(DateTime, nullable=True)
+    last_article_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
+    headline = Column(Text, nullable=True)
+    article_count = Column(Integer, default=0, nullable=False)
+    file_name = Column(String, nullable=False)  # 보관 디렉터리 기준 상대 경로
+    frame_offset = Column(BigInteger, nullable=False)
+    frame_length = Column(Integer, nullable=False)
+
+
+class ChangeEvent(Base):
+    """파이프라인 변경 이벤트 (LISTEN/NOTIFY가 없는 DB에서 쓰는 이벤트 버스 테이블, services/event_bus.py)"""
+    __tablename__ = "change_events"
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
+    kind = Column(String, nullable=False)
+    payload = Column(Text, nullable=False)
+
+
+def _load_compression_dictionaries():
+    with engine.connect() as conn:
+        return conn.execute(
+            select(CompressionDictionary.dict_id, CompressionDictionary.data).order_by(CompressionDictionary.id)
+        ).all()
+
+
+dictionaries.set_loader(_load_compression_dictionaries)
+
+
 def create_db_tables(checkfirst: bool = False):
     """Create all database tables"""
     Base.metadata.create_all(bind=engine, checkfirst=checkfirst)
+    add_missing_columns()
+    convert_column_types()
+
+
+def add_missing_columns():
+    """
+    기존 테이블에 모델에 새로 추가된 컬럼과 인덱스를 반영 (간이 마이그레이션)
+
+    create_all은 이미 존재하는 테이블을 변경하지 않으므로,
+    nullable 컬럼 추가(ALTER TABLE ... ADD COLUMN)와 인덱스 생성만 처리합니다.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            
+            existing_columns = {col["name"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                
+                ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(dialect=engine.dialect)}"
+                if column.default is not None and column.default.is_scalar:
+                    default_sql = literal(column.default.arg).compile(
+                        dialect=engine.dialect, compile_kwargs={"literal_binds": True}
+                    )
+                    ddl += f" DEFAULT {default_sql}"
+                conn.execute(text(ddl))
+                print(f">>> 컬럼 추가: {table.name}.{column.name}")
+            
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+
+def convert_column_types():
+    """
+    텍스트로 만들어진 컬럼을 모델 타입으로 변환 (PostgreSQL 간이 마이그레이션)
+
+    - JSON 컬럼 → JSONB
+    - 압축 텍스트 컬럼(CompressedText) → BYTEA (기존 값은 UTF-8 bytes - 압축 전 값으로 그대로 읽힘)
+    SQLite는 컬럼 타입과 관계없이 값을 저장하므로 기존 값을 그대로 읽을 수 있어 변환하지 않습니다.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_types = {col["name"]: col["type"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                existing_type = existing_types.get(column.name)
+                if existing_type is None:
+                    continue
+                if isinstance(column.type, JSON) and not isinstance(existing_type, JSONB):
+                    target, using = "JSONB", f"{column.name}::jsonb"
+                elif isinstance(column.type, CompressedText) and not isinstance(existing_type, LargeBinary):
+                    target, using = "BYTEA", f"convert_to({column.name}, 'UTF8')"
+                else:
+                    continue
+                conn.execute(text(
+                    f"ALTER TABLE {table.name} ALTER COLUMN {column.name} TYPE {target} USING {using}"
+                ))
+                print(f">>> 컬럼 {target} 변환: {table.name}.{column.name}")
 
 
 if __name__ == "__main__":
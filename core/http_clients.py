@@ -0,0 +1,116 @@
+"""
+HTTP client registry - 외부 서비스(upstream)별 공유 httpx 클라이언트
+
+호출마다 클라이언트를 만들면 매번 TCP/TLS 연결을 새로 맺으므로, upstream별로 keep-alive
+커넥션 풀을 가진 클라이언트를 하나씩 두고 재사용합니다.
+
+- async 클라이언트: FastAPI lifespan에서 생성/종료 (async 라우트, OAuth 콜백)
+- sync 클라이언트: 처음 사용할 때 생성 (크롤러, 파이프라인 스크립트), 앱 종료 시 함께 닫음
+"""
+import importlib.util
+import threading
+from dataclasses import dataclass, field
+from typing import Dict
+
+import httpx
+
+from core.config import settings
+
+BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+
+
+@dataclass(frozen=True)
+class Upstream:
+    timeout: float
+    connect_timeout: float = 3.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+# upstream 이름 -> 타임아웃/커넥션 제한
+UPSTREAMS: Dict[str, Upstream] = {
+    # 네이버 뉴스 랭킹/기사 페이지 (크롤러) - 차단을 피하려 동시 연결 수를 낮게 유지
+    "naver_news": Upstream(timeout=5.0, max_connections=8, max_keepalive_connections=8,
+                           headers={"User-Agent": BROWSER_USER_AGENT}),
+    # 네이버 검색 OpenAPI
+    "naver_openapi": Upstream(timeout=5.0, max_connections=20, max_keepalive_connections=10),
+    # 소셜 로그인 토큰 교환/사용자 정보 조회
+    "naver_oauth": Upstream(timeout=10.0, max_connections=10, max_keepalive_connections=5),
+    "google_oauth": Upstream(timeout=10.0, max_connections=10, max_keepalive_connections=5),
+}
+
+
+def http2_available() -> bool:
+    return settings.http2_enabled and importlib.util.find_spec("h2") is not None
+
+
+def _client_kwargs(upstream: Upstream) -> Dict:
+    return {
+        "timeout": httpx.Timeout(upstream.timeout, connect=upstream.connect_timeout),
+        "limits": httpx.Limits(
+            max_connections=upstream.max_connections,
+            max_keepalive_connections=upstream.max_keepalive_connections,
+            keepalive_expiry=upstream.keepalive_expiry,
+        ),
+        "headers": upstream.headers,
+        "http2": http2_available(),
+        "follow_redirects": True,
+    }
+
+
+class HTTPClientRegistry:
+    """upstream별 공유 httpx.Client / httpx.AsyncClient"""
+
+    def __init__(self, upstreams: Dict[str, Upstream]):
+        self.upstreams = upstreams
+        self._async_clients: Dict[str, httpx.AsyncClient] = {}
+        self._sync_clients: Dict[str, httpx.Client] = {}
+        self._lock = threading.Lock()
+
+    def _upstream(self, name: str) -> Upstream:
+        if name not in self.upstreams:
+            raise KeyError(f"등록되지 않은 upstream입니다: {name}")
+        return self.upstreams[name]
+
+    def start(self) -> None:
+        """async 클라이언트 생성 (lifespan 시작 시 - 서버 이벤트 루프에서 사용)"""
+        for name, upstream in self.upstreams.items():
+            if name not in self._async_clients:
+                self._async_clients[name] = httpx.AsyncClient(**_client_kwargs(upstream))
+
+    def get_async(self, name: str) -> httpx.AsyncClient:
+        upstream = self._upstream(name)
+        client = self._async_clients.get(name)
+        if client is None or client.is_closed:
+            client = self._async_clients[name] = httpx.AsyncClient(**_client_kwargs(upstream))
+        return client
+
+    def get_sync(self, name: str) -> httpx.Client:
+        upstream = self._upstream(name)
+        with self._lock:
+            client = self._sync_clients.get(name)
+            if client is None or client.is_closed:
+                client = self._sync_clients[name] = httpx.Client(**_client_kwargs(upstream))
+            return client
+
+    def close(self) -> None:
+        """sync 클라이언트 종료"""
+        with self._lock:
+            clients, self._sync_clients = list(self._sync_clients.values()), {}
+        for client in clients:
+            client.close()
+
+    async def aclose(self) -> None:
+        """async/sync 클라이언트 모두 종료 (lifespan 종료 시)"""
+        clients, self._async_clients = list(self._async_clients.values()), {}
+        for client in clients:
+            await client.aclose()
+        self.close()
+
+
+http_clients = HTTPClientRegistry(UPSTREAMS)
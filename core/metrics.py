@@ -0,0 +1,197 @@
+"""
+Prometheus metrics - 요청/DB/커넥션 풀/캐시 계측
+"""
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+)
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 라우트 템플릿을 찾지 못한 요청 (404 등) - 원본 경로를 라벨로 쓰지 않음
+UNMATCHED_ROUTE = "unmatched"
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "요청 처리 시간",
+    ["method", "route", "status"]
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "처리 중인 요청 수",
+    ["method"]
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "응답 본문 크기",
+    ["method", "route"],
+    buckets=(100, 1_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000)
+)
+REQUEST_SQL_STATEMENTS = Histogram(
+    "http_request_sql_statements", "요청당 SQL 실행 횟수",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+)
+REQUEST_SQL_SECONDS = Histogram(
+    "http_request_sql_duration_seconds", "요청당 SQL 실행 시간 합계",
+    ["method", "route"]
+)
+SQL_STATEMENTS = Counter("db_sql_statements_total", "전체 SQL 실행 횟수")
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds", "커넥션 풀 대기 시간",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30)
+)
+POOL_CHECKED_OUT = Gauge("db_pool_checked_out_connections", "사용 중인 커넥션 수")
+CACHE_REQUESTS = Counter(
+    "app_cache_requests_total", "캐시 조회 수",
+    ["cache", "result"]
+)
+CACHE_HIT_RATIO = Gauge(
+    "app_cache_hit_ratio", "프로세스 시작 이후 캐시 적중률",
+    ["cache"]
+)
+STREAM_CONNECTIONS = Gauge("keyword_watch_connections", "키워드 알림 스트림(SSE) 연결 수")
+STREAM_EVENTS = Counter(
+    "keyword_watch_events_total", "키워드 알림 이벤트 수 (delivered: 큐에 적재, dropped: 느린 연결이라 버림)",
+    ["result"]
+)
+BUS_EVENTS = Counter(
+    "event_bus_events_total", "변경 이벤트 수 (published: 발행, received: 다른 프로세스에서 수신)",
+    ["direction", "kind"]
+)
+
+_cache_counts: Dict[str, Dict[str, int]] = {}
+# 풀 사용량을 합산할 엔진 목록 (동기/비동기 엔진)
+_instrumented_engines: List = []
+
+# 현재 요청의 SQL 통계 {"statements": int, "seconds": float} (요청 밖이면 None)
+_request_sql: ContextVar[Optional[Dict]] = ContextVar("request_sql", default=None)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """캐시 조회 결과 기록 (적중/미적중 카운터 및 적중률)"""
+    counts = _cache_counts.setdefault(cache, {"hit": 0, "miss": 0})
+    result = "hit" if hit else "miss"
+    counts[result] += 1
+    CACHE_REQUESTS.labels(cache=cache, result=result).inc()
+    CACHE_HIT_RATIO.labels(cache=cache).set(counts["hit"] / (counts["hit"] + counts["miss"]))
+
+
+class _CheckoutTimingMixin:
+    """커넥션 체크아웃 대기 시간 기록"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    """커넥션 체크아웃 대기 시간을 기록하는 QueuePool"""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    """커넥션 체크아웃 대기 시간을 기록하는 비동기 엔진용 풀"""
+
+
+def _checked_out_connections() -> int:
+    return sum(
+        engine.pool.checkedout() for engine in _instrumented_engines
+        if hasattr(engine.pool, "checkedout")
+    )
+
+
+def instrument_engine(engine) -> None:
+    """
+    엔진에 SQL 실행 횟수/시간 및 풀 사용량 계측 이벤트 등록
+
+    비동기 엔진은 engine.sync_engine을 넘깁니다.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        SQL_STATEMENTS.inc()
+        stats = _request_sql.get()
+        if stats is not None:
+            stats["statements"] += 1
+            stats["seconds"] += elapsed
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started"):
+            conn.info["query_started"].pop()
+
+    _instrumented_engines.append(engine)
+    POOL_CHECKED_OUT.set_function(_checked_out_connections)
+
+
+def _route_template(scope) -> str:
+    """라우팅이 끝난 요청의 라우트 템플릿 (예: /topics/{topic_id})"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class PrometheusMiddleware:
+    """
+    라우트별 지연시간/응답 크기/SQL 통계 및 처리 중 요청 수 기록 (ASGI 미들웨어)
+
+    스트리밍 응답(SSE)도 본문 전송이 끝날 때까지를 한 요청으로 측정합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        sql_stats = {"statements": 0, "seconds": 0.0}
+        state = {"status": 500, "body_size": 0, "done": False}
+        in_flight = REQUESTS_IN_FLIGHT.labels(method=method)
+        started = time.perf_counter()
+
+        def finish():
+            # 응답 전송 완료 시점에 기록 (이후 실행되는 BackgroundTasks 시간은 제외)
+            if state["done"]:
+                return
+            state["done"] = True
+            in_flight.dec()
+            route = _route_template(scope)
+            REQUEST_LATENCY.labels(method=method, route=route, status=state["status"]).observe(
+                time.perf_counter() - started
+            )
+            RESPONSE_SIZE.labels(method=method, route=route).observe(state["body_size"])
+            REQUEST_SQL_STATEMENTS.labels(method=method, route=route).observe(sql_stats["statements"])
+            REQUEST_SQL_SECONDS.labels(method=method, route=route).observe(sql_stats["seconds"])
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                state["body_size"] += len(message.get("body", b""))
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finish()
+
+        token = _request_sql.set(sql_stats)
+        in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            finish()
+            _request_sql.reset(token)
+
+
+def render_metrics():
+    """Prometheus 텍스트 포맷 (본문, Content-Type)"""
+    return generate_latest(), CONTENT_TYPE_LATEST
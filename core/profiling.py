@@ -0,0 +1,199 @@
+"""
+On-demand profiling - 요청 단위 샘플링 프로파일(flame graph) / 파이프라인 단계 cProfile
+
+비활성 상태에서는 요청 헤더/쿼리 문자열 확인 외에 추가 비용이 없습니다.
+"""
+import cProfile
+import datetime
+import hmac
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable, List, Optional
+from urllib.parse import parse_qs
+
+from starlette.responses import JSONResponse
+
+from core.config import settings
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROFILE_HEADER = b"x-profile"
+PROFILE_QUERY_PARAM = "_profile"
+SECRET_HEADER = b"x-cron-secret"
+PROFILE_EXTENSIONS = (".folded", ".prof")
+
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def get_profile_dir() -> str:
+    path = settings.profile_dir
+    if not os.path.isabs(path):
+        path = os.path.join(PROJECT_ROOT, path)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _profile_path(label: str, extension: str) -> str:
+    stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    name = _UNSAFE_NAME.sub("_", label).strip("_") or "root"
+    return os.path.join(get_profile_dir(), f"{stamp}_{name}{extension}")
+
+
+def list_profiles() -> List[dict]:
+    """저장된 프로파일 파일 목록 (최신순)"""
+    directory = get_profile_dir()
+    profiles = []
+    for name in os.listdir(directory):
+        if not name.endswith(PROFILE_EXTENSIONS):
+            continue
+        stat = os.stat(os.path.join(directory, name))
+        profiles.append({
+            "name": name,
+            "size_bytes": stat.st_size,
+            "created_at": datetime.datetime.fromtimestamp(stat.st_mtime),
+        })
+    return sorted(profiles, key=lambda p: p["name"], reverse=True)
+
+
+def resolve_profile(name: str) -> Optional[str]:
+    """프로파일 이름 -> 파일 경로 (디렉터리 밖 경로나 없는 파일이면 None)"""
+    if os.path.basename(name) != name or not name.endswith(PROFILE_EXTENSIONS):
+        return None
+    path = os.path.join(get_profile_dir(), name)
+    return path if os.path.isfile(path) else None
+
+
+def _is_project_file(filename: str) -> bool:
+    return (
+        filename.startswith(PROJECT_ROOT)
+        and "site-packages" not in filename
+        and not filename.endswith("profiling.py")
+    )
+
+
+class StackSampler:
+    """
+    모든 스레드의 스택을 주기적으로 샘플링해 folded stack(flame graph 입력)으로 집계
+
+    동기 엔드포인트는 스레드풀에서 실행되므로 이벤트 루프 스레드만 보는 프로파일러로는
+    잡히지 않습니다. 프로젝트 코드가 포함된 스택만 남기며, 동시에 처리 중인 다른
+    요청의 스택도 함께 섞일 수 있습니다.
+    """
+
+    def __init__(self, interval_ms: Optional[float] = None):
+        self.interval = (interval_ms or settings.profile_sample_interval_ms) / 1000
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.sample_count += 1
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                stack = []
+                in_project = False
+                while frame is not None:
+                    code = frame.f_code
+                    in_project = in_project or _is_project_file(code.co_filename)
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                if in_project:
+                    self.samples[";".join(reversed(stack))] += 1
+
+    def write(self, path: str) -> str:
+        """folded stack 형식 저장 (speedscope, flamegraph.pl 등에서 열 수 있음)"""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+
+def profile_call(label: str, func: Callable, *args, **kwargs):
+    """
+    함수 1회 실행을 cProfile로 측정하고 pstats 파일 저장
+
+    Returns:
+        (함수 반환값, 저장된 .prof 경로)
+    """
+    profiler = cProfile.Profile()
+    path = _profile_path(label, ".prof")
+    try:
+        result = profiler.runcall(func, *args, **kwargs)
+    finally:
+        profiler.dump_stats(path)
+        print(f"  . [profile] {label}: {path}")
+    return result, path
+
+
+def _header(scope, name: bytes) -> Optional[bytes]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
+
+
+class ProfilingMiddleware:
+    """
+    X-Profile 헤더 또는 ?_profile=1 요청만 샘플링 프로파일러로 감싸는 ASGI 미들웨어
+
+    X-Cron-Secret 헤더가 일치해야 하며, 결과 파일 이름은 X-Profile-File 응답 헤더로
+    돌려줍니다 (GET /admin/profiles/{name}으로 다운로드).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    def _requested(self, scope) -> bool:
+        if _header(scope, PROFILE_HEADER) is not None:
+            return True
+        query = scope.get("query_string", b"")
+        return PROFILE_QUERY_PARAM.encode() in query and PROFILE_QUERY_PARAM in parse_qs(query.decode("latin-1"))
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        secret = (_header(scope, SECRET_HEADER) or b"").decode("latin-1")
+        if not settings.cron_secret_key or not hmac.compare_digest(secret, settings.cron_secret_key):
+            response = JSONResponse({"detail": "프로파일링 권한이 없습니다."}, status_code=403)
+            await response(scope, receive, send)
+            return
+
+        path = _profile_path(f"{scope['method']}_{scope['path']}", ".folded")
+        sampler = StackSampler()
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-file", os.path.basename(path).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop()
+            sampler.write(path)
+            print(
+                f"  . [profile] {scope['method']} {scope['path']}: "
+                f"{(time.perf_counter() - started) * 1000:.1f}ms, {sampler.sample_count} samples -> {path}"
+            )
@@ -0,0 +1,52 @@
+"""
+pytest plugin - API 라우터별 쿼리 예산 검사
+
+루트 conftest.py에서 등록합니다 (tests/ 참고).
+
+    pytest_plugins = ["core.pytest_query_budget"]
+
+사용 예:
+
+    def test_topic_view(client, api_query_budget):
+        client.get("/topics/1")            # 테스트 종료 시 라우터 예산/반복 쿼리 검사
+
+    def test_stage(query_budget):
+        with query_budget(10):
+            generate_shorts()
+"""
+from contextlib import contextmanager
+
+import pytest
+
+from core.query_budget import QueryCounter, start_collecting, stop_collecting
+
+
+@pytest.fixture
+def api_query_budget():
+    """
+    테스트 중 처리된 모든 API 요청을 core.query_budget.ROUTER_QUERY_BUDGETS와 비교
+
+    예산을 넘거나 같은 형태의 쿼리가 반복(N+1 의심)된 요청이 있으면 실패합니다.
+    """
+    reports = start_collecting()
+    try:
+        yield reports
+    finally:
+        stop_collecting()
+    violations = [report for report in reports if report.over_budget or report.repeated]
+    if violations:
+        pytest.fail("쿼리 예산 초과:\n" + "\n".join(str(report) for report in violations))
+
+
+@pytest.fixture
+def query_budget():
+    """with 블록 안의 쿼리 수가 max_queries 이하이고 반복 쿼리가 없는지 검사"""
+
+    @contextmanager
+    def check(max_queries: int, label: str = ""):
+        with QueryCounter(label) as counter:
+            yield counter
+        assert counter.count <= max_queries, f"{counter.report()} (budget {max_queries})"
+        assert not counter.repeated(), counter.report()
+
+    return check
@@ -0,0 +1,202 @@
+"""
+Query budget - 요청/파이프라인 단계별 SQL 실행 횟수 집계 및 N+1(반복 쿼리) 탐지
+
+개발 모드(QUERY_DEBUG=true)나 테스트(core.pytest_query_budget)에서만 활성화되며,
+비활성 상태에서는 요청마다 플래그 확인 외에 추가 비용이 없습니다.
+"""
+import re
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+
+from core.config import settings
+from core.database import async_engine, engine
+
+# API 라우터(prefix)별 요청당 최대 쿼리 수
+ROUTER_QUERY_BUDGETS: Dict[str, int] = {
+    "/topics": 2,
+    "/topic": 2,
+    "/articles": 2,
+    "/debate": 3,
+    "/shorts": 2,
+    "/users": 3,
+    "/admin": 4,
+    "/auth": 3,
+    "/feed": 2,
+}
+DEFAULT_QUERY_BUDGET = 5
+
+_IN_LIST = re.compile(r"\bIN\s*\(\s*(?:[?]|%s|%\(\w+\)s|:\w+)(?:\s*,\s*(?:[?]|%s|%\(\w+\)s|:\w+))*\s*\)", re.I)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+\b")
+_SPACE = re.compile(r"\s+")
+
+# 현재 활성화된 카운터들 (중첩 가능)
+_active_counters: ContextVar[Tuple["QueryCounter", ...]] = ContextVar("active_query_counters", default=())
+_listener_lock = threading.Lock()
+_listener_installed = False
+
+
+def normalize_statement(statement: str) -> str:
+    """SQL 문의 형태(shape) - 리터럴/IN 목록 길이 차이를 무시"""
+    statement = _STRING.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    statement = _IN_LIST.sub("IN (?)", statement)
+    return _SPACE.sub(" ", statement).strip()
+
+
+def _on_after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    counters = _active_counters.get()
+    if not counters:
+        return
+    shape = normalize_statement(statement)
+    for counter in counters:
+        counter.record(shape)
+
+
+def _install_listener() -> None:
+    global _listener_installed
+    with _listener_lock:
+        if not _listener_installed:
+            event.listen(engine, "after_cursor_execute", _on_after_cursor_execute)
+            event.listen(async_engine.sync_engine, "after_cursor_execute", _on_after_cursor_execute)
+            _listener_installed = True
+
+
+class QueryCounter:
+    """
+    with 블록 안에서 실행된 SQL 집계
+
+        with QueryCounter() as counter:
+            ...
+        counter.count, counter.repeated()
+    """
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.count = 0
+        self.shapes: Counter = Counter()
+        self._token = None
+        _install_listener()
+
+    def record(self, shape: str) -> None:
+        self.count += 1
+        self.shapes[shape] += 1
+
+    def repeated(self, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        threshold회 이상 반복된 SELECT 형태 (N+1 의심)
+
+        항목별 처리 후 쓰기(INSERT/UPDATE/DELETE)는 배치 작업에서 정상이므로 제외합니다.
+        """
+        threshold = threshold or settings.query_repeat_threshold
+        return [
+            (shape, n) for shape, n in self.shapes.most_common()
+            if n >= threshold and shape[:6].upper() == "SELECT"
+        ]
+
+    def report(self, threshold: Optional[int] = None) -> str:
+        lines = [f"[query] {self.label}: {self.count} queries"]
+        for shape, n in self.repeated(threshold):
+            lines.append(f"  !! {n}x {shape[:200]}")
+        return "\n".join(lines)
+
+    def __enter__(self) -> "QueryCounter":
+        self._token = _active_counters.set(_active_counters.get() + (self,))
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _active_counters.reset(self._token)
+
+
+def budget_for(route_path: str) -> int:
+    """라우트 경로가 속한 라우터의 쿼리 예산 (가장 긴 prefix 기준)"""
+    matches = [
+        prefix for prefix in ROUTER_QUERY_BUDGETS
+        if route_path == prefix or route_path.startswith(prefix + "/")
+    ]
+    if not matches:
+        return DEFAULT_QUERY_BUDGET
+    return ROUTER_QUERY_BUDGETS[max(matches, key=len)]
+
+
+@dataclass
+class RequestQueryReport:
+    method: str
+    route: str
+    count: int
+    budget: int
+    repeated: List[Tuple[str, int]] = field(default_factory=list)
+
+    @property
+    def over_budget(self) -> bool:
+        return self.count > self.budget
+
+    def __str__(self) -> str:
+        text = f"{self.method} {self.route}: {self.count} queries (budget {self.budget})"
+        for shape, n in self.repeated:
+            text += f"\n  !! {n}x {shape[:200]}"
+        return text
+
+
+# 테스트에서 요청별 결과를 수집할 목록 (None이면 수집 안 함)
+_collected_reports: Optional[List[RequestQueryReport]] = None
+
+
+def start_collecting() -> List[RequestQueryReport]:
+    global _collected_reports
+    _collected_reports = []
+    return _collected_reports
+
+
+def stop_collecting() -> None:
+    global _collected_reports
+    _collected_reports = None
+
+
+class QueryBudgetMiddleware:
+    """
+    요청별 쿼리 수를 라우터 예산과 비교 (ASGI 미들웨어)
+
+    QUERY_DEBUG=true면 예산 초과/반복 쿼리를 로그로 출력하고,
+    테스트 수집 중이면 결과를 모아 pytest fixture가 검사합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or (not settings.query_debug and _collected_reports is None):
+            await self.app(scope, receive, send)
+            return
+
+        counter = QueryCounter(f"{scope['method']} {scope['path']}")
+        snapshot = {}
+
+        async def send_wrapper(message):
+            await send(message)
+            # 응답 전송 완료 시점까지만 집계 (이후 실행되는 BackgroundTasks 제외)
+            if message["type"] == "http.response.body" and not message.get("more_body", False) and not snapshot:
+                snapshot.update(count=counter.count, repeated=counter.repeated())
+
+        with counter:
+            await self.app(scope, receive, send_wrapper)
+        if not snapshot:
+            snapshot.update(count=counter.count, repeated=counter.repeated())
+
+        route = getattr(scope.get("route"), "path", None) or scope["path"]
+        report = RequestQueryReport(
+            method=scope["method"],
+            route=route,
+            count=snapshot["count"],
+            budget=budget_for(route),
+            repeated=snapshot["repeated"]
+        )
+        if _collected_reports is not None:
+            _collected_reports.append(report)
+        if settings.query_debug and (report.over_budget or report.repeated):
+            print(f"!!! [query budget] {report}")
@@ -1,7 +1,11 @@
-import requests
 import time
 from bs4 import BeautifulSoup
+from core.config import settings
+from core.http_clients import http_clients
 from core.database import SessionLocal, Source, Article 
+from services import dedup
+from services.event_bus import event_bus, ARTICLES_CREATED, TOPICS_UPDATED
+from services.topic_stats import refresh_topic_stats
 
 BIAS_MAP = {
     "경향신문": "left", "한겨레": "left", "오마이뉴스": "left",
@@ -16,9 +20,9 @@ def get_article_content(article_url):
     """
     기사 URL에서 본문, 이미지, 기자이름, 카테고리를 추출합니다.
     """
-    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
     try:
-        response = requests.get(article_url, headers=headers, timeout=5)
+        # 공유 클라이언트 (keep-alive 재사용, 브라우저 User-Agent 기본 적용)
+        response = http_clients.get_sync("naver_news").get(article_url)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
         
@@ -69,13 +73,10 @@ def get_article_content(article_url):
         return "본문 수집 오류", None, None, None
 
 def get_ranking_news_items():
-    url = "https://news.naver.com/main/ranking/popularDay.naver"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+    url = f"{settings.naver_news_base_url}/main/ranking/popularDay.naver"
     
     try:
-        response = requests.get(url, headers=headers, timeout=5)
+        response = http_clients.get_sync("naver_news").get(url)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser')
         
@@ -94,7 +95,7 @@ def get_ranking_news_items():
                     link = first_article['href']
                     
                     if not link.startswith('http'):
-                        link = "https://news.naver.com" + link
+                        link = settings.naver_news_base_url + link
                         
                     news_items.append({
                         'title': title,
@@ -124,6 +125,8 @@ def run_crawl_and_save_to_db():
     print(f"\n>>> 2. 수집된 URL 목록에서 상세 정보 추출 중... (총 {len(news_list)}개)")
     
     count = 0
+    new_article_ids = []
+    enriched_topic_ids = set()
     try:
         for news_data in news_list:
             existing_article = db.query(Article).filter(Article.url == news_data['webUrl']).first()
@@ -135,6 +138,7 @@ def run_crawl_and_save_to_db():
                      _, _, rep_name, cat = get_article_content(news_data['webUrl'])
                      if rep_name: existing_article.reporter_name = rep_name
                      if cat: existing_article.category = cat
+                     if existing_article.topic_id: enriched_topic_ids.add(existing_article.topic_id)
                      print(f"  . [정보보강] {news_data['title'][:10]}... (기자: {rep_name})")
                      count += 1
                 continue
@@ -168,11 +172,26 @@ def run_crawl_and_save_to_db():
                 topic_id=None
             )
             db.add(article)
+            db.flush()
+            
+            # 유사 중복(통신사 전재 등)이면 대표 기사에 연결
+            canonical_id = dedup.index_article(db, article)
+            db.flush()
+            new_article_ids.append(article.id)
+            if canonical_id:
+                print(f"    = 중복 기사 → 대표 기사 {canonical_id}")
             count += 1
-            time.sleep(0.5) 
+            time.sleep(settings.crawl_request_delay_seconds)
             
         db.commit() 
         print(f"\n>>> 3. 저장 완료! (신규/업데이트: {count}건)")
+        if enriched_topic_ids:
+            # 정보보강으로 카테고리가 바뀐 토픽의 집계 갱신
+            refresh_topic_stats(db, enriched_topic_ids)
+            db.commit()
+            event_bus.publish(TOPICS_UPDATED, enriched_topic_ids)
+        if new_article_ids:
+            event_bus.publish(ARTICLES_CREATED, new_article_ids)
         
     except Exception as e:
         db.rollback()
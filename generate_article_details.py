@@ -1,8 +1,10 @@
 import os
-import json
-from openai import OpenAI
 from dotenv import load_dotenv
 from core.database import SessionLocal, Article, Source
+from services import dead_letter, dedup
+from services.stages import STAGE_ARTICLE_DETAILS
+from services.prompt_builder import ArticleSection, build_context, record_prompt_tokens
+from services.ai_client import get_ai_client
 
 # Load environment variables
 load_dotenv()
@@ -12,20 +14,31 @@ if not PPLX_API_KEY:
     print("!!! 오류: PPLX_API_KEY 환경 변수가 없습니다.")
     exit()
 
-client = OpenAI(api_key=PPLX_API_KEY, base_url="https://api.perplexity.ai")
+ai_client = get_ai_client()
 
 def generate_article_details():
     db = SessionLocal()
-    articles = db.query(Article).filter(Article.ai_alternative_title == None).limit(30).all()
+    dedup.propagate_canonical_analysis(db)
+    query = db.query(Article).filter(
+        Article.ai_alternative_title == None,
+        Article.canonical_id == None
+    )
+    articles = dead_letter.filter_eligible(
+        query, dead_letter.STAGE_ARTICLE_DETAILS, Article.id
+    ).limit(30).all()
     
     for article in articles:
+        article_id = article.id
         press_name = article.source.name if article.source else "Unknown"
+        body_text = build_context(
+            STAGE_ARTICLE_DETAILS, [ArticleSection(header="", body=article.body or "", footer="")]
+        )
         prompt = f"""
         뉴스 기사를 분석해서 다음 4가지 정보를 JSON으로 추출해줘.
         
         [기사 정보]
         제목: {article.title}
-        본문: {article.body[:300]}
+        본문: {body_text}
         언론사: {press_name}
         
         [지시사항]
@@ -44,19 +57,14 @@ def generate_article_details():
         """
 
         try:
-            response = client.chat.completions.create(
-                model="sonar-pro",
-                messages=[
-                    {"role": "system", "content": "Output valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ]
+            record_prompt_tokens(STAGE_ARTICLE_DETAILS, prompt)
+            content = ai_client.chat(
+                "Output valid JSON only.",
+                prompt,
+                stage=STAGE_ARTICLE_DETAILS,
+                article_id=article_id
             )
-            
-            content = response.choices[0].message.content
-            content = content.replace("```json", "").replace("```", "").strip()
-            start = content.find('{')
-            end = content.rfind('}') + 1
-            data = json.loads(content[start:end])
+            data = ai_client.extract_json(content)
             
             article.ai_alternative_title = data.get('alternative_title', '분석 실패')
             article.ai_bias_score = float(data.get('bias_score', 0.0))
@@ -64,10 +72,14 @@ def generate_article_details():
             article.sentiment = data.get('sentiment', 'neutral')
             
             db.commit()
+            dead_letter.record_success(db, dead_letter.STAGE_ARTICLE_DETAILS, article_id)
             
-        except Exception:
+        except Exception as e:
+            db.rollback()
+            dead_letter.record_failure(db, dead_letter.STAGE_ARTICLE_DETAILS, article_id, e)
             continue
 
+    dedup.propagate_canonical_analysis(db)
     db.close()
 
 if __name__ == "__main__":
@@ -1,8 +1,11 @@
 import os
-import json
-from openai import OpenAI
 from dotenv import load_dotenv
+from sqlalchemy import exists
 from core.database import SessionLocal, Topic, Article, Short
+from services import dead_letter
+from services.stages import STAGE_SHORT
+from services.prompt_builder import ArticleSection, build_context, record_prompt_tokens
+from services.ai_client import get_ai_client
 
 load_dotenv()
 
@@ -11,12 +14,29 @@ if not PPLX_API_KEY:
     print("!!! 오류: PPLX_API_KEY 환경 변수가 없습니다.")
     exit()
 
-client = OpenAI(api_key=PPLX_API_KEY, base_url="https://api.perplexity.ai")
+ai_client = get_ai_client()
+
+SHORTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "script": {"type": "string"},
+        "hashtags": {"type": "array", "items": {"type": "string"}},
+        "image_url": {"type": "string"}
+    },
+    "required": ["title", "script", "hashtags"],
+    "additionalProperties": False
+}
 
 def generate_shorts():
     db = SessionLocal()
   
-    all_topics = db.query(Topic).filter(Topic.ai_neutral_headline != None).all()
+    # 숏폼이 없는 토픽만 한 번에 조회
+    query = db.query(Topic).filter(
+        Topic.ai_neutral_headline != None,
+        ~exists().where(Short.topic_id == Topic.id)
+    )
+    all_topics = dead_letter.filter_eligible(query, dead_letter.STAGE_SHORT, Topic.id).all()
     
     print(f">>> 발견된 토픽 수: {len(all_topics)}")
     
@@ -24,20 +44,18 @@ def generate_shorts():
     for topic in all_topics:
         if count >= 100:
             break
-            
-        if db.query(Short).filter(Short.topic_id == topic.id).first():
-            print(f"  - [Topic {topic.id}] 이미 숏폼이 존재함, 건너뜀")
-            continue
+        topic_id = topic.id
 
         articles = db.query(Article).filter(Article.topic_id == topic.id).limit(3).all()
         if not articles:
             print(f"  - [Topic {topic.id}] 기사가 없음, 건너뜀")
             continue
 
-        context = f"Topic: {topic.ai_neutral_headline}\n"
+        context = f"Topic: {topic.ai_neutral_headline}\n" + build_context(STAGE_SHORT, [
+            ArticleSection(header="- ", body=art.body or "") for art in articles
+        ], separator="")
         image_url = None
         for art in articles:
-            context += f"- {art.body[:300]}\n"
             if not image_url and art.image_url:
                 image_url = art.image_url
 
@@ -52,45 +70,25 @@ def generate_shorts():
 
         try:
             print(f">>> [Topic {topic.id}] 숏폼 생성 중...")
-            completion = client.chat.completions.create(
-                model="sonar-pro",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "shorts_script",
-                        "schema": {
-                            "type": "object",
-                            "properties": {
-                                "title": {"type": "string"},
-                                "script": {"type": "string"},
-                                "hashtags": {"type": "array", "items": {"type": "string"}},
-                                "image_url": {"type": "string"}
-                            },
-                            "required": ["title", "script", "hashtags"],
-                            "additionalProperties": False
-                        }
-                    }
-                }
+            record_prompt_tokens(STAGE_SHORT, system_prompt, user_prompt)
+            result = ai_client.chat_json(
+                system_prompt, user_prompt, SHORTS_SCHEMA, "shorts_script",
+                stage=STAGE_SHORT, topic_id=topic_id
             )
-            
-            result = json.loads(completion.choices[0].message.content)
             if image_url:
                 result['image_url'] = image_url
             
-            json_string = json.dumps(result, ensure_ascii=False)
-            
-            new_short = Short(topic_id=topic.id, content_json=json_string)
+            new_short = Short(topic_id=topic.id, content_json=result)
             db.add(new_short)
             db.commit()
+            dead_letter.record_success(db, dead_letter.STAGE_SHORT, topic_id)
             print(f"  - 완료: {result['title']}")
             count += 1
             
         except Exception as e:
-            print(f"  - 실패: {e}")
+            db.rollback()
+            failure = dead_letter.record_failure(db, dead_letter.STAGE_SHORT, topic_id, e)
+            print(f"  - 실패 ({failure.attempts}회, {failure.status}): {e}")
             import traceback
             traceback.print_exc()
             continue
@@ -0,0 +1,101 @@
+"""
+Pipeline Runner - 자동화 파이프라인 단계 실행 (단계별 프로파일링 지원)
+
+사용법:
+    python pipeline.py                                  # 전체 실행
+    python pipeline.py --stage debate                   # 단일 단계 실행
+    python pipeline.py --stage debate --profile         # 단일 단계를 cProfile로 측정 (profiles/*.prof)
+"""
+import argparse
+import os
+import sys
+from typing import Callable, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from crawler import run_crawl_and_save_to_db
+from cluster import run_topic_clustering
+from services.content_service import generate_ai_content, generate_article_details, generate_shorts
+from classify_articles import classify_articles_by_topic
+from services.debate_service import generate_debates_for_all_topics
+from services.content_refresh import refresh_stale_content
+from services.retention import run_retention
+from services.snapshots import export_snapshots
+from services.llm_ledger import ledger
+from core.config import settings
+from core.profiling import profile_call
+from core.query_budget import QueryCounter
+
+# (단계 이름, 설명, 실행 함수) - 실행 순서
+PIPELINE_STAGES: List[Tuple[str, str, Callable]] = [
+    ("crawl", "크롤링 실행", run_crawl_and_save_to_db),
+    ("cluster", "뉴스 군집화 실행", run_topic_clustering),
+    ("topic_summary", "토픽 헤드라인/요약 생성", generate_ai_content),
+    ("classify", "기사 관점(좌/중/우) 분류", classify_articles_by_topic),
+    ("article_details", "기사 상세(편향점수/대체제목/감정) 분석", generate_article_details),
+    ("short", "숏폼 대본 생성", generate_shorts),
+    ("debate", "AI 토론 생성", generate_debates_for_all_topics),
+    ("refresh", "기사 변경된 토픽 콘텐츠 갱신", refresh_stale_content),
+    ("retention", "오래된 토픽 보관 / DB 정리", run_retention),
+    ("snapshot", "조회 API 정적 스냅샷 생성", export_snapshots),
+]
+STAGE_NAMES = [name for name, _, _ in PIPELINE_STAGES]
+
+
+def _call_stage(name: str, func: Callable, profile: bool):
+    if profile:
+        result, _ = profile_call(f"stage_{name}", func)
+        return result
+    return func()
+
+
+def run_stage(name: str, profile: bool = False):
+    """단일 단계 실행 (profile=True면 cProfile 결과를 profiles/에 저장)"""
+    for stage_name, _, func in PIPELINE_STAGES:
+        if stage_name == name:
+            if not settings.query_debug:
+                return _call_stage(name, func, profile)
+            # 개발 모드: 단계별 쿼리 수와 반복 쿼리(N+1 의심) 출력
+            with QueryCounter(f"stage {name}") as counter:
+                try:
+                    return _call_stage(name, func, profile)
+                finally:
+                    print(counter.report())
+    raise ValueError(f"알 수 없는 단계입니다: {name}")
+
+
+def run_pipeline(profile_stage: Optional[str] = None) -> None:
+    """
+    전체 파이프라인 실행
+
+    Args:
+        profile_stage: 이 단계만 cProfile로 측정 (None이면 프로파일링 안 함)
+    """
+    print("🚀 [Cron] 전체 파이프라인 시작")
+    try:
+        for index, (name, description, _) in enumerate(PIPELINE_STAGES, start=1):
+            print(f">> {index}. {description}")
+            run_stage(name, profile=(name == profile_stage))
+
+        print("✅ [Cron] 전체 파이프라인 성공적으로 완료")
+    except Exception as e:
+        print(f"❌ [Cron] 파이프라인 실행 중 오류 발생: {e}")
+    finally:
+        ledger.flush()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="자동화 파이프라인 실행")
+    parser.add_argument("--stage", choices=STAGE_NAMES, default=None, help="단일 단계만 실행")
+    parser.add_argument("--profile", action="store_true", help="--stage 단계를 cProfile로 측정")
+    args = parser.parse_args()
+    if args.profile and not args.stage:
+        parser.error("--profile은 --stage와 함께 사용하세요.")
+
+    if args.stage:
+        try:
+            run_stage(args.stage, profile=args.profile)
+        finally:
+            ledger.flush()
+    else:
+        run_pipeline()
@@ -1,10 +1,14 @@
-import requests
+import asyncio
 import time
 from bs4 import BeautifulSoup
-from models import SessionLocal, Source, Article
-import os
+from core.config import settings
+from core.database import SessionLocal, Source, Article
+from core.http_clients import http_clients
+from services import dedup
+from services.naver_search import naver_search
 
-API_URL = "http://127.0.0.1:8000/search"
+# 배치 수집은 초당 요청 한도 대기를 길게 허용
+SEARCH_MAX_WAIT_SECONDS = 60
 
 CATEGORY_KEYWORDS = {
     "politics": ["정치", "대통령", "국회", "여당", "야당", "총선"],
@@ -20,9 +24,8 @@ def get_details_from_html(url):
     """
     기사 URL로 접속해 카테고리, 기자 이름, 고화질 이미지를 가져옵니다.
     """
-    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
     try:
-        response = requests.get(url, headers=headers, timeout=3)
+        response = http_clients.get_sync("naver_news").get(url, timeout=3)
         soup = BeautifulSoup(response.text, 'html.parser')
         
 
@@ -42,69 +45,90 @@ def get_details_from_html(url):
     except Exception:
         return None, None
 
+async def fetch_keyword_results(keywords):
+    """
+    키워드별 검색 결과를 동시에 조회 (/search와 같은 검색 서비스 - 캐시/호출 한도 공유)
+
+    Returns:
+        키워드 순서대로 검색 결과 dict 또는 예외
+    """
+    try:
+        return await asyncio.gather(
+            *(naver_search.search(keyword, max_wait=SEARCH_MAX_WAIT_SECONDS) for _, keyword in keywords),
+            return_exceptions=True
+        )
+    finally:
+        await http_clients.aclose()
+
 def run_populate():
+    if not settings.naver_client_id or not settings.naver_client_secret:
+        print("!!! NAVER API 키가 설정되지 않았습니다.")
+        return
+
     db = SessionLocal()
     total_saved = 0
     
     print(">>> 📡 [AWS] 카테고리별 뉴스 수집 및 상세 정보 보강 시작...")
 
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        print(f"  📂 [{category}] 카테고리 수집 중 (키워드: {keywords})...")
-        
-        for keyword in keywords:
-            try:
-                response = requests.get(API_URL, params={"query": keyword})
-                if response.status_code != 200:
-                    print(f"    ! API 오류 ({keyword}): 상태코드 {response.status_code}")
+    keywords = [(category, keyword) for category, words in CATEGORY_KEYWORDS.items() for keyword in words]
+    print(f"  🔎 키워드 {len(keywords)}개 동시 검색 중...")
+    results = asyncio.run(fetch_keyword_results(keywords))
+
+    for (category, keyword), data in zip(keywords, results):
+        try:
+            if isinstance(data, Exception):
+                print(f"    ! API 오류 ({keyword}): {data}")
+                continue
+                
+            items = data.get("items", [])
+            
+            saved_count_in_keyword = 0
+            for item in items:
+                link = item['link']
+                
+                exists = db.query(Article).filter(Article.url == link).first()
+                if exists: 
                     continue
-                    
-                data = response.json()
-                items = data.get("items", [])
                 
-                saved_count_in_keyword = 0
-                for item in items:
-                    link = item['link']
-                    
-                    exists = db.query(Article).filter(Article.url == link).first()
-                    if exists: 
-                        continue
-                    
-                    real_reporter_name, hq_image_url = get_details_from_html(link)
-                    
-                    title = item['title'].replace("<b>", "").replace("</b>", "").replace("&quot;", "'")
-                    description = item['description'].replace("<b>", "").replace("</b>", "")
-                    
-                    source = db.query(Source).filter(Source.name == "네이버뉴스").first()
-                    if not source:
-                        source = Source(name="네이버뉴스", bias_label="unknown")
-                        db.add(source)
-                        db.commit()
-                        db.refresh(source)
-                    
-                    article = Article(
-                        title=title, 
-                        url=link, 
-                        body=description, 
-                        source_id=source.id, 
-                        topic_id=None,
-                        category=category,
-                        reporter_name=real_reporter_name,
-                        image_url=hq_image_url if hq_image_url else None
-                    )
-                    db.add(article)
-                    saved_count_in_keyword += 1
-                    
-                    time.sleep(0.1) 
+                real_reporter_name, hq_image_url = get_details_from_html(link)
+                
+                title = item['title'].replace("<b>", "").replace("</b>", "").replace("&quot;", "'")
+                description = item['description'].replace("<b>", "").replace("</b>", "")
                 
-                db.commit()
-                if saved_count_in_keyword > 0:
-                    print(f"    - '{keyword}': {saved_count_in_keyword}개 저장됨")
-                total_saved += saved_count_in_keyword
+                source = db.query(Source).filter(Source.name == "네이버뉴스").first()
+                if not source:
+                    source = Source(name="네이버뉴스", bias_label="unknown")
+                    db.add(source)
+                    db.commit()
+                    db.refresh(source)
                 
-            except Exception as e:
-                print(f"    ! 오류 발생 ({keyword}): {e}")
-                pass
+                article = Article(
+                    title=title, 
+                    url=link, 
+                    body=description, 
+                    source_id=source.id, 
+                    topic_id=None,
+                    category=category,
+                    reporter_name=real_reporter_name,
+                    image_url=hq_image_url if hq_image_url else None
+                )
+                db.add(article)
+                db.flush()
+                dedup.index_article(db, article)
+                db.flush()
+                saved_count_in_keyword += 1
+                
+                time.sleep(0.1) 
+            
+            db.commit()
+            if saved_count_in_keyword > 0:
+                print(f"    - '{keyword}': {saved_count_in_keyword}개 저장됨")
+            total_saved += saved_count_in_keyword
             
+        except Exception as e:
+            print(f"    ! 오류 발생 ({keyword}): {e}")
+            pass
+        
     db.close()
     print(f"\n🎉 총 {total_saved}개의 기사가 상세 정보와 함께 저장되었습니다!")
 
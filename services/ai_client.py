@@ -2,6 +2,7 @@
 Unified AI Client for all AI operations
 """
 import json
+import time
 from typing import Optional, Dict, Any
 from openai import OpenAI
 
@@ -9,7 +10,8 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.config import settings
+from core.config import settings, LLMRoute
+from services.llm_ledger import ledger
 
 
 class AIClient:
@@ -21,16 +23,21 @@ class AIClient:
         
         self.client = OpenAI(
             api_key=settings.pplx_api_key,
-            base_url="https://api.perplexity.ai"
+            base_url=settings.pplx_base_url
         )
-        self.model = "sonar-pro"
+        # 작업별 라우트가 없는 호출에 쓰이는 기본 모델
+        self.model = settings.llm_default_route.model
     
     def chat(
         self, 
         system_prompt: str, 
         user_prompt: str,
         response_format: Optional[Dict] = None,
-        temperature: float = 0.7
+        temperature: Optional[float] = None,
+        stage: Optional[str] = None,
+        topic_id: Optional[int] = None,
+        article_id: Optional[int] = None,
+        route: Optional[LLMRoute] = None
     ) -> str:
         """
         Send a chat completion request
@@ -39,7 +46,11 @@ class AIClient:
             system_prompt: System message content
             user_prompt: User message content
             response_format: Optional JSON schema for structured output
-            temperature: Creativity level (0.0-1.0)
+            temperature: Creativity level (0.0-1.0), None이면 라우트 설정값
+            stage: Pipeline stage name (모델 라우팅 및 LLM 호출 원장 기록용)
+            topic_id: Related topic ID (원장 기록용)
+            article_id: Related article ID (원장 기록용)
+            route: 모델/최대 토큰/temperature 직접 지정 (None이면 stage 기준 라우팅)
         
         Returns:
             Response content as string
@@ -49,16 +60,39 @@ class AIClient:
             {"role": "user", "content": user_prompt}
         ]
         
+        route = route or settings.llm_route(stage)
         kwargs = {
-            "model": self.model,
+            "model": route.model,
             "messages": messages,
-            "temperature": temperature
+            "temperature": route.temperature if temperature is None else temperature
         }
         
+        if route.max_tokens:
+            kwargs["max_tokens"] = route.max_tokens
+        
         if response_format:
             kwargs["response_format"] = response_format
         
-        completion = self.client.chat.completions.create(**kwargs)
+        started = time.perf_counter()
+        try:
+            completion = self.client.chat.completions.create(**kwargs)
+        except Exception as e:
+            ledger.record(
+                stage, model=route.model,
+                latency_ms=(time.perf_counter() - started) * 1000,
+                error_class=type(e).__name__,
+                topic_id=topic_id, article_id=article_id
+            )
+            raise
+        
+        usage = getattr(completion, "usage", None)
+        ledger.record(
+            stage, model=route.model,
+            prompt_tokens=getattr(usage, "prompt_tokens", 0),
+            completion_tokens=getattr(usage, "completion_tokens", 0),
+            latency_ms=(time.perf_counter() - started) * 1000,
+            topic_id=topic_id, article_id=article_id
+        )
         return completion.choices[0].message.content
     
     def chat_json(
@@ -66,7 +100,8 @@ class AIClient:
         system_prompt: str, 
         user_prompt: str,
         schema: Dict[str, Any],
-        schema_name: str = "response"
+        schema_name: str = "response",
+        **ledger_kwargs
     ) -> Dict:
         """
         Send a chat request expecting JSON response
@@ -76,6 +111,7 @@ class AIClient:
             user_prompt: User message content
             schema: JSON schema for the response
             schema_name: Name for the schema
+            **ledger_kwargs: stage/topic_id/article_id/route (라우팅 및 원장 기록용)
         
         Returns:
             Parsed JSON response as dict
@@ -88,7 +124,7 @@ class AIClient:
             }
         }
         
-        content = self.chat(system_prompt, user_prompt, response_format)
+        content = self.chat(system_prompt, user_prompt, response_format, **ledger_kwargs)
         return json.loads(content)
     
     def extract_json(self, content: str) -> Dict:
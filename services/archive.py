@@ -0,0 +1,121 @@
+"""
+Archive - 보관된 토픽 묶음의 저장 형식(zstd NDJSON 파일)과 조회 경로
+
+보관 작업(services/retention.py)은 오래된 토픽을 기사/집계/숏폼/토론과 함께 JSON 한 줄(토픽 묶음)로 만들어
+보관 디렉터리(ARCHIVE_DIR)의 파일에 씁니다. 묶음마다 독립된 zstd 프레임이라 파일 전체를 `zstd -dc`로 풀면 NDJSON이 되고,
+archived_topics 색인에 (파일, 위치, 길이)를 저장해 토픽 하나는 해당 프레임만 읽어 풉니다.
+
+    <ARCHIVE_DIR>/
+      topics-<시각>-<id>.ndjson.zst    # 보관 작업 1회 = 파일 1개 (한 번 쓰면 바뀌지 않음)
+
+API(/topics/{id}, /shorts/{id}, /debate/{id})는 운영 테이블에 토픽이 없을 때 이 경로로 응답합니다 (느린 경로).
+"""
+import asyncio
+import datetime
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import zstandard
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.database import ArchivedTopic
+from core.metrics import record_cache
+
+# 한 번 쓰고 드물게 읽으므로 높은 압축 레벨 사용 (공유 사전 없이 - zstd CLI로도 풀 수 있게)
+ARCHIVE_COMPRESSION_LEVEL = 19
+# 최근 읽은 보관 토픽 묶음 수 (상세/숏폼/토론을 이어서 요청하는 경우)
+RECORD_CACHE_SIZE = 256
+
+
+def _json_default(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, (bytes, memoryview)):
+        return bytes(value).hex()
+    raise TypeError(f"JSON으로 저장할 수 없는 값입니다: {type(value).__name__}")
+
+
+class ArchiveStore:
+    def __init__(self, root: Optional[str] = None):
+        self._root = root
+        self._records: "OrderedDict[int, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> str:
+        return self._root or settings.archive_dir
+
+    # --- 쓰기 (보관 작업) ---
+    def write_records(self, records: List[Dict]) -> Tuple[str, List[Tuple[int, int]]]:
+        """
+        묶음을 새 보관 파일에 zstd 프레임 하나씩 씀 (디스크에 기록한 뒤 반환 - 이후 DB에서 삭제)
+
+        Returns:
+            (보관 디렉터리 기준 파일 이름, 묶음별 (위치, 길이))
+        """
+        os.makedirs(self.root, exist_ok=True)
+        now = datetime.datetime.utcnow()
+        file_name = f"topics-{now.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}.ndjson.zst"
+        path = os.path.join(self.root, file_name)
+        compressor = zstandard.ZstdCompressor(level=ARCHIVE_COMPRESSION_LEVEL)
+
+        frames = []
+        offset = 0
+        with open(f"{path}.tmp", "wb") as f:
+            for record in records:
+                line = json.dumps(record, ensure_ascii=False, default=_json_default) + "\n"
+                frame = compressor.compress(line.encode("utf-8"))
+                f.write(frame)
+                frames.append((offset, len(frame)))
+                offset += len(frame)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f"{path}.tmp", path)
+        return file_name, frames
+
+    # --- 읽기 (API 느린 경로) ---
+    def read_frame(self, file_name: str, offset: int, length: int) -> Dict:
+        with open(os.path.join(self.root, file_name), "rb") as f:
+            f.seek(offset)
+            frame = f.read(length)
+        return json.loads(zstandard.ZstdDecompressor().decompress(frame))
+
+    async def load_topic(self, topic_id: int, db: AsyncSession) -> Optional[Dict]:
+        """보관된 토픽 묶음 (보관되지 않았거나 파일이 없으면 None)"""
+        with self._lock:
+            record = self._records.get(topic_id)
+            if record is not None:
+                self._records.move_to_end(topic_id)
+        record_cache("archive", hit=record is not None)
+        if record is not None:
+            return record
+
+        entry = (await db.execute(
+            select(ArchivedTopic.file_name, ArchivedTopic.frame_offset, ArchivedTopic.frame_length)
+            .where(ArchivedTopic.topic_id == topic_id)
+        )).first()
+        if entry is None:
+            return None
+        try:
+            record = await asyncio.to_thread(self.read_frame, *entry)
+        except (OSError, zstandard.ZstdError, ValueError) as e:
+            print(f"!!! 보관 토픽 {topic_id}을(를) 읽을 수 없습니다 ({entry[0]}): {e}")
+            return None
+
+        with self._lock:
+            self._records[topic_id] = record
+            while len(self._records) > RECORD_CACHE_SIZE:
+                self._records.popitem(last=False)
+        return record
+
+
+archive_store = ArchiveStore()
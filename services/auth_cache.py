@@ -0,0 +1,92 @@
+"""
+Auth Cache - 검증된 JWT → 사용자 정보(projection) 단기 캐시
+
+인증이 필요한 요청마다 JWT 디코딩과 User 조회를 반복하지 않도록, 한 번 검증한 토큰의 사용자 정보를
+짧은 TTL(토큰 만료보다 길지 않게) 동안 보관합니다. 프로필이 바뀌면 해당 사용자의 항목을 즉시 지웁니다.
+캐시는 프로세스별이므로 다른 워커의 변경은 TTL이 지나야 반영됩니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Tuple
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.metrics import record_cache
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """인증된 사용자 정보 (ORM 객체 대신 캐시 가능한 값 객체)"""
+    id: int
+    email: Optional[str]
+    username: Optional[str]
+    provider: Optional[str]
+    keywords: Optional[str]
+    bias_filter_level: Optional[int]
+
+    @classmethod
+    def from_user(cls, user) -> "CurrentUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            provider=user.provider,
+            keywords=user.keywords,
+            bias_filter_level=user.bias_filter_level
+        )
+
+
+class TokenUserCache:
+    def __init__(self):
+        self._entries: "OrderedDict[str, Tuple[CurrentUser, float]]" = OrderedDict()
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[CurrentUser]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None and time.time() >= entry[1]:
+                self._remove(token)
+                entry = None
+        record_cache("auth_user", hit=entry is not None)
+        return entry[0] if entry else None
+
+    def set(self, token: str, user: CurrentUser, token_expires_at: Optional[float] = None) -> None:
+        expires_at = time.time() + settings.auth_user_cache_ttl_seconds
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+        with self._lock:
+            self._remove(token)
+            self._entries[token] = (user, expires_at)
+            self._tokens_by_user.setdefault(user.id, set()).add(token)
+            while len(self._entries) > settings.auth_user_cache_max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: int) -> None:
+        """프로필 변경 시 해당 사용자의 모든 토큰 항목 삭제"""
+        with self._lock:
+            for token in list(self._tokens_by_user.get(user_id, ())):
+                self._remove(token)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def _remove(self, token: str) -> None:
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        tokens = self._tokens_by_user.get(entry[0].id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[entry[0].id]
+
+
+token_user_cache = TokenUserCache()
@@ -0,0 +1,129 @@
+"""
+Local Bias Classifier - 저장된 언론사 라벨로 학습한 로컬 언론사/관점 분류기
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from collections import Counter
+from sqlalchemy.orm import Session, joinedload
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.database import Article, Source
+from crawler import BIAS_MAP
+
+# 언론사를 알 수 없는 기사(검색 API 수집분)에 붙는 기본 출처
+DEFAULT_SOURCE_NAME = "네이버뉴스"
+BIAS_LABELS = ("left", "center", "right")
+
+
+@dataclass
+class BiasPrediction:
+    press_name: str
+    bias: str
+    confidence: float
+
+
+def article_features_text(article: Article) -> str:
+    """분류기 입력 텍스트 (제목 + 본문 앞부분)"""
+    body = article.body[:1000] if article.body else ""
+    return f"{article.title or ''}\n{body}"
+
+
+class LocalBiasClassifier:
+    """TF-IDF(문자 n-gram) + 로지스틱 회귀 기반 언론사 분류기"""
+
+    def __init__(
+        self,
+        min_confidence: Optional[float] = None,
+        min_samples_per_press: Optional[int] = None
+    ):
+        self.min_confidence = (
+            min_confidence if min_confidence is not None
+            else settings.local_classifier_min_confidence
+        )
+        self.min_samples_per_press = (
+            min_samples_per_press if min_samples_per_press is not None
+            else settings.local_classifier_min_samples
+        )
+        self.vectorizer: Optional[TfidfVectorizer] = None
+        self.model: Optional[LogisticRegression] = None
+        self.press_bias: Dict[str, str] = {}
+
+    @property
+    def is_trained(self) -> bool:
+        return self.model is not None
+
+    def train(self, db: Session) -> int:
+        """
+        언론사/관점 라벨이 확정된 기사로 학습
+
+        Returns:
+            학습에 사용한 기사 수 (학습 불가 시 0)
+        """
+        articles = db.query(Article).join(Source).options(
+            joinedload(Article.source)
+        ).filter(Source.name != DEFAULT_SOURCE_NAME).all()
+
+        self.press_bias = {}
+        samples = []
+        for art in articles:
+            press_name = art.source.name
+            bias = BIAS_MAP.get(press_name, art.source.bias_label)
+            if bias not in BIAS_LABELS:
+                continue
+            self.press_bias[press_name] = bias
+            samples.append((article_features_text(art), press_name))
+
+        counts = Counter(label for _, label in samples)
+        samples = [s for s in samples if counts[s[1]] >= self.min_samples_per_press]
+        if len({label for _, label in samples}) < 2:
+            self.vectorizer = None
+            self.model = None
+            return 0
+
+        texts = [text for text, _ in samples]
+        labels = [label for _, label in samples]
+
+        self.vectorizer = TfidfVectorizer(
+            analyzer="char_wb",
+            ngram_range=(2, 3),
+            max_features=50000,
+            sublinear_tf=True
+        )
+        features = self.vectorizer.fit_transform(texts)
+        self.model = LogisticRegression(max_iter=1000, class_weight="balanced")
+        self.model.fit(features, labels)
+        return len(samples)
+
+    def predict(self, articles: List[Article]) -> List[Optional[BiasPrediction]]:
+        """
+        기사별 언론사/관점 예측
+
+        Returns:
+            기사 순서대로 예측 결과, 신뢰도가 기준 미만이면 None (LLM으로 넘김)
+        """
+        if not self.is_trained or not articles:
+            return [None] * len(articles)
+
+        features = self.vectorizer.transform([article_features_text(a) for a in articles])
+        probabilities = self.model.predict_proba(features)
+
+        predictions: List[Optional[BiasPrediction]] = []
+        for row in probabilities:
+            best = row.argmax()
+            confidence = float(row[best])
+            if confidence < self.min_confidence:
+                predictions.append(None)
+                continue
+            press_name = self.model.classes_[best]
+            predictions.append(BiasPrediction(
+                press_name=press_name,
+                bias=self.press_bias[press_name],
+                confidence=confidence
+            ))
+        return predictions
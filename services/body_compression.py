@@ -0,0 +1,158 @@
+"""
+Body Compression - 기사 본문 압축 사전 학습과 기존 행 압축 (백필)
+
+Article.body는 core/compression.py의 CompressedText로 새로 쓰는 값부터 자동 압축됩니다.
+이 스크립트는 최근 본문으로 zstd 공유 사전을 학습하고, 압축 전(텍스트) 또는 예전 사전으로 압축된 기존 본문을
+현재 사전으로 다시 씁니다. 더 이상 쓰지 않는 Topic.body(기사 본문 사본)도 비웁니다.
+
+사용법:
+    python services/body_compression.py            # 사전이 없으면 학습 후 기존 본문 압축
+    python services/body_compression.py --train    # 사전을 새로 학습하고 전체 재압축
+    python services/body_compression.py --vacuum   # 압축 후 VACUUM으로 파일 크기 반환
+"""
+import argparse
+from typing import Dict, Optional
+
+import zstandard
+from sqlalchemy import LargeBinary, bindparam, literal_column, select, update
+from sqlalchemy.orm import Session
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.compression import dictionaries, compress_text, decompress_text, frame_dictionary_id
+from core.database import SessionLocal, engine, Article, Topic, CompressionDictionary
+
+BACKFILL_BATCH_SIZE = 500
+# 사전 학습에 필요한 최소 표본 수 (너무 적으면 zstd가 학습에 실패)
+MIN_DICT_SAMPLES = 100
+
+
+def train_dictionary(db: Session) -> Optional[int]:
+    """
+    최근 기사 본문으로 공유 사전 학습 후 저장 (이후 압축에 사용)
+
+    Returns:
+        사전 id (표본이 부족하면 None)
+    """
+    samples = [
+        body.encode("utf-8")
+        for body in db.scalars(
+            select(Article.body)
+            .where(Article.body != None)
+            .order_by(Article.id.desc())
+            .limit(settings.text_compression_dict_samples)
+        )
+        if body
+    ]
+    if len(samples) < MIN_DICT_SAMPLES:
+        print(f"!!! 사전 학습 표본이 부족합니다 ({len(samples)}/{MIN_DICT_SAMPLES}건) - 사전 없이 압축")
+        return None
+
+    trained = zstandard.train_dictionary(settings.text_compression_dict_size, samples)
+    data = trained.as_bytes()
+    db.add(CompressionDictionary(dict_id=trained.dict_id(), data=data, sample_count=len(samples)))
+    db.commit()
+    dictionaries.add(trained.dict_id(), data)
+    print(f">>> 압축 사전 학습: id {trained.dict_id()} ({len(data) / 1024:.0f}KB, 표본 {len(samples)}건)")
+    return trained.dict_id()
+
+
+def compress_existing_bodies(db: Session) -> Dict[str, int]:
+    """압축 전 / 예전 사전으로 압축된 본문을 현재 사전으로 다시 씀"""
+    current = dictionaries.current()
+    stats = {"checked": 0, "rewritten": 0, "bytes_before": 0, "bytes_after": 0}
+    # 저장된 값을 타입 변환 없이 읽고(텍스트/bytes), 미리 압축한 bytes를 그대로 씀
+    raw_body = literal_column(f"{Article.__tablename__}.body")
+    write = (
+        update(Article.__table__)
+        .where(Article.__table__.c.id == bindparam("article_id"))
+        .values(body=bindparam("compressed", type_=LargeBinary))
+    )
+
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Article.id, raw_body)
+            .select_from(Article)
+            .where(Article.id > last_id, raw_body != None)
+            .order_by(Article.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        params = []
+        for article_id, stored in rows:
+            stats["checked"] += 1
+            if not isinstance(stored, str):
+                stored = bytes(stored)
+                dict_id = frame_dictionary_id(stored)
+                # 이미 현재 사전으로 압축되었거나, 압축 대상이 아닌 짧은 값
+                if dict_id == (current or 0) or (
+                    dict_id is None and len(stored) < settings.text_compression_min_bytes
+                ):
+                    continue
+            compressed = compress_text(decompress_text(stored))
+            stats["bytes_before"] += len(stored.encode("utf-8") if isinstance(stored, str) else stored)
+            stats["bytes_after"] += len(compressed)
+            params.append({"article_id": article_id, "compressed": compressed})
+
+        if params:
+            db.execute(write, params)
+            db.commit()
+            stats["rewritten"] += len(params)
+        print(f"  . 기사 {stats['checked']}건 확인, {stats['rewritten']}건 압축")
+    return stats
+
+
+def vacuum() -> None:
+    """삭제/축소된 페이지를 OS에 반환"""
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("VACUUM (ANALYZE) articles")
+            conn.exec_driver_sql("VACUUM (ANALYZE) topics")
+    else:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("VACUUM")
+
+
+def run_body_compression(retrain: bool = False, run_vacuum: bool = False) -> Dict[str, int]:
+    db = SessionLocal()
+    try:
+        if not settings.text_compression_enabled:
+            print("!!! TEXT_COMPRESSION=false - 압축하지 않습니다.")
+            return {}
+        if retrain or dictionaries.current() is None:
+            train_dictionary(db)
+
+        stats = compress_existing_bodies(db)
+        # 토픽 본문은 기사에서 만들므로 저장된 사본은 비움
+        stats["topic_bodies_cleared"] = db.execute(
+            update(Topic).where(Topic.body != None).values(body=None)
+        ).rowcount
+        db.commit()
+    finally:
+        db.close()
+
+    if stats["bytes_before"]:
+        print(
+            f">>> 본문 압축: {stats['rewritten']}건, {stats['bytes_before'] / 1024:.0f}KB → "
+            f"{stats['bytes_after'] / 1024:.0f}KB ({stats['bytes_after'] / stats['bytes_before'] * 100:.1f}%), "
+            f"토픽 본문 사본 {stats['topic_bodies_cleared']}건 삭제"
+        )
+    if run_vacuum:
+        vacuum()
+        print(">>> VACUUM 완료")
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기사 본문 zstd 압축 (사전 학습 + 기존 행 백필)")
+    parser.add_argument("--train", action="store_true", help="사전을 새로 학습하고 전체 재압축")
+    parser.add_argument("--vacuum", action="store_true", help="압축 후 VACUUM 실행")
+    args = parser.parse_args()
+    run_body_compression(retrain=args.train, run_vacuum=args.vacuum)
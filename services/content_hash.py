@@ -0,0 +1,45 @@
+"""
+Content Input Hash - AI 생성물의 입력(기사 집합/본문) 해시 계산
+"""
+import hashlib
+from typing import List, Optional
+from sqlalchemy.orm import Session
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import Article
+
+# 생성물별 입력 기사 수
+TOPIC_SUMMARY_ARTICLE_LIMIT = 5
+SHORT_ARTICLE_LIMIT = 3
+DEBATE_ARTICLE_LIMIT = 5
+
+
+def get_input_articles(db: Session, topic_id: int, limit: int) -> List[Article]:
+    """
+    생성물 입력으로 사용할 토픽 기사 조회 (최신 기사 우선)
+
+    정렬 순서를 고정해야 같은 입력에 대해 같은 해시가 계산되고,
+    군집화로 새 기사가 추가되면 입력 집합이 바뀌어 재생성 대상이 됩니다.
+    """
+    return db.query(Article).filter(
+        Article.topic_id == topic_id
+    ).order_by(Article.id.desc()).limit(limit).all()
+
+
+def compute_input_hash(articles: List[Article], headline: Optional[str] = None) -> str:
+    """기사 ID/제목/본문(+헤드라인)으로 입력 해시 계산"""
+    digest = hashlib.sha256()
+    if headline:
+        digest.update(headline.encode("utf-8"))
+        digest.update(b"\x1e")
+    for art in sorted(articles, key=lambda a: a.id):
+        digest.update(str(art.id).encode("utf-8"))
+        digest.update(b"\x1f")
+        digest.update((art.title or "").encode("utf-8"))
+        digest.update(b"\x1f")
+        digest.update((art.body or "").encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
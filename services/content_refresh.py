@@ -0,0 +1,140 @@
+"""
+Content Refresh Service - 입력 기사 변경 시에만 AI 생성물 재생성
+"""
+from collections import defaultdict
+from typing import Dict
+from sqlalchemy import or_
+from sqlalchemy.orm import joinedload
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import SessionLocal, Topic, Article
+from services import dead_letter
+from services.content_hash import (
+    compute_input_hash,
+    TOPIC_SUMMARY_ARTICLE_LIMIT, SHORT_ARTICLE_LIMIT, DEBATE_ARTICLE_LIMIT
+)
+
+
+def refresh_stale_content() -> Dict[str, int]:
+    """
+    저장된 입력 해시와 현재 기사 기준 해시를 비교해 바뀐 생성물만 재생성
+
+    - 헤드라인/요약, 숏폼, 토론 순서로 확인 (요약이 바뀌면 숏폼/토론 해시도 바뀜)
+    - 해시가 없는 기존 생성물은 현재 해시로 기록만 하고 재생성하지 않음
+    - 변경이 없으면 AI API를 호출하지 않음
+
+    Returns:
+        단계별 처리 통계
+    """
+    from services.content_service import ContentService
+    from services.debate_service import DebateService
+
+    db = SessionLocal()
+    stats = {"checked": 0, "adopted": 0, "regenerated": 0, "failed": 0, "parked": 0}
+    content_service = None
+    debate_service = None
+
+    try:
+        topics = db.query(Topic).options(
+            joinedload(Topic.shorts),
+            joinedload(Topic.debates)
+        ).filter(
+            or_(Topic.ai_neutral_headline != None, Topic.shorts.has(), Topic.debates.has())
+        ).all()
+        if not topics:
+            return stats
+
+        # 토픽별 기사를 한 번에 조회 (최신 기사 우선 - get_input_articles와 같은 순서)
+        articles_by_topic = defaultdict(list)
+        articles = db.query(Article).filter(
+            Article.topic_id.in_([t.id for t in topics])
+        ).order_by(Article.id.desc()).all()
+        for art in articles:
+            articles_by_topic[art.topic_id].append(art)
+
+        parked = {stage: dead_letter.parked_item_ids(db, stage) for stage in dead_letter.STAGES}
+
+        def regenerate(stage: str, topic_id: int, action) -> None:
+            if topic_id in parked[stage]:
+                stats["parked"] += 1
+                return
+            try:
+                action()
+                dead_letter.record_success(db, stage, topic_id)
+                stats["regenerated"] += 1
+                print(f"  - [Topic {topic_id}] {stage} 재생성 완료")
+            except Exception as e:
+                db.rollback()
+                failure = dead_letter.record_failure(db, stage, topic_id, e)
+                stats["failed"] += 1
+                print(f"  - [Topic {topic_id}] {stage} 재생성 실패 ({failure.attempts}회, {failure.status}): {e}")
+
+        for topic in topics:
+            topic_id = topic.id
+            topic_articles = articles_by_topic.get(topic_id)
+            if not topic_articles:
+                continue
+
+            # 1. 헤드라인/요약
+            if topic.ai_neutral_headline:
+                stats["checked"] += 1
+                current = compute_input_hash(topic_articles[:TOPIC_SUMMARY_ARTICLE_LIMIT])
+                if topic.summary_input_hash is None:
+                    topic.summary_input_hash = current
+                    db.commit()
+                    stats["adopted"] += 1
+                elif topic.summary_input_hash != current:
+                    content_service = content_service or ContentService()
+                    regenerate(
+                        dead_letter.STAGE_TOPIC_SUMMARY, topic_id,
+                        lambda: content_service.generate_topic_summary(topic_id, db)
+                    )
+
+            headline = topic.ai_neutral_headline or topic_articles[0].title
+
+            # 2. 숏폼
+            short = topic.shorts
+            if short:
+                stats["checked"] += 1
+                current = compute_input_hash(topic_articles[:SHORT_ARTICLE_LIMIT], headline)
+                if short.input_hash is None:
+                    short.input_hash = current
+                    db.commit()
+                    stats["adopted"] += 1
+                elif short.input_hash != current:
+                    content_service = content_service or ContentService()
+                    regenerate(
+                        dead_letter.STAGE_SHORT, topic_id,
+                        lambda: content_service.generate_short(topic_id, db, force=True)
+                    )
+
+            # 3. 토론
+            debate = topic.debates
+            if debate:
+                stats["checked"] += 1
+                current = compute_input_hash(topic_articles[:DEBATE_ARTICLE_LIMIT], headline)
+                if debate.input_hash is None:
+                    debate.input_hash = current
+                    db.commit()
+                    stats["adopted"] += 1
+                elif debate.input_hash != current:
+                    debate_service = debate_service or DebateService()
+                    regenerate(
+                        dead_letter.STAGE_DEBATE, topic_id,
+                        lambda: debate_service.regenerate_debate(topic_id, db, force=True)
+                    )
+
+        print(
+            f">>> 생성물 {stats['checked']}개 확인: 재생성 {stats['regenerated']}, "
+            f"실패 {stats['failed']}, 보류 {stats['parked']}, 해시 기록 {stats['adopted']}"
+        )
+        return stats
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    refresh_stale_content()
@@ -1,8 +1,8 @@
 """
 Content Generation Service - AI 컨텐츠 생성 통합 서비스
 """
-import json
 from typing import Dict, List, Optional
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 
 import sys
@@ -11,6 +11,29 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.database import SessionLocal, Topic, Article, Short
 from services.ai_client import get_ai_client, AIClient
+from services import dead_letter, dedup
+from services.stages import STAGE_TOPIC_SUMMARY, STAGE_ARTICLE_DETAILS, STAGE_SHORT
+from services.prompt_builder import ArticleSection, build_context, record_prompt_tokens
+from services.llm_ledger import ledger
+from services.event_bus import event_bus, TOPICS_UPDATED, ARTICLES_UPDATED, SHORT_UPDATED
+from services.content_hash import (
+    get_input_articles, compute_input_hash,
+    TOPIC_SUMMARY_ARTICLE_LIMIT, SHORT_ARTICLE_LIMIT
+)
+
+
+def build_topic_body(articles: List) -> str:
+    """
+    토픽 본문 - 헤드라인/요약 입력과 같은 기사 묶음 (저장하지 않고 요청 시 만듦)
+
+    Args:
+        articles: title/body 속성이 있는 기사 목록 (get_input_articles 순서)
+    """
+    sections = [
+        ArticleSection(header=f"News{i+1}: {art.title}\n", body=art.body or "")
+        for i, art in enumerate(articles)
+    ]
+    return build_context(STAGE_TOPIC_SUMMARY, sections)
 
 
 class ContentService:
@@ -31,11 +54,12 @@ class ContentService:
             if not topic:
                 raise ValueError(f"Topic {topic_id} not found")
             
-            articles = db.query(Article).filter(Article.topic_id == topic_id).limit(5).all()
+            articles = get_input_articles(db, topic_id, TOPIC_SUMMARY_ARTICLE_LIMIT)
             if not articles:
                 raise ValueError(f"No articles found for topic {topic_id}")
             
-            articles_text = self._prepare_articles_text(articles)
+            input_hash = compute_input_hash(articles)
+            articles_text = build_topic_body(articles)
             
             system_prompt = "You are a helpful AI news editor. Analyze news articles and output JSON."
             user_prompt = f"""
@@ -67,12 +91,17 @@ class ContentService:
                 "additionalProperties": False
             }
             
-            result = self.ai_client.chat_json(system_prompt, user_prompt, schema, "news_summary")
+            record_prompt_tokens(STAGE_TOPIC_SUMMARY, system_prompt, user_prompt)
+            result = self.ai_client.chat_json(
+                system_prompt, user_prompt, schema, "news_summary",
+                stage=STAGE_TOPIC_SUMMARY, topic_id=topic_id
+            )
             
             topic.ai_neutral_headline = result['headline']
             topic.ai_summary = result['summary']
-            topic.body = articles_text
+            topic.summary_input_hash = input_hash
             db.commit()
+            event_bus.publish(TOPICS_UPDATED, [topic_id])
             
             return result
             
@@ -93,13 +122,17 @@ class ContentService:
                 raise ValueError(f"Article {article_id} not found")
             
             press_name = article.source.name if article.source else "Unknown"
+            body_text = build_context(
+                STAGE_ARTICLE_DETAILS,
+                [ArticleSection(header="", body=article.body or "", footer="")]
+            )
             
             prompt = f"""
 뉴스 기사를 분석해서 다음 4가지 정보를 JSON으로 추출해줘.
 
 [기사 정보]
 제목: {article.title}
-본문: {article.body[:500] if article.body else ''}
+본문: {body_text}
 언론사: {press_name}
 
 [지시사항]
@@ -109,9 +142,12 @@ class ContentService:
 4. sentiment: 기사의 전반적인 감정 (positive, neutral, negative 중 하나).
 """
             
+            record_prompt_tokens(STAGE_ARTICLE_DETAILS, prompt)
             response = self.ai_client.chat(
                 "Output valid JSON only.",
-                prompt
+                prompt,
+                stage=STAGE_ARTICLE_DETAILS,
+                article_id=article_id
             )
             
             data = self.ai_client.extract_json(response)
@@ -128,8 +164,15 @@ class ContentService:
             if should_close:
                 db.close()
     
-    def generate_short(self, topic_id: int, db: Optional[Session] = None) -> Dict:
-        """Generate short-form content for a topic"""
+    def generate_short(self, topic_id: int, db: Optional[Session] = None, force: bool = True) -> Dict:
+        """
+        Generate short-form content for a topic
+        
+        Args:
+            topic_id: Topic ID
+            db: Optional database session
+            force: False이면 입력 해시가 같은 기존 숏폼을 그대로 반환 (API 호출 없음)
+        """
         should_close = False
         if db is None:
             db = SessionLocal()
@@ -140,12 +183,18 @@ class ContentService:
             if not topic:
                 raise ValueError(f"Topic {topic_id} not found")
             
-            articles = db.query(Article).filter(Article.topic_id == topic_id).limit(3).all()
+            articles = get_input_articles(db, topic_id, SHORT_ARTICLE_LIMIT)
             if not articles:
                 raise ValueError(f"No articles found for topic {topic_id}")
             
-            articles_text = self._prepare_articles_text(articles)
             headline = topic.ai_neutral_headline or articles[0].title
+            input_hash = compute_input_hash(articles, headline)
+            existing = db.query(Short).filter(Short.topic_id == topic_id).first()
+            if existing and not force and existing.input_hash == input_hash:
+                ledger.record(STAGE_SHORT, cache_hit=True, topic_id=topic_id)
+                return existing.content_json
+            
+            articles_text = self._prepare_articles_text(articles, STAGE_SHORT)
             image_url = None
             for art in articles:
                 if art.image_url:
@@ -184,20 +233,26 @@ class ContentService:
                 "additionalProperties": False
             }
             
-            result = self.ai_client.chat_json(system_prompt, user_prompt, schema, "short_content")
+            record_prompt_tokens(STAGE_SHORT, system_prompt, user_prompt)
+            result = self.ai_client.chat_json(
+                system_prompt, user_prompt, schema, "short_content",
+                stage=STAGE_SHORT, topic_id=topic_id
+            )
             result["image_url"] = image_url
             
             # Save to database
-            existing = db.query(Short).filter(Short.topic_id == topic_id).first()
             if existing:
-                existing.content_json = json.dumps(result, ensure_ascii=False)
+                existing.content_json = result
+                existing.input_hash = input_hash
             else:
                 short = Short(
                     topic_id=topic_id,
-                    content_json=json.dumps(result, ensure_ascii=False)
+                    content_json=result,
+                    input_hash=input_hash
                 )
                 db.add(short)
             db.commit()
+            event_bus.publish(SHORT_UPDATED, [topic_id])
             
             return result
             
@@ -205,13 +260,13 @@ class ContentService:
             if should_close:
                 db.close()
     
-    def _prepare_articles_text(self, articles: List[Article]) -> str:
-        """Prepare article text for prompts"""
-        text_parts = []
-        for i, art in enumerate(articles):
-            body_preview = art.body[:1000] if art.body else ""
-            text_parts.append(f"News{i+1}: {art.title}\n{body_preview}...\n")
-        return "\n".join(text_parts)
+    def _prepare_articles_text(self, articles: List[Article], stage: str) -> str:
+        """Prepare article text for prompts (단계별 토큰 예산 적용)"""
+        sections = [
+            ArticleSection(header=f"News{i+1}: {art.title}\n", body=art.body or "")
+            for i, art in enumerate(articles)
+        ]
+        return build_context(stage, sections)
 
 
 # Standalone functions for backward compatibility
@@ -221,16 +276,21 @@ def generate_ai_content():
     service = ContentService()
     
     try:
-        topics = db.query(Topic).filter(Topic.ai_neutral_headline == None).all()
+        query = db.query(Topic).filter(Topic.ai_neutral_headline == None)
+        topics = dead_letter.filter_eligible(query, dead_letter.STAGE_TOPIC_SUMMARY, Topic.id).all()
         print(f">>> {len(topics)}개 토픽에 대해 컨텐츠 생성 시작")
         
         for topic in topics:
+            topic_id = topic.id
             try:
-                print(f">>> [Topic {topic.id}] 헤드라인/요약 생성 중...")
-                result = service.generate_topic_summary(topic.id, db)
+                print(f">>> [Topic {topic_id}] 헤드라인/요약 생성 중...")
+                result = service.generate_topic_summary(topic_id, db)
+                dead_letter.record_success(db, dead_letter.STAGE_TOPIC_SUMMARY, topic_id)
                 print(f"  - 완료: {result['headline']}")
             except Exception as e:
-                print(f"  - 실패: {e}")
+                db.rollback()
+                failure = dead_letter.record_failure(db, dead_letter.STAGE_TOPIC_SUMMARY, topic_id, e)
+                print(f"  - 실패 ({failure.attempts}회, {failure.status}): {e}")
                 continue
     finally:
         db.close()
@@ -242,16 +302,38 @@ def generate_article_details():
     service = ContentService()
     
     try:
-        articles = db.query(Article).filter(Article.ai_alternative_title == None).limit(30).all()
-        print(f">>> {len(articles)}개 기사 분석 시작")
+        # 유사 중복 기사는 대표 기사의 분석 결과를 재사용 (LLM 호출 없음)
+        reused = dedup.propagate_canonical_analysis(db)
         
+        query = db.query(Article).filter(
+            Article.ai_alternative_title == None,
+            Article.canonical_id == None
+        )
+        articles = dead_letter.filter_eligible(
+            query, dead_letter.STAGE_ARTICLE_DETAILS, Article.id
+        ).limit(30).all()
+        print(f">>> {len(articles)}개 기사 분석 시작 (중복 기사 {reused}개 결과 재사용)")
+        
+        analyzed = {}
         for article in articles:
+            article_id = article.id
+            topic_id = article.topic_id
             try:
-                service.generate_article_details(article.id, db)
-                print(f"  - [Article {article.id}] 완료")
+                service.generate_article_details(article_id, db)
+                dead_letter.record_success(db, dead_letter.STAGE_ARTICLE_DETAILS, article_id)
+                analyzed[article_id] = topic_id
+                print(f"  - [Article {article_id}] 완료")
             except Exception as e:
-                print(f"  - [Article {article.id}] 실패: {e}")
+                db.rollback()
+                failure = dead_letter.record_failure(db, dead_letter.STAGE_ARTICLE_DETAILS, article_id, e)
+                print(f"  - [Article {article_id}] 실패 ({failure.attempts}회, {failure.status}): {e}")
                 continue
+        
+        dedup.propagate_canonical_analysis(db)
+        # 편향 점수/대체 제목은 기사 단위로 커밋되므로 단계가 끝난 뒤 한 번에 알림
+        if analyzed:
+            event_bus.publish(ARTICLES_UPDATED, analyzed)
+            event_bus.publish(TOPICS_UPDATED, analyzed.values())
     finally:
         db.close()
 
@@ -262,19 +344,24 @@ def generate_shorts():
     service = ContentService()
     
     try:
-        topics = db.query(Topic).filter(Topic.ai_neutral_headline != None).all()
+        # 숏폼이 없는 토픽만 한 번에 조회
+        query = db.query(Topic).filter(
+            Topic.ai_neutral_headline != None,
+            ~exists().where(Short.topic_id == Topic.id)
+        )
+        topics = dead_letter.filter_eligible(query, dead_letter.STAGE_SHORT, Topic.id).all()
         
         for topic in topics:
-            existing = db.query(Short).filter(Short.topic_id == topic.id).first()
-            if existing:
-                continue
-            
+            topic_id = topic.id
             try:
-                print(f">>> [Topic {topic.id}] 숏폼 생성 중...")
-                service.generate_short(topic.id, db)
+                print(f">>> [Topic {topic_id}] 숏폼 생성 중...")
+                service.generate_short(topic_id, db)
+                dead_letter.record_success(db, dead_letter.STAGE_SHORT, topic_id)
                 print(f"  - 완료")
             except Exception as e:
-                print(f"  - 실패: {e}")
+                db.rollback()
+                failure = dead_letter.record_failure(db, dead_letter.STAGE_SHORT, topic_id, e)
+                print(f"  - 실패 ({failure.attempts}회, {failure.status}): {e}")
                 continue
     finally:
         db.close()
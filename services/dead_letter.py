@@ -0,0 +1,138 @@
+"""
+Pipeline Dead-Letter Service - 실패 항목 재시도 백오프 및 데드레터 관리
+"""
+import datetime
+from typing import List, Optional, Set
+from sqlalchemy import select, or_
+from sqlalchemy.orm import Session, Query
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.database import PipelineFailure
+from services.stages import STAGE_TOPIC_SUMMARY, STAGE_ARTICLE_DETAILS, STAGE_SHORT, STAGE_DEBATE
+
+# 재시도/데드레터 대상 단계
+STAGES = (STAGE_TOPIC_SUMMARY, STAGE_ARTICLE_DETAILS, STAGE_SHORT, STAGE_DEBATE)
+
+STATUS_RETRYING = "retrying"
+STATUS_DEAD = "dead"
+
+MAX_ERROR_LENGTH = 2000
+
+
+def _parked_condition(stage: str):
+    now = datetime.datetime.utcnow()
+    return (
+        PipelineFailure.stage == stage,
+        or_(
+            PipelineFailure.status == STATUS_DEAD,
+            PipelineFailure.next_eligible_at > now
+        )
+    )
+
+
+def filter_eligible(query: Query, stage: str, id_column) -> Query:
+    """
+    작업 선택 쿼리에서 백오프 대기 중이거나 데드레터 상태인 항목 제외
+
+    Args:
+        query: 작업 대상 선택 쿼리
+        stage: 파이프라인 단계 이름
+        id_column: 항목 ID 컬럼 (예: Article.id)
+    """
+    parked = select(PipelineFailure.item_id).where(*_parked_condition(stage))
+    return query.filter(~id_column.in_(parked))
+
+
+def parked_item_ids(db: Session, stage: str) -> Set[int]:
+    """백오프 대기 중이거나 데드레터 상태인 항목 ID 집합"""
+    rows = db.query(PipelineFailure.item_id).filter(*_parked_condition(stage)).all()
+    return {row.item_id for row in rows}
+
+
+def backoff_seconds(attempts: int) -> int:
+    """시도 횟수에 따른 지수 백오프 대기 시간(초)"""
+    delay = settings.pipeline_retry_base_seconds * (2 ** max(attempts - 1, 0))
+    return min(delay, settings.pipeline_retry_max_seconds)
+
+
+def record_failure(db: Session, stage: str, item_id: int, error: Exception) -> PipelineFailure:
+    """
+    실패 기록 - 시도 횟수 증가, 다음 재시도 시각 계산, 한도 초과 시 데드레터 처리
+
+    호출 전에 실패한 작업의 변경 사항은 rollback 되어 있어야 합니다.
+    """
+    failure = db.query(PipelineFailure).filter(
+        PipelineFailure.stage == stage,
+        PipelineFailure.item_id == item_id
+    ).first()
+    if not failure:
+        failure = PipelineFailure(stage=stage, item_id=item_id, attempts=0)
+        db.add(failure)
+
+    now = datetime.datetime.utcnow()
+    failure.attempts += 1
+    failure.last_error = f"{type(error).__name__}: {error}"[:MAX_ERROR_LENGTH]
+    failure.updated_at = now
+
+    if failure.attempts >= settings.pipeline_max_attempts:
+        failure.status = STATUS_DEAD
+        failure.next_eligible_at = None
+    else:
+        failure.status = STATUS_RETRYING
+        failure.next_eligible_at = now + datetime.timedelta(seconds=backoff_seconds(failure.attempts))
+
+    db.commit()
+    return failure
+
+
+def record_success(db: Session, stage: str, item_id: int) -> None:
+    """성공한 항목의 실패 기록 삭제"""
+    deleted = db.query(PipelineFailure).filter(
+        PipelineFailure.stage == stage,
+        PipelineFailure.item_id == item_id
+    ).delete(synchronize_session=False)
+    if deleted:
+        db.commit()
+
+
+def list_failures(
+    db: Session,
+    stage: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 100
+) -> List[PipelineFailure]:
+    """실패 기록 조회 (최근 갱신 순)"""
+    query = db.query(PipelineFailure)
+    if stage:
+        query = query.filter(PipelineFailure.stage == stage)
+    if status:
+        query = query.filter(PipelineFailure.status == status)
+    return query.order_by(PipelineFailure.updated_at.desc()).limit(limit).all()
+
+
+def redrive(
+    db: Session,
+    stage: Optional[str] = None,
+    item_id: Optional[int] = None,
+    status: Optional[str] = STATUS_DEAD
+) -> int:
+    """
+    실패 항목을 다시 작업 대상으로 복귀 (실패 기록 삭제)
+
+    Returns:
+        복귀된 항목 수
+    """
+    query = db.query(PipelineFailure)
+    if stage:
+        query = query.filter(PipelineFailure.stage == stage)
+    if item_id is not None:
+        query = query.filter(PipelineFailure.item_id == item_id)
+    if status:
+        query = query.filter(PipelineFailure.status == status)
+    count = query.delete(synchronize_session=False)
+    db.commit()
+    return count
@@ -1,8 +1,9 @@
 """
 AI Debate Service - 긍정/중립/부정 관점 토론 생성
 """
-import json
 from typing import Dict, List, Optional
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 import sys
@@ -11,6 +12,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.database import SessionLocal, Topic, Article, Debate
 from services.ai_client import get_ai_client
+from services import dead_letter
+from services.content_hash import get_input_articles, compute_input_hash, DEBATE_ARTICLE_LIMIT
+from services.stages import STAGE_DEBATE
+from services.prompt_builder import ArticleSection, build_context, record_prompt_tokens
+from services.llm_ledger import ledger
+from services.event_bus import event_bus, DEBATE_UPDATED
 
 
 class DebateService:
@@ -19,13 +26,14 @@ class DebateService:
     def __init__(self):
         self.ai_client = get_ai_client()
     
-    def generate_debate(self, topic_id: int, db: Optional[Session] = None) -> Dict:
+    def generate_debate(self, topic_id: int, db: Optional[Session] = None, force: bool = False) -> Dict:
         """
         기사 토픽에 대해 AI들이 긍정/중립/부정 관점에서 토론하는 내용 생성
         
         Args:
             topic_id: Topic ID to generate debate for
             db: Optional database session
+            force: True이면 기존 토론이 있어도 새로 생성 (생성에 성공한 뒤에만 기존 행을 덮어씀)
         
         Returns:
             Debate content as dict
@@ -38,32 +46,39 @@ class DebateService:
         try:
             # Check if debate already exists
             existing_debate = db.query(Debate).filter(Debate.topic_id == topic_id).first()
-            if existing_debate:
-                return json.loads(existing_debate.content_json)
+            if existing_debate and not force:
+                return existing_debate.content_json
             
             # Get topic and articles
             topic = db.query(Topic).filter(Topic.id == topic_id).first()
             if not topic:
                 raise ValueError(f"Topic {topic_id} not found")
             
-            articles = db.query(Article).filter(Article.topic_id == topic_id).limit(5).all()
+            articles = get_input_articles(db, topic_id, DEBATE_ARTICLE_LIMIT)
             if not articles:
                 raise ValueError(f"No articles found for topic {topic_id}")
             
             # Prepare article summaries
             articles_text = self._prepare_articles_text(articles)
             headline = topic.ai_neutral_headline or articles[0].title
+            input_hash = compute_input_hash(articles, headline)
             
             # Generate debate
-            debate_content = self._generate_debate_content(headline, articles_text)
+            debate_content = self._generate_debate_content(headline, articles_text, topic_id)
             
             # Save to database
-            debate = Debate(
-                topic_id=topic_id,
-                content_json=json.dumps(debate_content, ensure_ascii=False)
-            )
-            db.add(debate)
+            if existing_debate:
+                existing_debate.content_json = debate_content
+                existing_debate.input_hash = input_hash
+            else:
+                debate = Debate(
+                    topic_id=topic_id,
+                    content_json=debate_content,
+                    input_hash=input_hash
+                )
+                db.add(debate)
             db.commit()
+            event_bus.publish(DEBATE_UPDATED, [topic_id])
             
             return debate_content
             
@@ -72,20 +87,22 @@ class DebateService:
                 db.close()
     
     def _prepare_articles_text(self, articles: List[Article]) -> str:
-        """Prepare article text for prompt"""
-        text_parts = []
+        """Prepare article text for prompt (토론 단계 토큰 예산 적용)"""
+        sections = []
         for i, art in enumerate(articles):
-            body_preview = art.body[:500] if art.body else ""
             source_name = art.source.name if art.source else "알수없음"
-            text_parts.append(
-                f"[기사 {i+1}]\n"
-                f"제목: {art.title}\n"
-                f"언론사: {source_name}\n"
-                f"내용: {body_preview}...\n"
-            )
-        return "\n".join(text_parts)
+            sections.append(ArticleSection(
+                header=(
+                    f"[기사 {i+1}]\n"
+                    f"제목: {art.title}\n"
+                    f"언론사: {source_name}\n"
+                    f"내용: "
+                ),
+                body=art.body or ""
+            ))
+        return build_context(STAGE_DEBATE, sections)
     
-    def _generate_debate_content(self, headline: str, articles_text: str) -> Dict:
+    def _generate_debate_content(self, headline: str, articles_text: str, topic_id: Optional[int] = None) -> Dict:
         """Generate debate content using AI"""
         
         system_prompt = """당신은 뉴스 토론 AI입니다. 
@@ -232,11 +249,14 @@ JSON 형식:
             "additionalProperties": False
         }
         
+        record_prompt_tokens(STAGE_DEBATE, system_prompt, user_prompt)
         return self.ai_client.chat_json(
             system_prompt, 
             user_prompt, 
             schema, 
-            "debate"
+            "debate",
+            stage=STAGE_DEBATE,
+            topic_id=topic_id
         )
     
     def get_debate(self, topic_id: int, db: Optional[Session] = None) -> Optional[Dict]:
@@ -258,19 +278,43 @@ JSON 형식:
         try:
             debate = db.query(Debate).filter(Debate.topic_id == topic_id).first()
             if debate:
-                return json.loads(debate.content_json)
+                return debate.content_json
             return None
         finally:
             if should_close:
                 db.close()
     
-    def regenerate_debate(self, topic_id: int, db: Optional[Session] = None) -> Dict:
+    async def get_debate_async(self, topic_id: int, db: AsyncSession) -> Optional[Dict]:
         """
-        Regenerate debate for a topic (deletes existing)
+        Get existing debate for a topic (async 라우트용)
+        
+        Args:
+            topic_id: Topic ID
+            db: Async database session
+        
+        Returns:
+            Debate content or None if not found
+        """
+        return await db.scalar(select(Debate.content_json).where(Debate.topic_id == topic_id))
+    
+    def current_input_hash(self, topic_id: int, db: Session) -> Optional[str]:
+        """현재 토픽 기사 기준 토론 입력 해시 (기사가 없으면 None)"""
+        topic = db.query(Topic).filter(Topic.id == topic_id).first()
+        if not topic:
+            raise ValueError(f"Topic {topic_id} not found")
+        articles = get_input_articles(db, topic_id, DEBATE_ARTICLE_LIMIT)
+        if not articles:
+            return None
+        return compute_input_hash(articles, topic.ai_neutral_headline or articles[0].title)
+    
+    def regenerate_debate(self, topic_id: int, db: Optional[Session] = None, force: bool = True) -> Dict:
+        """
+        Regenerate debate for a topic (생성에 실패하면 기존 토론 유지)
         
         Args:
             topic_id: Topic ID
             db: Optional database session
+            force: False이면 입력 해시가 같은 기존 토론을 그대로 반환 (API 호출 없음)
         
         Returns:
             New debate content
@@ -281,14 +325,13 @@ JSON 형식:
             should_close = True
         
         try:
-            # Delete existing debate
             existing = db.query(Debate).filter(Debate.topic_id == topic_id).first()
-            if existing:
-                db.delete(existing)
-                db.commit()
+            if existing and not force and existing.input_hash == self.current_input_hash(topic_id, db):
+                ledger.record(STAGE_DEBATE, cache_hit=True, topic_id=topic_id)
+                return existing.content_json
             
-            # Generate new debate
-            return self.generate_debate(topic_id, db)
+            # 새 토론을 만든 뒤 기존 행을 덮어씀 (실패/시간 초과 시 사용자에게 보이던 토론이 사라지지 않음)
+            return self.generate_debate(topic_id, db, force=True)
         finally:
             if should_close:
                 db.close()
@@ -300,21 +343,22 @@ def generate_debates_for_all_topics():
     service = DebateService()
     
     try:
-        topics = db.query(Topic).all()
+        # 토론이 없는 토픽만 한 번에 조회
+        query = db.query(Topic).filter(~exists().where(Debate.topic_id == Topic.id))
+        topics = dead_letter.filter_eligible(query, dead_letter.STAGE_DEBATE, Topic.id).all()
         print(f">>> {len(topics)}개 토픽에 대해 토론 생성 시작")
         
         for topic in topics:
-            existing = db.query(Debate).filter(Debate.topic_id == topic.id).first()
-            if existing:
-                print(f"  - [Topic {topic.id}] 이미 존재, 건너뜀")
-                continue
-            
+            topic_id = topic.id
             try:
-                print(f">>> [Topic {topic.id}] 토론 생성 중...")
-                service.generate_debate(topic.id, db)
+                print(f">>> [Topic {topic_id}] 토론 생성 중...")
+                service.generate_debate(topic_id, db)
+                dead_letter.record_success(db, dead_letter.STAGE_DEBATE, topic_id)
                 print(f"  - 완료")
             except Exception as e:
-                print(f"  - 실패: {e}")
+                db.rollback()
+                failure = dead_letter.record_failure(db, dead_letter.STAGE_DEBATE, topic_id, e)
+                print(f"  - 실패 ({failure.attempts}회, {failure.status}): {e}")
                 continue
     finally:
         db.close()
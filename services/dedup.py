@@ -0,0 +1,216 @@
+"""
+Near-Duplicate Detection - SimHash 기반 유사 중복 기사 탐지
+"""
+import re
+import hashlib
+from collections import Counter
+from typing import Optional
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, aliased
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.database import SessionLocal, Article, ArticleSimhashBand
+from services.stages import STAGE_ARTICLE_DETAILS
+from services.llm_ledger import ledger
+
+SIMHASH_BITS = 64
+# 64비트를 16비트 밴드 4개로 분할 - 해밍 거리 3 이하인 두 지문은 최소 한 밴드가 같음
+BAND_COUNT = 4
+BAND_BITS = SIMHASH_BITS // BAND_COUNT
+# 밴드 인덱스로 빠짐없이 찾을 수 있는 최대 해밍 거리 (다른 비트가 d개면 같은 밴드가 최소 BAND_COUNT - d개)
+MAX_INDEXED_HAMMING = BAND_COUNT - 1
+SHINGLE_SIZE = 4
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+_EMAIL = re.compile(r"\S+@\S+")
+
+# 본문 수집 실패 시 저장되는 문구 (지문 계산 제외)
+_FAILED_BODIES = ("본문 수집 실패", "본문 수집 오류")
+
+
+def max_hamming() -> int:
+    """중복으로 볼 최대 해밍 거리 (DEDUP_MAX_HAMMING, 밴드 인덱스가 보장하는 거리까지만)"""
+    return min(settings.dedup_max_hamming, MAX_INDEXED_HAMMING)
+
+
+if settings.dedup_max_hamming > MAX_INDEXED_HAMMING:
+    print(
+        f"!!! DEDUP_MAX_HAMMING={settings.dedup_max_hamming}은 밴드 인덱스가 찾을 수 있는 거리보다 커서 "
+        f"{MAX_INDEXED_HAMMING}(으)로 제한합니다."
+    )
+
+
+def normalize_text(text: str) -> str:
+    """공백/문장부호/이메일 제거 및 소문자화"""
+    text = _EMAIL.sub(" ", text or "")
+    return _NON_WORD.sub("", text).lower()
+
+
+def _hash64(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def compute_simhash(text: str) -> Optional[int]:
+    """
+    문자 4-gram 슁글 기반 64비트 SimHash (부호 없는 정수)
+
+    정규화된 텍스트가 너무 짧으면 오탐 위험이 커서 None을 반환합니다.
+    """
+    if not text or text.startswith(_FAILED_BODIES):
+        return None
+    normalized = normalize_text(text)
+    if len(normalized) < settings.dedup_min_text_length:
+        return None
+
+    weights = [0] * SIMHASH_BITS
+    shingles = Counter(
+        normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)
+    )
+    for shingle, count in shingles.items():
+        value = _hash64(shingle)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin((a ^ b) & ((1 << SIMHASH_BITS) - 1)).count("1")
+
+
+def to_signed(value: int) -> int:
+    """BIGINT 컬럼 저장용 부호 있는 64비트 정수 변환"""
+    return value - (1 << SIMHASH_BITS) if value >= 1 << (SIMHASH_BITS - 1) else value
+
+
+def to_unsigned(value: int) -> int:
+    return value & ((1 << SIMHASH_BITS) - 1)
+
+
+def _bands(fingerprint: int):
+    mask = (1 << BAND_BITS) - 1
+    return [(band, fingerprint >> (band * BAND_BITS) & mask) for band in range(BAND_COUNT)]
+
+
+def find_canonical_id(db: Session, fingerprint: int, exclude_id: Optional[int] = None) -> Optional[int]:
+    """
+    지문이 가까운 기존 기사의 대표 기사 ID 조회
+
+    Args:
+        fingerprint: 부호 없는 SimHash 값
+        exclude_id: 후보에서 제외할 기사 ID (자기 자신)
+    """
+    rows = db.query(ArticleSimhashBand.article_id).filter(
+        or_(*(
+            and_(ArticleSimhashBand.band == band, ArticleSimhashBand.value == value)
+            for band, value in _bands(fingerprint)
+        ))
+    ).all()
+    candidate_ids = {row.article_id for row in rows}
+    candidate_ids.discard(exclude_id)
+    if not candidate_ids:
+        return None
+
+    candidates = db.query(Article.id, Article.simhash, Article.canonical_id).filter(
+        Article.id.in_(candidate_ids)
+    ).all()
+
+    best = None
+    limit = max_hamming()
+    for candidate in candidates:
+        if candidate.simhash is None:
+            continue
+        distance = hamming_distance(fingerprint, to_unsigned(candidate.simhash))
+        if distance <= limit and (best is None or distance < best[0]):
+            best = (distance, candidate.canonical_id or candidate.id)
+    return best[1] if best else None
+
+
+def index_article(db: Session, article: Article) -> Optional[int]:
+    """
+    기사 지문을 계산해 인덱스에 등록하고 유사 중복이면 대표 기사에 연결
+
+    article.id가 필요하므로 호출 전에 flush 되어 있어야 합니다.
+
+    Returns:
+        연결된 대표 기사 ID (중복이 아니면 None)
+    """
+    fingerprint = compute_simhash(article.body)
+    if fingerprint is None:
+        return None
+
+    canonical_id = find_canonical_id(db, fingerprint, exclude_id=article.id)
+    article.simhash = to_signed(fingerprint)
+    article.canonical_id = canonical_id
+    if canonical_id is None:
+        # 대표 기사만 밴드 인덱스에 등록 (중복 기사는 대표 기사로 찾아짐)
+        db.add_all(
+            ArticleSimhashBand(article_id=article.id, band=band, value=value)
+            for band, value in _bands(fingerprint)
+        )
+    return canonical_id
+
+
+def propagate_canonical_analysis(db: Session) -> int:
+    """
+    대표 기사의 AI 분석 결과(대체제목/편향점수/요약/감정)를 중복 기사에 복사
+
+    Returns:
+        분석 결과가 복사된 기사 수
+    """
+    canonical = aliased(Article)
+    rows = db.query(Article, canonical).join(
+        canonical, Article.canonical_id == canonical.id
+    ).filter(
+        Article.ai_alternative_title == None,
+        canonical.ai_alternative_title != None
+    ).all()
+
+    for article, original in rows:
+        article.ai_alternative_title = original.ai_alternative_title
+        article.ai_bias_score = original.ai_bias_score
+        article.ai_reporter_summary = original.ai_reporter_summary
+        article.sentiment = original.sentiment
+        ledger.record(STAGE_ARTICLE_DETAILS, cache_hit=True, article_id=article.id)
+    if rows:
+        db.commit()
+    return len(rows)
+
+
+def backfill_fingerprints(batch_size: int = 200) -> int:
+    """지문이 없는 기존 기사를 ID 순으로 인덱싱"""
+    db = SessionLocal()
+    total = 0
+    duplicates = 0
+    try:
+        last_id = 0
+        while True:
+            articles = db.query(Article).filter(
+                Article.simhash == None,
+                Article.id > last_id
+            ).order_by(Article.id).limit(batch_size).all()
+            if not articles:
+                break
+            for article in articles:
+                if index_article(db, article):
+                    duplicates += 1
+                db.flush()
+            db.commit()
+            total += len(articles)
+            last_id = articles[-1].id
+        print(f">>> 지문 백필 완료: {total}건 확인, 중복 {duplicates}건 연결")
+        return total
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_fingerprints()
@@ -0,0 +1,238 @@
+"""
+Event Bus - 파이프라인 쓰기 → API 워커(캐시/색인/실시간 스트림) 변경 알림
+
+- postgres: LISTEN/NOTIFY (pg_notify로 발행, 워커마다 전용 커넥션 하나로 수신)
+- table: change_events 테이블에 쓰고 워커가 주기적으로 새 행을 읽음 (SQLite 등 로컬 실행)
+- memory: 같은 프로세스 안에서만 전달 (테스트/단일 프로세스)
+EVENT_BUS_BACKEND=auto면 PostgreSQL은 postgres, 그 외 DB는 table을 사용합니다.
+
+발행한 프로세스의 구독자에게는 즉시 전달하고, 백엔드로 돌아온 자기 이벤트는 origin으로 걸러냅니다.
+발행이 실패해도 파이프라인은 멈추지 않으며, 구독자는 TTL 만료로 결국 최신 상태가 됩니다.
+수신 연결이 끊겼다 다시 붙으면 그 사이 이벤트를 놓쳤을 수 있으므로 RESYNC 이벤트를 전달합니다.
+"""
+import datetime
+import json
+import select as select_module
+import socket
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.engine import make_url
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.database import engine, SessionLocal, ChangeEvent
+from core.metrics import BUS_EVENTS
+
+# 이벤트 종류 (ids: 해당 토픽/기사 id)
+ARTICLES_CREATED = "articles.created"
+ARTICLES_UPDATED = "articles.updated"
+TOPICS_CREATED = "topics.created"
+TOPICS_UPDATED = "topics.updated"
+SHORT_UPDATED = "short.updated"
+DEBATE_UPDATED = "debate.updated"
+# 수신이 끊겼다 복구됨 - 놓친 이벤트가 있을 수 있으니 캐시 전체를 비울 것
+RESYNC = "bus.resync"
+
+# NOTIFY payload는 8000바이트 제한이 있어 id를 나눠 보냄
+NOTIFY_IDS_PER_MESSAGE = 500
+BACKENDS = ("postgres", "table", "memory")
+
+
+@dataclass(frozen=True)
+class BusEvent:
+    kind: str
+    ids: Tuple[int, ...] = ()
+    origin: Optional[str] = None
+
+    def to_json(self) -> str:
+        return json.dumps({"kind": self.kind, "ids": list(self.ids), "origin": self.origin})
+
+    @classmethod
+    def from_json(cls, payload: str) -> "BusEvent":
+        data = json.loads(payload)
+        return cls(data["kind"], tuple(data.get("ids") or ()), data.get("origin"))
+
+
+Handler = Callable[[BusEvent], None]
+
+
+class EventBus:
+    def __init__(self):
+        self._handlers: List[Tuple[Tuple[str, ...], Handler]] = []
+        self._nonce = uuid.uuid4().hex[:8]
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._last_prune = 0.0
+
+    @property
+    def origin(self) -> str:
+        # 워커 프로세스가 fork되어도 구분되도록 pid 포함
+        return f"{socket.gethostname()}:{os.getpid()}:{self._nonce}"
+
+    @property
+    def backend(self) -> str:
+        backend = settings.event_bus_backend.lower()
+        if backend == "auto":
+            return "postgres" if engine.dialect.name == "postgresql" else "table"
+        if backend not in BACKENDS:
+            raise ValueError(f"알 수 없는 EVENT_BUS_BACKEND입니다: {backend}")
+        return backend
+
+    # --- 구독 ---
+    def subscribe(self, kinds: Union[str, Iterable[str]], handler: Handler) -> None:
+        """
+        이벤트 구독 ("*"은 전체)
+
+        핸들러는 발행 스레드(파이프라인) 또는 수신 스레드에서 호출되므로 스레드 안전하고 빨라야 합니다.
+        """
+        kinds = (kinds,) if isinstance(kinds, str) else tuple(kinds)
+        self._handlers.append((kinds, handler))
+
+    def _dispatch(self, event: BusEvent) -> None:
+        for kinds, handler in self._handlers:
+            if event.kind in kinds or "*" in kinds:
+                try:
+                    handler(event)
+                except Exception as e:
+                    print(f"!!! 이벤트 처리 실패 ({event.kind}, {getattr(handler, '__qualname__', handler)}): {e}")
+
+    def _receive(self, payload: str) -> None:
+        try:
+            event = BusEvent.from_json(payload)
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"!!! 잘못된 이벤트 payload 무시: {e}")
+            return
+        if event.origin == self.origin:
+            return
+        BUS_EVENTS.labels(direction="received", kind=event.kind).inc()
+        self._dispatch(event)
+
+    # --- 발행 ---
+    def publish(self, kind: str, ids: Iterable[int] = ()) -> None:
+        """변경 이벤트 발행 (커밋 후 호출, 실패해도 예외를 올리지 않음)"""
+        event = BusEvent(kind, tuple(sorted({int(i) for i in ids if i is not None})), self.origin)
+        BUS_EVENTS.labels(direction="published", kind=kind).inc()
+        self._dispatch(event)
+        try:
+            backend = self.backend
+            if backend == "postgres":
+                self._publish_postgres(event)
+            elif backend == "table":
+                self._publish_table(event)
+        except Exception as e:
+            print(f"!!! 이벤트 발행 실패 ({kind}): {e}")
+
+    def _publish_postgres(self, event: BusEvent) -> None:
+        chunks = [
+            event.ids[i:i + NOTIFY_IDS_PER_MESSAGE]
+            for i in range(0, len(event.ids), NOTIFY_IDS_PER_MESSAGE)
+        ] or [()]
+        with engine.begin() as conn:
+            for chunk in chunks:
+                conn.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": settings.event_bus_channel,
+                     "payload": BusEvent(event.kind, chunk, event.origin).to_json()}
+                )
+
+    def _publish_table(self, event: BusEvent) -> None:
+        with engine.begin() as conn:
+            conn.execute(insert(ChangeEvent).values(kind=event.kind, payload=event.to_json()))
+            # 오래된 이벤트 정리 (워커는 시작 시점 이후만 읽으므로 보존 기간이 지나면 불필요)
+            if time.monotonic() - self._last_prune > 60:
+                cutoff = datetime.datetime.utcnow() - datetime.timedelta(seconds=settings.event_bus_retention_seconds)
+                conn.execute(delete(ChangeEvent).where(ChangeEvent.created_at < cutoff))
+                self._last_prune = time.monotonic()
+
+    # --- 수신 ---
+    def start(self) -> None:
+        """다른 프로세스의 이벤트 수신 시작 (API 워커 시작 시 호출)"""
+        backend = self.backend
+        if backend == "memory" or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        target = self._listen_postgres if backend == "postgres" else self._poll_table
+        self._thread = threading.Thread(target=target, name=f"event-bus-{backend}", daemon=True)
+        self._thread.start()
+        print(f">>> 이벤트 버스 수신 시작 ({backend})")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    def _listen_postgres(self) -> None:
+        import psycopg2
+        import psycopg2.extensions
+
+        dsn = make_url(settings.sqlalchemy_database_url).set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        connected_before = False
+        backoff = 1.0
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(dsn)
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{settings.event_bus_channel}"')
+                if connected_before:
+                    self._dispatch(BusEvent(RESYNC, (), self.origin))
+                connected_before = True
+                backoff = 1.0
+                while not self._stop.is_set():
+                    if select_module.select([conn], [], [], 1.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self._receive(conn.notifies.pop(0).payload)
+            except Exception as e:
+                print(f"!!! 이벤트 버스 수신 연결 오류 ({backoff:.0f}초 후 재시도): {e}")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 60.0)
+            finally:
+                if conn is not None:
+                    conn.close()
+
+    def _poll_table(self) -> None:
+        last_id = None
+        failed = False
+        while True:
+            try:
+                with SessionLocal() as db:
+                    if last_id is None:
+                        # 수신 시작 이후 이벤트만 처리
+                        last_id = db.scalar(select(func.max(ChangeEvent.id))) or 0
+                        rows = []
+                    else:
+                        rows = db.execute(
+                            select(ChangeEvent.id, ChangeEvent.payload)
+                            .where(ChangeEvent.id > last_id)
+                            .order_by(ChangeEvent.id)
+                            .limit(1000)
+                        ).all()
+                for event_id, payload in rows:
+                    last_id = event_id
+                    self._receive(payload)
+                if failed:
+                    self._dispatch(BusEvent(RESYNC, (), self.origin))
+                    failed = False
+            except Exception as e:
+                if not failed:
+                    print(f"!!! 이벤트 버스 테이블 조회 오류: {e}")
+                failed = True
+            if self._stop.wait(settings.event_bus_poll_seconds):
+                return
+
+
+event_bus = EventBus()
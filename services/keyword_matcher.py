@@ -0,0 +1,417 @@
+"""
+Keyword Matcher - 사용자 관심 키워드(User.keywords)로 토픽을 찾는 메모리 색인
+
+최근 N일 토픽의 헤드라인/기사 제목/카테고리를 문자 bigram 역색인으로 보관합니다.
+한국어 키워드는 조사가 붙어 단어 단위로 자르기 어려우므로, 키워드의 bigram posting 교집합으로
+후보 토픽을 고른 뒤 부분 문자열 비교로 확인합니다.
+
+색인은 워커마다 메모리에 있고 요청 시점에 증분 갱신됩니다.
+- 마지막으로 색인한 토픽 id보다 큰 토픽(새 토픽)을 추가
+- 파이프라인이 아직 헤드라인/편향 점수를 채우는 최근 토픽(resync 구간)은 다시 읽어 교체
+- invalidate(topic_ids)로 지정한 토픽은 다음 갱신 때 다시 읽음 (services/event_bus.py의 토픽 변경 이벤트)
+
+KeywordAutomaton은 여러 사용자의 키워드를 Aho-Corasick 오토마톤 하나로 묶어, 새 기사/토픽 텍스트를
+한 번만 훑어 매칭되는 키워드를 모두 찾습니다 (services/keyword_watch.py의 실시간 알림).
+"""
+import asyncio
+import datetime
+import math
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.database import Topic, Article
+from core.metrics import record_cache
+from services.event_bus import event_bus, TOPICS_CREATED, TOPICS_UPDATED, RESYNC
+
+# 매칭 위치별 가중치 (헤드라인 > 카테고리 > 기사 제목 1건당)
+HEADLINE_WEIGHT = 3.0
+CATEGORY_WEIGHT = 1.0
+ARTICLE_TITLE_WEIGHT = 1.0
+# 한 키워드가 한 토픽에서 기사 제목으로 얻을 수 있는 최대 점수
+MAX_ARTICLE_MATCHES = 3
+MAX_KEYWORDS = 20
+
+_SPACE = re.compile(r"\s+")
+_KEYWORD_SEPARATORS = re.compile(r"[,\n#;]+")
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """소문자 + 공백 정리 (색인/키워드 공통)"""
+    return _SPACE.sub(" ", (text or "").lower()).strip()
+
+
+def parse_keywords(raw: Optional[str]) -> List[str]:
+    """User.keywords 문자열("부동산, 금리, #AI")을 정규화된 키워드 목록으로 변환"""
+    keywords: List[str] = []
+    for part in _KEYWORD_SEPARATORS.split(raw or ""):
+        keyword = normalize_text(part)
+        if keyword and keyword not in keywords:
+            keywords.append(keyword)
+    return keywords[:MAX_KEYWORDS]
+
+
+def _grams(text: str) -> Set[str]:
+    """색인 키: 모든 문자(1-gram)와 인접 문자쌍(2-gram)"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    grams.discard(" ")
+    return grams
+
+
+def _query_grams(keyword: str) -> Set[str]:
+    """키워드 후보 검색용 키 (2자 이상이면 bigram만 사용)"""
+    if len(keyword) == 1:
+        return {keyword}
+    return {keyword[i:i + 2] for i in range(len(keyword) - 1)} - {" "}
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 다중 키워드 매처 (텍스트 길이에 비례, 키워드 수와 무관)"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[Tuple[str, ...]] = [()]
+        self.keywords: Set[str] = set()
+        for keyword in keywords:
+            keyword = normalize_text(keyword)
+            if keyword:
+                self._add(keyword)
+        self._build_failure_links()
+
+    def _add(self, keyword: str) -> None:
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append(())
+            state = next_state
+        if keyword not in self._outputs[state]:
+            self._outputs[state] += (keyword,)
+        self.keywords.add(keyword)
+
+    def _build_failure_links(self) -> None:
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._outputs[next_state] += self._outputs[self._fail[next_state]]
+
+    def find(self, text: Optional[str]) -> Set[str]:
+        """텍스트에 나타나는 키워드 집합"""
+        found: Set[str] = set()
+        if not self.keywords:
+            return found
+        state = 0
+        for char in normalize_text(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._outputs[state]:
+                found.update(self._outputs[state])
+        return found
+
+
+@dataclass(frozen=True)
+class IndexedArticle:
+    article_id: int
+    title: str
+    category: Optional[str]
+    ai_bias_score: Optional[float]
+    image_url: Optional[str]
+    normalized_title: str
+
+    def passes_bias_filter(self, bias_filter_level: Optional[float]) -> bool:
+        """편향 점수(0=중립, 10=매우 편향)가 사용자 허용치 이하인지 (미분석 기사는 통과)"""
+        if bias_filter_level is None or self.ai_bias_score is None:
+            return True
+        return self.ai_bias_score <= bias_filter_level
+
+
+@dataclass
+class IndexedTopic:
+    topic_id: int
+    created_at: Optional[datetime.datetime]
+    headline: Optional[str]
+    articles: List[IndexedArticle] = field(default_factory=list)
+
+    @property
+    def display_headline(self) -> Optional[str]:
+        if self.headline:
+            return self.headline
+        return self.articles[0].title if self.articles else None
+
+    @property
+    def category(self) -> Optional[str]:
+        """가장 많이 나타나는 기사 카테고리 (영문 코드)"""
+        categories = [a.category for a in self.articles if a.category]
+        if not categories:
+            return None
+        return Counter(categories).most_common(1)[0][0]
+
+    @property
+    def normalized_headline(self) -> str:
+        return normalize_text(self.headline)
+
+    @property
+    def normalized_category(self) -> str:
+        """영문 코드와 한국어 이름 둘 다 매칭되도록 함께 보관"""
+        # api 패키지가 이 모듈을 import하므로 순환 import를 피해 사용 시점에 import
+        from api.common import translate_category_to_korean
+        codes = {a.category for a in self.articles if a.category}
+        names = {translate_category_to_korean(c) for c in codes}
+        return normalize_text(" ".join(sorted(codes | names)))
+
+    def index_text(self) -> str:
+        return " ".join(
+            [self.normalized_headline, self.normalized_category]
+            + [a.normalized_title for a in self.articles]
+        )
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """키워드 하나가 토픽 하나에서 매칭된 위치"""
+    headline: bool
+    category: bool
+    article_ids: Tuple[int, ...]
+
+
+@dataclass
+class FeedEntry:
+    topic: IndexedTopic
+    articles: List[IndexedArticle]
+    matched_keywords: List[str]
+    relevance: float
+    score: float
+
+
+class TopicKeywordIndex:
+    def __init__(self):
+        self._topics: Dict[int, IndexedTopic] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._grams_by_topic: Dict[int, Set[str]] = {}
+        self._max_topic_id = 0
+        self._loaded = False
+        self._next_refresh_at = 0.0
+        self._version = 0
+        # 키워드 → {topic_id: KeywordHit} (색인 버전이 바뀌면 비움)
+        self._keyword_cache: Dict[str, Dict[int, KeywordHit]] = {}
+        self._stale_ids: Set[int] = set()
+        self._stale_lock = threading.Lock()
+        self._refresh_lock: Optional[asyncio.Lock] = None
+
+    # --- 갱신 ---
+    def invalidate(self, topic_ids: Optional[Iterable[int]] = None) -> None:
+        """
+        다음 요청에서 색인 갱신 (파이프라인 스레드에서도 호출 가능)
+
+        topic_ids를 주면 해당 토픽을 resync 구간 밖이어도 다시 읽습니다.
+        """
+        with self._stale_lock:
+            if topic_ids:
+                self._stale_ids.update(topic_ids)
+            self._next_refresh_at = 0.0
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        """갱신 주기가 지났으면 증분 갱신 (이미 갱신 중이면 기존 색인으로 응답)"""
+        if self._loaded and time.monotonic() < self._next_refresh_at:
+            return
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        if self._loaded and self._refresh_lock.locked():
+            return
+        async with self._refresh_lock:
+            if self._loaded and time.monotonic() < self._next_refresh_at:
+                return
+            await self.refresh(db)
+
+    async def refresh(self, db: AsyncSession) -> int:
+        """새 토픽/최근 토픽/무효화된 토픽을 다시 읽어 색인에 반영, 반영한 토픽 수 반환"""
+        with self._stale_lock:
+            stale_ids, self._stale_ids = self._stale_ids, set()
+            self._next_refresh_at = time.monotonic() + settings.feed_index_refresh_seconds
+
+        now = datetime.datetime.utcnow()
+        window_start = now - datetime.timedelta(days=settings.feed_index_window_days)
+        conditions = [Topic.id > self._max_topic_id]
+        if self._loaded:
+            conditions.append(Topic.created_at >= now - datetime.timedelta(hours=settings.feed_index_resync_hours))
+        if stale_ids:
+            conditions.append(Topic.id.in_(stale_ids))
+
+        try:
+            rows = (await db.execute(
+                select(
+                    Topic.id, Topic.created_at, Topic.ai_neutral_headline,
+                    Article.id, Article.title, Article.category, Article.ai_bias_score, Article.image_url
+                )
+                .join(Article, Article.topic_id == Topic.id)
+                .where(Topic.created_at >= window_start, or_(*conditions))
+                .order_by(Topic.id, Article.id)
+            )).all()
+        except Exception:
+            # 다음 요청에서 다시 시도
+            with self._stale_lock:
+                self._stale_ids |= stale_ids
+                self._next_refresh_at = 0.0
+            raise
+
+        loaded: Dict[int, IndexedTopic] = {}
+        for topic_id, created_at, headline, article_id, title, category, bias, image_url in rows:
+            topic = loaded.get(topic_id)
+            if topic is None:
+                topic = loaded[topic_id] = IndexedTopic(topic_id, created_at, headline)
+            topic.articles.append(IndexedArticle(
+                article_id, title or "", category, bias, image_url, normalize_text(title)
+            ))
+
+        # 여기부터는 await 없이 한 번에 반영 (이벤트 루프의 다른 요청이 중간 상태를 보지 않음)
+        for topic_id in stale_ids - set(loaded):
+            self._remove(topic_id)
+        for topic in loaded.values():
+            self._put(topic)
+        for topic_id in [t.topic_id for t in self._topics.values() if t.created_at and t.created_at < window_start]:
+            self._remove(topic_id)
+        if loaded:
+            self._max_topic_id = max(self._max_topic_id, max(loaded))
+        self._loaded = True
+        self._version += 1
+        self._keyword_cache.clear()
+        return len(loaded)
+
+    def _put(self, topic: IndexedTopic) -> None:
+        self._remove(topic.topic_id)
+        grams = _grams(topic.index_text())
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(topic.topic_id)
+        self._topics[topic.topic_id] = topic
+        self._grams_by_topic[topic.topic_id] = grams
+
+    def _remove(self, topic_id: int) -> None:
+        if self._topics.pop(topic_id, None) is None:
+            return
+        for gram in self._grams_by_topic.pop(topic_id, ()):
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.discard(topic_id)
+                if not postings:
+                    del self._postings[gram]
+
+    # --- 조회 ---
+    def match_keyword(self, keyword: str) -> Dict[int, KeywordHit]:
+        """키워드가 나타나는 토픽과 위치 (색인 버전 단위로 캐시)"""
+        cached = self._keyword_cache.get(keyword)
+        record_cache("feed_keyword", hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        candidates: Optional[Set[int]] = None
+        for gram in sorted(_query_grams(keyword), key=lambda g: len(self._postings.get(g, ()))):
+            postings = self._postings.get(gram)
+            if not postings:
+                candidates = set()
+                break
+            candidates = set(postings) if candidates is None else candidates & postings
+            if not candidates:
+                break
+
+        hits: Dict[int, KeywordHit] = {}
+        for topic_id in candidates or ():
+            topic = self._topics[topic_id]
+            article_ids = tuple(a.article_id for a in topic.articles if keyword in a.normalized_title)
+            headline = keyword in topic.normalized_headline
+            category = keyword in topic.normalized_category
+            if headline or category or article_ids:
+                hits[topic_id] = KeywordHit(headline, category, article_ids)
+        self._keyword_cache[keyword] = hits
+        return hits
+
+    def feed(self, keywords: List[str], bias_filter_level: Optional[float]) -> List[FeedEntry]:
+        """
+        사용자 피드 (점수 내림차순)
+
+        - 키워드가 있으면 매칭된 토픽만, 없으면 색인 구간의 전체 토픽을 최신순 가중치로 반환
+        - 편향 점수가 허용치를 넘는 기사는 제외하고, 남은 기사가 없는 토픽도 제외
+        - score = 관련도(매칭 위치 가중합) × 최신성(반감기 feed_recency_half_life_hours)
+        """
+        if keywords:
+            matched: Dict[int, Dict[str, KeywordHit]] = {}
+            for keyword in keywords:
+                for topic_id, hit in self.match_keyword(keyword).items():
+                    matched.setdefault(topic_id, {})[keyword] = hit
+        else:
+            matched = {topic_id: {} for topic_id in self._topics}
+
+        now = datetime.datetime.utcnow()
+        half_life = max(settings.feed_recency_half_life_hours, 1e-6)
+        entries: List[FeedEntry] = []
+        for topic_id, hits in matched.items():
+            topic = self._topics[topic_id]
+            articles = [a for a in topic.articles if a.passes_bias_filter(bias_filter_level)]
+            if not articles:
+                continue
+            visible_ids = {a.article_id for a in articles}
+
+            relevance = 0.0
+            matched_keywords = []
+            for keyword, hit in hits.items():
+                article_matches = sum(1 for article_id in hit.article_ids if article_id in visible_ids)
+                keyword_score = (
+                    HEADLINE_WEIGHT * hit.headline
+                    + CATEGORY_WEIGHT * hit.category
+                    + ARTICLE_TITLE_WEIGHT * min(article_matches, MAX_ARTICLE_MATCHES)
+                )
+                if keyword_score:
+                    relevance += keyword_score
+                    matched_keywords.append(keyword)
+            if keywords and not matched_keywords:
+                continue
+
+            age_hours = max(0.0, (now - topic.created_at).total_seconds() / 3600) if topic.created_at else 0.0
+            recency = math.pow(0.5, age_hours / half_life)
+            score = (relevance or 1.0) * recency
+            entries.append(FeedEntry(topic, articles, matched_keywords, relevance, score))
+
+        entries.sort(key=lambda e: (e.score, e.topic.topic_id), reverse=True)
+        return entries
+
+    @property
+    def size(self) -> int:
+        return len(self._topics)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+
+topic_keyword_index = TopicKeywordIndex()
+
+
+def _on_topics_changed(event) -> None:
+    # 새 토픽은 id 기준으로 읽히므로 갱신 시점만 당기고, 수정된 토픽은 id를 지정해 다시 읽음
+    topic_keyword_index.invalidate(event.ids if event.kind == TOPICS_UPDATED else None)
+
+
+event_bus.subscribe((TOPICS_CREATED, TOPICS_UPDATED, RESYNC), _on_topics_changed)
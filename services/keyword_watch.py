@@ -0,0 +1,262 @@
+"""
+Keyword Watch - 관심 키워드 실시간 알림(SSE) 구독 관리와 새 기사/토픽 매칭
+
+연결마다 사용자 키워드로 구독을 등록하고, 새 기사/토픽은 모든 구독 키워드를 묶은
+KeywordAutomaton(services/keyword_matcher.py)으로 한 번만 훑어 매칭된 구독들의 큐에 넣습니다.
+
+- 새 기사/토픽은 마지막으로 확인한 id 이후를 주기적으로 읽어 감지합니다 (구독이 있을 때만 실행,
+  파이프라인이 다른 프로세스에서 돌아도 동작). 크롤링/군집화 이벤트(services/event_bus.py)를 받으면 즉시 확인
+- 연결별 큐는 크기가 제한되어 있어, 느린 클라이언트의 큐가 가득 차면 가장 오래된 이벤트를 버리고
+  버린 건수를 다음 전송 때 lagged 이벤트로 알립니다 (메모리는 연결 수 × 큐 크기로 제한)
+"""
+import asyncio
+import contextvars
+import itertools
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.database import AsyncSessionLocal, Topic, Article
+from core.metrics import STREAM_CONNECTIONS, STREAM_EVENTS
+from services.keyword_matcher import KeywordAutomaton
+from services.event_bus import event_bus, ARTICLES_CREATED, TOPICS_CREATED
+
+# 한 번의 확인에서 읽는 최대 기사/토픽 수 (더 있으면 바로 이어서 확인)
+POLL_BATCH_SIZE = 500
+
+
+class WatchCapacityExceeded(Exception):
+    """동시 연결 수 한도 초과"""
+
+
+@dataclass(frozen=True)
+class WatchEvent:
+    event: str  # article | topic
+    event_id: str
+    data: Dict
+
+
+class Subscription:
+    def __init__(self, subscription_id: int, user_id: int, keywords: Tuple[str, ...], queue_size: int):
+        self.id = subscription_id
+        self.user_id = user_id
+        self.keywords = keywords
+        self.queue: "asyncio.Queue[WatchEvent]" = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def offer(self, event: WatchEvent) -> bool:
+        """큐에 넣기 (가득 차면 가장 오래된 이벤트를 버리고 False)"""
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.queue.get_nowait()
+            self.dropped += 1
+            self.queue.put_nowait(event)
+            return False
+
+    def take_dropped(self) -> int:
+        dropped, self.dropped = self.dropped, 0
+        return dropped
+
+
+class KeywordWatchHub:
+    def __init__(self):
+        self._subscriptions: Dict[int, Subscription] = {}
+        self._subscribers_by_keyword: Dict[str, Set[int]] = {}
+        self._automaton: Optional[KeywordAutomaton] = None
+        self._ids = itertools.count(1)
+        self._last_article_id: Optional[int] = None
+        self._last_topic_id: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake_event: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+
+    # --- 구독 ---
+    def subscribe(self, user_id: int, keywords: List[str]) -> Subscription:
+        """연결 등록 (이벤트 루프 안에서 호출, 첫 구독이면 감시 작업 시작)"""
+        if not self.has_capacity():
+            raise WatchCapacityExceeded("실시간 알림 연결 수가 한도에 도달했습니다.")
+
+        subscription = Subscription(next(self._ids), user_id, tuple(keywords), settings.keyword_watch_queue_size)
+        self._subscriptions[subscription.id] = subscription
+        for keyword in subscription.keywords:
+            self._subscribers_by_keyword.setdefault(keyword, set()).add(subscription.id)
+        self._automaton = None
+        STREAM_CONNECTIONS.set(len(self._subscriptions))
+
+        if self._task is None or self._task.done():
+            with self._lock:
+                self._loop = asyncio.get_running_loop()
+                self._wake_event = asyncio.Event()
+            # 요청 컨텍스트(쿼리 카운터 등)를 물려받지 않도록 빈 컨텍스트에서 실행
+            self._task = self._loop.create_task(self._run(), context=contextvars.Context())
+        return subscription
+
+    def has_capacity(self) -> bool:
+        return len(self._subscriptions) < settings.keyword_watch_max_connections
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        if self._subscriptions.pop(subscription.id, None) is None:
+            return
+        for keyword in subscription.keywords:
+            subscribers = self._subscribers_by_keyword.get(keyword)
+            if subscribers is not None:
+                subscribers.discard(subscription.id)
+                if not subscribers:
+                    del self._subscribers_by_keyword[keyword]
+        self._automaton = None
+        STREAM_CONNECTIONS.set(len(self._subscriptions))
+
+    @property
+    def connection_count(self) -> int:
+        return len(self._subscriptions)
+
+    # --- 매칭/전달 ---
+    def _get_automaton(self) -> KeywordAutomaton:
+        # 구독이 바뀐 뒤 첫 매칭 때만 다시 만듦 (연결이 몰려도 확인 주기당 한 번)
+        if self._automaton is None:
+            self._automaton = KeywordAutomaton(self._subscribers_by_keyword)
+        return self._automaton
+
+    def dispatch(self, items: List[Tuple[str, str, str, Dict]]) -> int:
+        """
+        새 기사/토픽을 구독자 큐에 전달
+
+        Args:
+            items: (이벤트 종류, 이벤트 id, 매칭할 텍스트, 전송할 데이터) 목록
+
+        Returns:
+            큐에 넣은 이벤트 수
+        """
+        if not self._subscriptions:
+            return 0
+        automaton = self._get_automaton()
+        delivered = 0
+        for event, event_id, text, data in items:
+            matched: Dict[int, List[str]] = {}
+            for keyword in sorted(automaton.find(text)):
+                for subscription_id in self._subscribers_by_keyword.get(keyword, ()):
+                    matched.setdefault(subscription_id, []).append(keyword)
+            for subscription_id, keywords in matched.items():
+                subscription = self._subscriptions.get(subscription_id)
+                if subscription is None:
+                    continue
+                ok = subscription.offer(WatchEvent(event, event_id, {**data, "matched_keywords": keywords}))
+                STREAM_EVENTS.labels(result="delivered" if ok else "dropped").inc()
+                delivered += 1
+        return delivered
+
+    # --- 새 기사/토픽 감지 ---
+    async def poll_once(self, db: AsyncSession) -> bool:
+        """
+        마지막 확인 이후의 기사/토픽을 읽어 전달
+
+        Returns:
+            아직 읽지 않은 항목이 남아 있으면 True
+        """
+        if self._last_article_id is None or self._last_topic_id is None:
+            # 감시 시작 시점 이후 항목만 알림 (과거 기사를 한꺼번에 보내지 않음)
+            self._last_article_id = await db.scalar(select(func.max(Article.id))) or 0
+            self._last_topic_id = await db.scalar(select(func.max(Topic.id))) or 0
+            return False
+
+        articles = (await db.execute(
+            select(Article.id, Article.title, Article.category, Article.topic_id, Article.url)
+            .where(Article.id > self._last_article_id)
+            .order_by(Article.id)
+            .limit(POLL_BATCH_SIZE)
+        )).all()
+        # api 패키지가 이 모듈을 import하므로 순환 import를 피해 사용 시점에 import
+        from api.common import translate_category_to_korean
+        items = [
+            ("article", f"article-{article_id}",
+             f"{title or ''} {category or ''} {translate_category_to_korean(category) or ''}", {
+                "article_id": article_id,
+                "title": title,
+                "category": category,
+                "topic_id": topic_id,
+                "url": url,
+            })
+            for article_id, title, category, topic_id, url in articles
+        ]
+        if articles:
+            self._last_article_id = articles[-1][0]
+
+        topic_ids = list((await db.scalars(
+            select(Topic.id).where(Topic.id > self._last_topic_id).order_by(Topic.id).limit(POLL_BATCH_SIZE)
+        )).all())
+        if topic_ids:
+            rows = (await db.execute(
+                select(Article.topic_id, Article.title, Topic.ai_neutral_headline)
+                .join(Topic, Article.topic_id == Topic.id)
+                .where(Article.topic_id.in_(topic_ids))
+                .order_by(Article.topic_id, Article.id)
+            )).all()
+            titles: Dict[int, List[str]] = {}
+            headlines: Dict[int, Optional[str]] = {}
+            for topic_id, title, headline in rows:
+                titles.setdefault(topic_id, []).append(title or "")
+                headlines[topic_id] = headline
+            # 군집화는 토픽 생성과 기사 배정을 따로 커밋하므로, 아직 기사가 없는 마지막 토픽들은 다음 확인 때 다시 읽음
+            for topic_id in topic_ids:
+                if topic_id not in titles:
+                    continue
+                headline = headlines[topic_id] or titles[topic_id][0]
+                items.append(("topic", f"topic-{topic_id}", " ".join([headline] + titles[topic_id]), {
+                    "topic_id": topic_id,
+                    "headline": headline,
+                    "article_count": len(titles[topic_id]),
+                }))
+                self._last_topic_id = topic_id
+
+        self.dispatch(items)
+        return len(articles) == POLL_BATCH_SIZE or len(topic_ids) == POLL_BATCH_SIZE
+
+    async def _run(self) -> None:
+        while self._subscriptions:
+            more = False
+            try:
+                async with AsyncSessionLocal() as db:
+                    more = await self.poll_once(db)
+            except Exception as e:
+                print(f"!!! 키워드 알림 확인 실패: {e}")
+            if more:
+                continue
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), timeout=settings.keyword_watch_poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake_event.clear()
+        # 다음 감시 시작 때 그 시점부터 다시 알림
+        self._last_article_id = self._last_topic_id = None
+
+    def wake(self) -> None:
+        """새 항목을 바로 확인 (파이프라인 스레드에서도 호출 가능)"""
+        with self._lock:
+            loop, wake_event = self._loop, self._wake_event
+        if loop is not None and wake_event is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wake_event.set)
+
+    async def close(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+keyword_watch = KeywordWatchHub()
+# 크롤링/군집화가 커밋하면 다음 확인 주기를 기다리지 않고 바로 확인
+event_bus.subscribe((ARTICLES_CREATED, TOPICS_CREATED), lambda event: keyword_watch.wake())
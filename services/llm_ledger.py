@@ -0,0 +1,192 @@
+"""
+LLM Call Ledger - LLM 호출 기록(단계/모델/토큰/지연시간) 배치 저장 및 집계
+"""
+import atexit
+import datetime
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+from sqlalchemy import case, func, insert, select
+from sqlalchemy.orm import Session
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.database import SessionLocal, LLMCall
+from core.metrics import record_cache
+
+
+class LLMLedger:
+    """LLM 호출 기록 버퍼 - 일정 건수/시간마다 한 번에 INSERT"""
+
+    def __init__(self, batch_size: Optional[int] = None, flush_seconds: Optional[int] = None):
+        self.batch_size = batch_size or settings.llm_ledger_batch_size
+        self.flush_seconds = flush_seconds or settings.llm_ledger_flush_seconds
+        self._buffer: List[Dict] = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def record(
+        self,
+        stage: Optional[str],
+        model: Optional[str] = None,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        latency_ms: float = 0.0,
+        cache_hit: bool = False,
+        error_class: Optional[str] = None,
+        topic_id: Optional[int] = None,
+        article_id: Optional[int] = None
+    ) -> None:
+        """호출 1건 기록 (버퍼가 차거나 주기가 지나면 저장)"""
+        if stage and not error_class:
+            record_cache(f"llm_{stage}", hit=cache_hit)
+        entry = {
+            "created_at": datetime.datetime.utcnow(),
+            "stage": stage,
+            "topic_id": topic_id,
+            "article_id": article_id,
+            "model": model,
+            "prompt_tokens": prompt_tokens or 0,
+            "completion_tokens": completion_tokens or 0,
+            "latency_ms": latency_ms,
+            "cache_hit": cache_hit,
+            "error_class": error_class,
+        }
+        with self._lock:
+            self._buffer.append(entry)
+            should_flush = (
+                len(self._buffer) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_seconds
+            )
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> int:
+        """버퍼의 기록을 DB에 저장"""
+        with self._lock:
+            entries, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+        if not entries:
+            return 0
+
+        db = SessionLocal()
+        try:
+            db.execute(insert(LLMCall), entries)
+            db.commit()
+            return len(entries)
+        except Exception as e:
+            db.rollback()
+            print(f"!!! LLM 호출 기록 저장 실패 ({len(entries)}건): {e}")
+            return 0
+        finally:
+            db.close()
+
+
+ledger = LLMLedger()
+atexit.register(ledger.flush)
+
+
+def estimate_cost(model: Optional[str], prompt_tokens: int, completion_tokens: int) -> float:
+    """모델 단가표 기준 예상 비용(USD)"""
+    prices = settings.llm_token_prices.get(model or "")
+    if not prices:
+        return 0.0
+    return (prompt_tokens * prices[0] + completion_tokens * prices[1]) / 1_000_000
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _as_date(value) -> datetime.date:
+    """date(created_at) 결과 (SQLite는 'YYYY-MM-DD' 문자열)"""
+    if isinstance(value, str):
+        return datetime.date.fromisoformat(value)
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    return value
+
+
+def summarize_usage(db: Session, days: int = 7, stage: Optional[str] = None) -> List[Dict]:
+    """
+    일자/단계별 LLM 사용량 집계
+
+    호출/오류/캐시 적중 수와 토큰 합계는 DB에서 GROUP BY로 집계하고(비용 계산을 위해 모델까지 나눔),
+    지연시간은 일자/단계마다 최근 LLM_USAGE_LATENCY_SAMPLES건만 읽어 p50/p95를 계산합니다.
+
+    Args:
+        days: 집계 기간 (1 ~ LLM_USAGE_MAX_DAYS일로 제한)
+
+    Returns:
+        호출 수, 오류 수, 캐시 적중 수, 토큰 합계, 예상 비용, p50/p95 지연시간(ms)
+    """
+    ledger.flush()
+    days = min(max(days, 1), settings.llm_usage_max_days)
+    since = datetime.datetime.utcnow() - datetime.timedelta(days=days)
+    day = func.date(LLMCall.created_at)
+    stage_name = func.coalesce(LLMCall.stage, "unknown")
+    filters = [LLMCall.created_at >= since]
+    if stage:
+        filters.append(LLMCall.stage == stage)
+    # 캐시 적중은 토큰/비용/지연시간에서 제외
+    billed = func.coalesce(LLMCall.cache_hit, False) == False
+
+    groups = defaultdict(lambda: {
+        "calls": 0, "errors": 0, "cache_hits": 0,
+        "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0, "latencies": []
+    })
+    totals = db.execute(
+        select(
+            day, stage_name, LLMCall.model,
+            func.count(),
+            func.count(LLMCall.error_class),
+            func.sum(case((billed, 0), else_=1)),
+            func.sum(case((billed, func.coalesce(LLMCall.prompt_tokens, 0)), else_=0)),
+            func.sum(case((billed, func.coalesce(LLMCall.completion_tokens, 0)), else_=0)),
+        )
+        .where(*filters)
+        .group_by(day, stage_name, LLMCall.model)
+    ).all()
+    for day_value, stage_value, model, calls, errors, cache_hits, prompt_tokens, completion_tokens in totals:
+        group = groups[(_as_date(day_value), stage_value)]
+        group["calls"] += calls
+        group["errors"] += errors
+        group["cache_hits"] += cache_hits or 0
+        group["prompt_tokens"] += prompt_tokens or 0
+        group["completion_tokens"] += completion_tokens or 0
+        group["cost_usd"] += estimate_cost(model, prompt_tokens or 0, completion_tokens or 0)
+
+    ranked = (
+        select(
+            day.label("day"), stage_name.label("stage"), LLMCall.latency_ms,
+            func.row_number().over(partition_by=(day, stage_name), order_by=LLMCall.id.desc()).label("rank")
+        )
+        .where(*filters, billed, LLMCall.error_class == None)
+        .subquery()
+    )
+    for day_value, stage_value, latency_ms in db.execute(
+        select(ranked.c.day, ranked.c.stage, ranked.c.latency_ms)
+        .where(ranked.c.rank <= settings.llm_usage_latency_samples)
+    ):
+        groups[(_as_date(day_value), stage_value)]["latencies"].append(latency_ms or 0.0)
+
+    summary = []
+    for (day_value, stage_value), group in sorted(groups.items(), reverse=True):
+        latencies = group.pop("latencies")
+        summary.append({
+            "day": day_value,
+            "stage": stage_value,
+            **group,
+            "cost_usd": round(group["cost_usd"], 6),
+            "latency_p50_ms": round(_percentile(latencies, 50), 1),
+            "latency_p95_ms": round(_percentile(latencies, 95), 1),
+        })
+    return summary
@@ -0,0 +1,205 @@
+"""
+Naver Search Service - 네이버 뉴스 검색 OpenAPI 프록시 (TTL 캐시 + 동일 요청 병합 + 호출 한도 관리)
+
+- 같은 검색어/파라미터는 TTL 동안 캐시에서 응답
+- 캐시에 없는 같은 요청이 동시에 들어오면 upstream 호출 1번의 결과를 함께 사용
+- 초당 요청 수와 일일 호출 한도를 넘기지 않도록 요청 전에 슬롯을 예약
+"""
+import asyncio
+import datetime
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.http_clients import http_clients
+from core.metrics import record_cache
+
+# 네이버 OpenAPI 일일 한도는 한국 시간 자정에 초기화
+KST = datetime.timezone(datetime.timedelta(hours=9))
+SORT_OPTIONS = ("sim", "date")
+
+SearchKey = Tuple[str, int, int, str]
+
+
+class SearchQuotaExceeded(Exception):
+    """호출 한도 초과 (retry_after초 후 재시도)"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class NaverSearchError(Exception):
+    """upstream 호출 실패"""
+
+
+def normalize_query(query: str) -> str:
+    """공백 정리 + 소문자 (캐시 키용)"""
+    return " ".join(query.split()).lower()
+
+
+class SearchRateLimiter:
+    """초당 요청 수 + 일일 호출 한도 (스레드/이벤트 루프 어디서든 사용 가능한 예약 방식)"""
+
+    def __init__(self, rate_per_second: float, daily_quota: int):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self.daily_quota = daily_quota
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._day: Optional[datetime.date] = None
+        self._used_today = 0
+
+    @property
+    def used_today(self) -> int:
+        return self._used_today
+
+    def reserve(self, max_wait: float) -> float:
+        """
+        요청 1건의 슬롯 예약
+
+        Returns:
+            슬롯까지 기다려야 하는 시간(초)
+
+        Raises:
+            SearchQuotaExceeded: 일일 한도 초과 또는 대기 시간이 max_wait보다 김
+        """
+        with self._lock:
+            now_kst = datetime.datetime.now(KST)
+            if self._day != now_kst.date():
+                self._day, self._used_today = now_kst.date(), 0
+            if self._used_today >= self.daily_quota:
+                midnight = datetime.datetime.combine(now_kst.date() + datetime.timedelta(days=1), datetime.time(), KST)
+                raise SearchQuotaExceeded("네이버 검색 일일 호출 한도를 초과했습니다.", (midnight - now_kst).total_seconds())
+
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            wait = slot - now
+            if wait > max_wait:
+                raise SearchQuotaExceeded("네이버 검색 요청이 너무 많습니다.", wait)
+            self._next_slot = slot + self.interval
+            self._used_today += 1
+            return wait
+
+
+class NaverSearchService:
+    def __init__(self):
+        self.limiter = SearchRateLimiter(settings.naver_search_rate_per_second, settings.naver_search_daily_quota)
+        self._cache: "OrderedDict[SearchKey, Tuple[Dict, float]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # 진행 중인 upstream 요청 (같은 키의 동시 요청이 결과를 공유)
+        self._inflight: Dict[SearchKey, asyncio.Future] = {}
+
+    def _cache_get(self, key: SearchKey) -> Optional[Dict]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            data, expires_at = entry
+            if time.time() >= expires_at:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return data
+
+    def _cache_set(self, key: SearchKey, data: Dict) -> None:
+        with self._cache_lock:
+            self._cache[key] = (data, time.time() + settings.naver_search_cache_ttl_seconds)
+            self._cache.move_to_end(key)
+            while len(self._cache) > settings.naver_search_cache_max_entries:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    async def search(
+        self, query: str, display: int = 10, start: int = 1, sort: str = "sim",
+        max_wait: Optional[float] = None
+    ) -> Dict:
+        """
+        네이버 뉴스 검색 (캐시/요청 병합/호출 한도 적용)
+
+        Args:
+            max_wait: 초당 요청 한도 때문에 기다릴 최대 시간 (None이면 설정값, 배치 수집은 길게)
+
+        Raises:
+            SearchQuotaExceeded: 호출 한도 초과
+            NaverSearchError: upstream 오류
+        """
+        key = (normalize_query(query), display, start, sort)
+
+        while True:
+            cached = self._cache_get(key)
+            if cached is not None:
+                record_cache("naver_search", hit=True)
+                return cached
+
+            inflight = self._inflight.get(key)
+            if inflight is None or inflight.done():
+                break
+            # upstream 호출 없이 응답하므로 캐시 적중으로 집계
+            record_cache("naver_search", hit=True)
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # 이 요청이 취소됨
+                # upstream을 호출하던 요청이 취소됨 (연결 끊김) - 다시 시도해 한 요청이 호출을 이어받음
+
+        record_cache("naver_search", hit=False)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            # upstream에는 사용자가 입력한 검색어를 그대로 보냄 (정규화는 캐시 키에만 사용)
+            data = await self._fetch(
+                query, display, start, sort,
+                settings.naver_search_max_wait_seconds if max_wait is None else max_wait
+            )
+            self._cache_set(key, data)
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if not future.done():
+                # 이 요청이 취소됨(CancelledError는 Exception이 아님) - 기다리던 요청은 위에서 다시 시도
+                future.cancel()
+
+    async def _fetch(self, query: str, display: int, start: int, sort: str, max_wait: float) -> Dict:
+        wait = self.limiter.reserve(max_wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        try:
+            response = await http_clients.get_async("naver_openapi").get(
+                f"{settings.naver_openapi_base_url}/v1/search/news.json",
+                headers={
+                    "X-Naver-Client-Id": settings.naver_client_id,
+                    "X-Naver-Client-Secret": settings.naver_client_secret
+                },
+                params={"query": query, "display": display, "start": start, "sort": sort}
+            )
+        except httpx.HTTPError as e:
+            raise NaverSearchError(f"Naver API 오류: {e}") from e
+
+        if response.status_code == 429:
+            raise SearchQuotaExceeded("네이버 검색 API가 호출 한도 초과를 응답했습니다.", 1.0)
+        if response.status_code != 200:
+            raise NaverSearchError(f"Naver API 오류: 상태코드 {response.status_code}")
+        return response.json()
+
+
+naver_search = NaverSearchService()
@@ -0,0 +1,86 @@
+"""
+Password Hashing - bcrypt 해싱/검증을 전용 스레드 풀에서 실행
+
+bcrypt는 의도적으로 느린(수백 ms) 연산이라 요청 핸들러에서 직접 실행하면 이벤트 루프나
+요청 스레드 풀을 점유합니다. bcrypt는 해싱 중 GIL을 놓으므로 전용 스레드 풀에서 병렬로 실행하고,
+대기 중인 작업이 password_hash_max_pending을 넘으면 즉시 거절해 로그인 폭주가 서버 전체를 막지 않게 합니다.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+import bcrypt
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+
+# bcrypt는 72바이트까지만 사용 (기존 passlib 해시와 같은 방식으로 잘라서 처리)
+BCRYPT_MAX_BYTES = 72
+
+T = TypeVar("T")
+
+_executor = ThreadPoolExecutor(max_workers=settings.password_hash_workers, thread_name_prefix="bcrypt")
+_admission = threading.BoundedSemaphore(settings.password_hash_max_pending)
+
+
+class PasswordHashingBusy(Exception):
+    """대기 중인 해싱 작업이 허용 개수를 넘음"""
+
+
+def _encode(password: str) -> bytes:
+    return password.encode("utf-8")[:BCRYPT_MAX_BYTES]
+
+
+def _hash(password: str) -> str:
+    return bcrypt.hashpw(_encode(password), bcrypt.gensalt(rounds=settings.bcrypt_rounds)).decode("ascii")
+
+
+def _verify(password: str, hashed_password: str) -> bool:
+    try:
+        return bcrypt.checkpw(_encode(password), hashed_password.encode("ascii"))
+    except ValueError:
+        # bcrypt 형식이 아닌 해시
+        return False
+
+
+async def _run(func: Callable[..., T], *args) -> T:
+    if not _admission.acquire(blocking=False):
+        raise PasswordHashingBusy("비밀번호 처리 요청이 많습니다. 잠시 후 다시 시도하세요.")
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_executor, func, *args)
+    finally:
+        _admission.release()
+
+
+async def hash_password(password: str) -> str:
+    """
+    bcrypt 해시 생성 (work factor: settings.bcrypt_rounds)
+
+    Raises:
+        PasswordHashingBusy: 대기 작업이 허용 개수를 넘음
+    """
+    return await _run(_hash, password)
+
+
+async def verify_password(password: str, hashed_password: Optional[str]) -> bool:
+    """
+    비밀번호 검증 (소셜 로그인 사용자처럼 해시가 없으면 False)
+
+    Raises:
+        PasswordHashingBusy: 대기 작업이 허용 개수를 넘음
+    """
+    if not hashed_password:
+        return False
+    return await _run(_verify, password, hashed_password)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """저장된 해시의 work factor가 현재 설정과 다른지 (로그인 성공 시 재해싱 판단)"""
+    try:
+        return int(hashed_password.split("$")[2]) != settings.bcrypt_rounds
+    except (IndexError, ValueError):
+        return True
@@ -0,0 +1,159 @@
+"""
+Prompt Builder - 토큰 예산에 맞춘 기사 컨텍스트 조립
+"""
+import re
+import math
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+
+# 토크나이저가 없을 때: 한글 음절/단어/기호 단위 근사
+_APPROX_TOKEN = re.compile(r"[가-힣]|[A-Za-z]+|\d+|[^\sA-Za-z\d가-힣]")
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+|\n+")
+_NORMALIZE = re.compile(r"[\W_]+", re.UNICODE)
+
+# 문장 중복 제거 시 이보다 짧은 문장은 비교하지 않음 (정규화 후 글자 수)
+MIN_DEDUP_SENTENCE_LENGTH = 10
+
+_stats_lock = threading.Lock()
+_prompt_stats: Dict[str, Dict[str, int]] = {}
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """tiktoken 인코딩 (처음 사용할 때 로드 - 인코딩 파일이 없으면 내려받으므로 import 시점에 하지 않음)"""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:  # 미설치 또는 인코딩 파일 다운로드 불가
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """로컬 토크나이저 기준 토큰 수"""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return len(_APPROX_TOKEN.findall(text))
+
+
+def split_sentences(text: str) -> List[str]:
+    """본문을 문장 단위로 분리 (문단 순서 유지)"""
+    return [part.strip() for part in _SENTENCE_END.split(text or "") if part.strip()]
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding()
+    if encoding is not None:
+        # 토큰 경계가 한글 음절(UTF-8 여러 바이트) 중간일 수 있으므로 잘린 마지막 글자는 버림 (U+FFFD 방지)
+        return encoding.decode_bytes(encoding.encode(text)[:max_tokens]).decode("utf-8", errors="ignore")
+    tokens = count_tokens(text)
+    if tokens <= max_tokens:
+        return text
+    return text[:max(1, math.floor(len(text) * max_tokens / tokens))]
+
+
+@dataclass
+class ArticleSection:
+    """
+    프롬프트에 들어갈 기사 한 건
+
+    header/footer는 항상 포함되고 body만 예산에 맞춰 잘립니다.
+    """
+    header: str
+    body: str
+    footer: str = "\n"
+
+
+def build_context(
+    stage: str,
+    sections: List[ArticleSection],
+    budget: Optional[int] = None,
+    separator: str = "\n"
+) -> str:
+    """
+    기사 목록을 토큰 예산 안에서 하나의 컨텍스트 문자열로 조립
+
+    1. 여러 기사에 반복되는 문장(통신사 전재 등)은 처음 나온 기사에만 남김
+    2. 남은 예산을 기사별 본문 길이에 비례해 배분
+    3. 각 기사는 앞 문장(리드 문단)부터 배분량까지 채움
+
+    Args:
+        stage: 파이프라인 단계 이름 (예산/통계 키)
+        sections: 기사 목록
+        budget: 컨텍스트 토큰 예산 (None이면 설정값)
+    """
+    if budget is None:
+        budget = settings.prompt_context_budget(stage)
+
+    # 1. 문장 분리 및 기사 간 중복 문장 제거
+    seen = set()
+    bodies: List[List[str]] = []
+    for section in sections:
+        sentences = []
+        for sentence in split_sentences(section.body):
+            key = _NORMALIZE.sub("", sentence).lower()
+            if len(key) >= MIN_DEDUP_SENTENCE_LENGTH:
+                if key in seen:
+                    continue
+                seen.add(key)
+            sentences.append(sentence)
+        bodies.append(sentences)
+
+    # 2. 헤더/푸터/구분자를 뺀 본문 예산을 길이 비례로 배분
+    fixed_tokens = sum(count_tokens(s.header) + count_tokens(s.footer) for s in sections)
+    fixed_tokens += count_tokens(separator) * max(len(sections) - 1, 0)
+    sentence_tokens = [[count_tokens(sentence) for sentence in body] for body in bodies]
+    body_totals = [sum(tokens) for tokens in sentence_tokens]
+    total_body = sum(body_totals)
+    body_budget = max(budget - fixed_tokens, 0)
+    ratio = min(1.0, body_budget / total_body) if total_body else 1.0
+
+    # 3. 리드 문장부터 배분량만큼 채움
+    parts = []
+    for section, body, tokens, body_total in zip(sections, bodies, sentence_tokens, body_totals):
+        allowance = math.floor(body_total * ratio)
+        kept = []
+        for sentence, sentence_cost in zip(body, tokens):
+            if sentence_cost <= allowance:
+                kept.append(sentence)
+                allowance -= sentence_cost
+            else:
+                if not kept:
+                    kept.append(_truncate_to_tokens(sentence, allowance))
+                break
+        parts.append(f"{section.header}{' '.join(kept)}{section.footer}")
+
+    return separator.join(parts)
+
+
+def record_prompt_tokens(stage: str, *prompt_parts: str) -> int:
+    """단계별 프롬프트 토큰 수 기록 및 출력"""
+    tokens = sum(count_tokens(part) for part in prompt_parts)
+    with _stats_lock:
+        stats = _prompt_stats.setdefault(stage, {"calls": 0, "total_tokens": 0, "max_tokens": 0})
+        stats["calls"] += 1
+        stats["total_tokens"] += tokens
+        stats["max_tokens"] = max(stats["max_tokens"], tokens)
+    print(f"  . [prompt] {stage}: {tokens} tokens")
+    return tokens
+
+
+def get_prompt_stats() -> Dict[str, Dict[str, int]]:
+    """단계별 프롬프트 토큰 통계 (호출 수, 합계, 최대, 평균)"""
+    with _stats_lock:
+        return {
+            stage: {**stats, "avg_tokens": stats["total_tokens"] // max(stats["calls"], 1)}
+            for stage, stats in _prompt_stats.items()
+        }
@@ -0,0 +1,382 @@
+"""
+Retention - 오래된 토픽/기사를 보관 파일로 옮기고 운영 DB를 작게 유지 (파이프라인 retention 단계)
+
+1. 보관 (RETENTION_DAYS와 ARCHIVE_DIR을 모두 지정했을 때만): 만든 지 RETENTION_DAYS가 지났고 그 기간 동안 새 기사가 없는 토픽을 기사/집계/숏폼/토론과 함께
+   보관 파일(services/archive.py)에 쓰고 archived_topics 색인을 남긴 뒤 운영 테이블에서 삭제합니다.
+   토픽에 배정되지 않은 오래된 기사도 같은 파일에 기사 단위로 옮깁니다 (색인 없음).
+   운영 DB에서 지운 행은 보관 파일에만 남으므로 ARCHIVE_DIR은 모든 인스턴스가 보는 영구 볼륨이어야 합니다.
+2. LLM 호출 원장: LLM_CALL_RETENTION_DAYS가 지난 행을 삭제합니다. PostgreSQL에서 --partition으로
+   llm_calls를 월 단위 범위 파티션으로 바꾸면, 이후에는 다음 달 파티션을 미리 만들고 기간이 지난 파티션을 통째로 지웁니다.
+3. 정리: SQLite는 incremental_vacuum으로 빈 페이지를 파일에서 반환하고 ANALYZE(표본 제한)로 통계를 갱신,
+   PostgreSQL은 운영 테이블을 VACUUM (ANALYZE)합니다.
+
+articles/topics는 다른 테이블이 외래 키로 참조하므로(파티션 테이블은 파티션 키가 포함된 키만 참조 가능)
+파티션 대신 보관 작업으로 작게 유지하고, 참조가 없는 추가 전용 원장만 파티션으로 관리합니다.
+
+사용법:
+    python services/retention.py                 # 보관 + 원장 정리 + VACUUM/ANALYZE
+    python services/retention.py --days 30       # 보관 기준 일수 지정 (ARCHIVE_DIR 필요)
+    python services/retention.py --no-vacuum     # 정리(VACUUM/ANALYZE) 생략
+    python services/retention.py --partition     # (PostgreSQL, 1회) llm_calls를 월 단위 파티션 테이블로 변환
+"""
+import argparse
+import datetime
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, func, insert, or_, select, text, update
+from sqlalchemy.orm import Session
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.database import (
+    SessionLocal, engine, Topic, Article, Source, TopicStats, TopicTrendBucket, ArticleSimhashBand,
+    Short, Debate, LLMCall, ArchivedTopic
+)
+from services.archive import archive_store
+from services.event_bus import event_bus, TOPICS_UPDATED, SHORT_UPDATED, DEBATE_UPDATED
+
+# VACUUM (ANALYZE) 대상 (PostgreSQL)
+HOT_TABLES = (
+    "topics", "articles", "topic_stats", "topic_trend_buckets", "article_simhash_bands",
+    "shorts", "debates", "archived_topics", "llm_calls",
+)
+# SQLite ANALYZE가 인덱스마다 살펴보는 행 수 (0이면 전체)
+SQLITE_ANALYSIS_LIMIT = 1000
+# 미리 만들어 두는 다음 달 파티션 수
+PARTITION_MONTHS_AHEAD = 2
+LEDGER_TABLE = LLMCall.__tablename__
+LEDGER_DEFAULT_PARTITION = f"{LEDGER_TABLE}_default"
+LEDGER_PARTITION_PATTERN = re.compile(rf"^{LEDGER_TABLE}_p(\d{{4}})(\d{{2}})$")
+# 토픽 제외 컬럼 (사용하지 않는 본문 사본)
+TOPIC_SKIP_COLUMNS = ("body",)
+
+
+# --- 보관 ---
+def _rows(db: Session, query) -> List[Dict]:
+    return [dict(row) for row in db.execute(query).mappings()]
+
+
+def _article_query():
+    return (
+        select(Article.__table__, Source.name.label("source_name"), Source.bias_label.label("source_bias"))
+        .outerjoin(Source, Source.id == Article.source_id)
+    )
+
+
+def _eligible_topics(db: Session, cutoff: datetime.datetime, limit: int) -> List[int]:
+    # SQLite는 가장 큰 id를 지우면 다음 토픽이 같은 id를 받으므로 마지막 토픽은 남김
+    latest = select(func.max(Topic.id)).scalar_subquery()
+    return list(db.scalars(
+        select(Topic.id)
+        .outerjoin(TopicStats, TopicStats.topic_id == Topic.id)
+        .where(
+            Topic.created_at < cutoff,
+            or_(TopicStats.last_article_at == None, TopicStats.last_article_at < cutoff),
+            Topic.id < latest
+        )
+        .order_by(Topic.id)
+        .limit(limit)
+    ))
+
+
+def _topic_records(db: Session, topic_ids: List[int], archived_at: datetime.datetime) -> List[Dict]:
+    """토픽 묶음 (토픽, 집계, 기사 전체, 숏폼/토론 문서)"""
+    columns = [c for c in Topic.__table__.columns if c.name not in TOPIC_SKIP_COLUMNS]
+    topics = {row["id"]: row for row in _rows(db, select(*columns).where(Topic.id.in_(topic_ids)))}
+    stats = {
+        row["topic_id"]: row
+        for row in _rows(db, select(TopicStats.__table__).where(TopicStats.topic_id.in_(topic_ids)))
+    }
+    articles: Dict[int, List[Dict]] = {}
+    for row in _rows(db, _article_query().where(Article.topic_id.in_(topic_ids)).order_by(Article.id)):
+        articles.setdefault(row["topic_id"], []).append(row)
+    shorts = dict(db.execute(
+        select(Short.topic_id, Short.content_json).where(Short.topic_id.in_(topic_ids))
+    ).all())
+    debates = dict(db.execute(
+        select(Debate.topic_id, Debate.content_json).where(Debate.topic_id.in_(topic_ids))
+    ).all())
+
+    return [
+        {
+            "kind": "topic",
+            "archived_at": archived_at,
+            "topic": topics[topic_id],
+            "stats": stats.get(topic_id),
+            "articles": articles.get(topic_id, []),
+            "short": shorts.get(topic_id),
+            "debate": debates.get(topic_id),
+        }
+        for topic_id in topic_ids if topic_id in topics
+    ]
+
+
+def _delete_hot_rows(db: Session, topic_ids: List[int], article_ids: List[int]) -> None:
+    """보관한 토픽/기사와 딸린 행 삭제 (외래 키 순서대로, 커밋은 호출한 쪽에서)"""
+    if article_ids:
+        # 남는 기사가 보관한 기사를 대표(중복 원본)로 가리키면 연결만 끊음
+        db.execute(
+            update(Article)
+            .where(Article.canonical_id.in_(article_ids), Article.id.notin_(article_ids))
+            .values(canonical_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(delete(ArticleSimhashBand).where(ArticleSimhashBand.article_id.in_(article_ids)))
+    if topic_ids:
+        for model in (TopicStats, TopicTrendBucket, Short, Debate):
+            db.execute(delete(model).where(model.topic_id.in_(topic_ids)))
+    if article_ids:
+        db.execute(delete(Article).where(Article.id.in_(article_ids)))
+    if topic_ids:
+        db.execute(delete(Topic).where(Topic.id.in_(topic_ids)))
+
+
+def archive_topics(db: Session, cutoff: datetime.datetime) -> Dict[str, int]:
+    """기준 시각 이전 토픽을 배치 단위로 보관 파일로 옮김 (배치마다 커밋)"""
+    stats = {"topics": 0, "articles": 0, "files": 0}
+    while True:
+        topic_ids = _eligible_topics(db, cutoff, settings.retention_batch_size)
+        if not topic_ids:
+            break
+        archived_at = datetime.datetime.utcnow()
+        records = _topic_records(db, topic_ids, archived_at)
+        file_name, frames = archive_store.write_records(records)
+
+        db.execute(insert(ArchivedTopic), [
+            {
+                "topic_id": record["topic"]["id"],
+                "created_at": record["topic"]["created_at"],
+                "last_article_at": (record["stats"] or {}).get("last_article_at"),
+                "archived_at": archived_at,
+                "headline": record["topic"]["ai_neutral_headline"],
+                "article_count": len(record["articles"]),
+                "file_name": file_name,
+                "frame_offset": offset,
+                "frame_length": length,
+            }
+            for record, (offset, length) in zip(records, frames)
+        ])
+        article_ids = [a["id"] for record in records for a in record["articles"]]
+        _delete_hot_rows(db, topic_ids, article_ids)
+        db.commit()
+
+        # 캐시/스냅샷/키워드 색인에서 빼고, 이후 요청은 보관 경로로 응답
+        event_bus.publish(TOPICS_UPDATED, topic_ids)
+        for kind, field in ((SHORT_UPDATED, "short"), (DEBATE_UPDATED, "debate")):
+            ids = [r["topic"]["id"] for r in records if r[field] is not None]
+            if ids:
+                event_bus.publish(kind, ids)
+        stats["topics"] += len(records)
+        stats["articles"] += len(article_ids)
+        stats["files"] += 1
+        print(f"  . 토픽 {stats['topics']}개 / 기사 {stats['articles']}건 보관 ({file_name})")
+    return stats
+
+
+def archive_unassigned_articles(db: Session, cutoff: datetime.datetime) -> int:
+    """토픽에 배정되지 않은 오래된 기사를 보관 파일로 옮김"""
+    latest = select(func.max(Article.id)).scalar_subquery()
+    archived = 0
+    while True:
+        articles = _rows(db, _article_query().where(
+            Article.topic_id == None, Article.crawled_at < cutoff, Article.id < latest
+        ).order_by(Article.id).limit(settings.retention_batch_size))
+        if not articles:
+            break
+        archived_at = datetime.datetime.utcnow()
+        archive_store.write_records([
+            {"kind": "article", "archived_at": archived_at, "article": article} for article in articles
+        ])
+        _delete_hot_rows(db, [], [a["id"] for a in articles])
+        db.commit()
+        archived += len(articles)
+    if archived:
+        print(f"  . 토픽 없는 기사 {archived}건 보관")
+    return archived
+
+
+# --- LLM 호출 원장 ---
+def _month_start(moment: datetime.datetime) -> datetime.datetime:
+    return datetime.datetime(moment.year, moment.month, 1)
+
+
+def _add_months(month: datetime.datetime, count: int) -> datetime.datetime:
+    index = month.year * 12 + month.month - 1 + count
+    return datetime.datetime(index // 12, index % 12 + 1, 1)
+
+
+def _partition_name(month: datetime.datetime) -> str:
+    return f"{LEDGER_TABLE}_p{month:%Y%m}"
+
+
+def _ledger_partitioned(conn) -> bool:
+    return conn.execute(text(
+        "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = :name AND pg_table_is_visible(c.oid)"
+    ), {"name": LEDGER_TABLE}).first() is not None
+
+
+def _ledger_partitions(conn) -> List[str]:
+    return list(conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = :name AND pg_table_is_visible(p.oid)"
+    ), {"name": LEDGER_TABLE}).scalars())
+
+
+def _attach_month(conn, month: datetime.datetime) -> None:
+    """월 파티션 추가 - 기본 파티션에 먼저 들어간 그 달 행을 옮긴 뒤 붙임"""
+    name, end = _partition_name(month), _add_months(month, 1)
+    conn.execute(text(f"CREATE TABLE {name} (LIKE {LEDGER_TABLE} INCLUDING DEFAULTS)"))
+    conn.execute(text(
+        f"WITH moved AS (DELETE FROM {LEDGER_DEFAULT_PARTITION} "
+        f"WHERE created_at >= :start AND created_at < :end RETURNING *) "
+        f"INSERT INTO {name} SELECT * FROM moved"
+    ), {"start": month, "end": end})
+    conn.execute(text(
+        f"ALTER TABLE {LEDGER_TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+    ))
+
+
+def partition_llm_calls() -> None:
+    """(PostgreSQL, 1회) llm_calls를 created_at 월 단위 범위 파티션 테이블로 변환"""
+    if engine.dialect.name != "postgresql":
+        print("!!! 파티션은 PostgreSQL에서만 사용합니다.")
+        return
+    legacy = f"{LEDGER_TABLE}_unpartitioned"
+    with engine.begin() as conn:
+        if _ledger_partitioned(conn):
+            print(f">>> {LEDGER_TABLE}은(는) 이미 파티션 테이블입니다.")
+            return
+        # 파티션 키는 NULL일 수 없음
+        conn.execute(text(
+            f"UPDATE {LEDGER_TABLE} SET created_at = timezone('utc', now()) WHERE created_at IS NULL"
+        ))
+        first = conn.execute(text(f"SELECT min(created_at) FROM {LEDGER_TABLE}")).scalar()
+        sequence = conn.execute(text("SELECT pg_get_serial_sequence(:name, 'id')"), {"name": LEDGER_TABLE}).scalar()
+
+        conn.execute(text(f"ALTER TABLE {LEDGER_TABLE} RENAME TO {legacy}"))
+        conn.execute(text(
+            f"CREATE TABLE {LEDGER_TABLE} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)"
+        ))
+        conn.execute(text(f"ALTER TABLE {LEDGER_TABLE} ALTER COLUMN created_at SET NOT NULL"))
+        conn.execute(text(f"CREATE TABLE {LEDGER_DEFAULT_PARTITION} PARTITION OF {LEDGER_TABLE} DEFAULT"))
+        month = _month_start(first or datetime.datetime.utcnow())
+        last = _add_months(_month_start(datetime.datetime.utcnow()), PARTITION_MONTHS_AHEAD)
+        while month <= last:
+            _attach_month(conn, month)
+            month = _add_months(month, 1)
+        conn.execute(text(f"INSERT INTO {LEDGER_TABLE} SELECT * FROM {legacy}"))
+        if sequence:
+            conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {LEDGER_TABLE}.id"))
+        conn.execute(text(f"DROP TABLE {legacy}"))
+        # 기본 키/인덱스 이름이 기존 테이블과 같으므로 삭제 후 생성 (파티션 테이블의 키에는 파티션 키 포함)
+        conn.execute(text(f"ALTER TABLE {LEDGER_TABLE} ADD PRIMARY KEY (id, created_at)"))
+        for index in LLMCall.__table__.indexes:
+            index.create(conn)
+    print(f">>> {LEDGER_TABLE}을(를) 월 단위 파티션 테이블로 변환했습니다.")
+
+
+def prune_llm_calls(now: Optional[datetime.datetime] = None) -> int:
+    """
+    LLM 호출 원장 보관 기간 적용 (파티션 테이블이면 다음 달 파티션 생성 + 지난 파티션 삭제)
+
+    Returns:
+        삭제한 행 수 (파티션을 통째로 지운 경우는 포함하지 않음)
+    """
+    now = now or datetime.datetime.utcnow()
+    cutoff = now - datetime.timedelta(days=settings.llm_call_retention_days)
+    with engine.begin() as conn:
+        if engine.dialect.name == "postgresql" and _ledger_partitioned(conn):
+            partitions = set(_ledger_partitions(conn))
+            month = _month_start(now)
+            for ahead in range(PARTITION_MONTHS_AHEAD + 1):
+                if _partition_name(_add_months(month, ahead)) not in partitions:
+                    _attach_month(conn, _add_months(month, ahead))
+            if settings.llm_call_retention_days <= 0:
+                return 0
+            for name in sorted(partitions):
+                match = LEDGER_PARTITION_PATTERN.match(name)
+                if match and _add_months(datetime.datetime(int(match[1]), int(match[2]), 1), 1) <= cutoff:
+                    conn.execute(text(f"DROP TABLE {name}"))
+                    print(f"  . 원장 파티션 삭제: {name}")
+            return conn.execute(
+                text(f"DELETE FROM {LEDGER_DEFAULT_PARTITION} WHERE created_at < :cutoff"), {"cutoff": cutoff}
+            ).rowcount
+
+        if settings.llm_call_retention_days <= 0:
+            return 0
+        return conn.execute(delete(LLMCall).where(LLMCall.created_at < cutoff)).rowcount
+
+
+# --- 정리 ---
+def compact_database() -> None:
+    """삭제한 공간 반환 + 통계 갱신 (SQLite: incremental_vacuum/ANALYZE, PostgreSQL: VACUUM (ANALYZE))"""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if engine.dialect.name == "postgresql":
+            for table in HOT_TABLES:
+                conn.exec_driver_sql(f"VACUUM (ANALYZE) {table}")
+            return
+
+        if conn.exec_driver_sql("PRAGMA auto_vacuum").scalar() != 2:
+            # 처음 한 번만 VACUUM으로 파일 전체를 다시 써서 incremental 모드로 전환
+            conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.exec_driver_sql("VACUUM")
+            print("  . SQLite auto_vacuum=INCREMENTAL 전환 (VACUUM)")
+        else:
+            pages = settings.retention_vacuum_pages
+            # sqlite3 모듈의 execute는 한 단계(1페이지)만 실행하므로 executescript로 끝까지 실행
+            conn.connection.dbapi_connection.executescript(
+                f"PRAGMA incremental_vacuum({pages})" if pages else "PRAGMA incremental_vacuum"
+            )
+        conn.exec_driver_sql(f"PRAGMA analysis_limit = {SQLITE_ANALYSIS_LIMIT}")
+        conn.exec_driver_sql("ANALYZE")
+        conn.exec_driver_sql("PRAGMA analysis_limit = 0")
+        conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+def run_retention(days: Optional[int] = None, run_vacuum: bool = True) -> Dict[str, int]:
+    """
+    보관 + 원장 정리 + DB 정리 (파이프라인 retention 단계)
+
+    Args:
+        days: 보관 기준 일수 (None이면 RETENTION_DAYS, 0이면 보관하지 않음)
+        run_vacuum: False면 VACUUM/ANALYZE 생략
+    """
+    days = settings.retention_days if days is None else days
+    if days > 0 and not archive_store.root:
+        print("!!! ARCHIVE_DIR이 지정되지 않아 토픽을 보관(운영 DB에서 삭제)하지 않습니다.")
+        days = 0
+    stats: Dict[str, int] = {"topics": 0, "articles": 0, "files": 0, "unassigned_articles": 0}
+    db = SessionLocal()
+    try:
+        if days > 0:
+            cutoff = datetime.datetime.utcnow() - datetime.timedelta(days=days)
+            stats.update(archive_topics(db, cutoff))
+            stats["unassigned_articles"] = archive_unassigned_articles(db, cutoff)
+    finally:
+        db.close()
+
+    stats["llm_calls_deleted"] = prune_llm_calls()
+    if run_vacuum:
+        compact_database()
+    print(
+        f">>> 보관: 토픽 {stats['topics']}개, 기사 {stats['articles'] + stats['unassigned_articles']}건, "
+        f"LLM 호출 원장 {stats['llm_calls_deleted']}건 삭제"
+    )
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="오래된 토픽/기사 보관 및 DB 정리")
+    parser.add_argument("--days", type=int, default=None, help="보관 기준 일수 (기본 RETENTION_DAYS)")
+    parser.add_argument("--no-vacuum", action="store_true", help="VACUUM/ANALYZE 생략")
+    parser.add_argument("--partition", action="store_true", help="(PostgreSQL) llm_calls를 월 단위 파티션으로 변환")
+    args = parser.parse_args()
+    if args.partition:
+        partition_llm_calls()
+    run_retention(days=args.days, run_vacuum=not args.no_vacuum)
@@ -0,0 +1,341 @@
+"""
+Snapshots - 자주 읽히는 익명 조회 응답을 미리 압축한 정적 JSON 파일로 내보내고 제공
+
+파이프라인 마지막 단계(snapshot)에서 /topics, /topics?sort_by=trending, 최근 토픽의 /topics/{id},
+/shorts/{id}, /debate/{id} 응답을 렌더링해 버전 디렉터리에 JSON + gzip(+ brotli 패키지가 있으면 br)로 씁니다.
+
+    snapshots/
+      CURRENT                  # 현재 버전 이름 (임시 파일을 쓰고 os.replace로 교체 - 원자적)
+      versions/<version>/      # manifest.json, topics.json(.gz/.br), topics/<id>.json ...
+
+API 라우트는 현재 버전에 파일이 있으면 FileResponse(서버가 지원하면 sendfile)로 응답하고,
+없으면 기존처럼 DB에서 만듭니다. 스냅샷 이후 변경 이벤트(services/event_bus.py)를 받은 항목은
+다음 스냅샷이 만들어질 때까지 DB 경로로 응답해 오래된 파일을 내보내지 않습니다.
+"""
+import asyncio
+import datetime
+import gzip
+import json
+import shutil
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Iterable, List, Optional
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.database import create_standalone_async_engine, Topic, Short, Debate
+from core.metrics import record_cache
+from services.event_bus import (
+    event_bus, ARTICLES_UPDATED, TOPICS_CREATED, TOPICS_UPDATED, SHORT_UPDATED, DEBATE_UPDATED, RESYNC
+)
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 - 없으면 gzip만 생성
+    brotli = None
+
+POINTER_FILE = "CURRENT"
+MANIFEST_FILE = "manifest.json"
+# 현재 버전 포인터를 다시 확인하는 주기(초)
+POINTER_CHECK_SECONDS = 1.0
+LIST_KEYS = ("topics", "topics_trending")
+# Accept-Encoding 선호 순서 → 파일 확장자
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def topic_list_key(sort_by: Optional[str]) -> Optional[str]:
+    """토픽 목록 스냅샷 이름 (스냅샷을 만들지 않는 정렬이면 None)"""
+    if sort_by is None:
+        return "topics"
+    if sort_by == "trending":
+        return "topics_trending"
+    return None
+
+
+def _render(payload) -> bytes:
+    # FastAPI JSONResponse와 같은 직렬화
+    return json.dumps(
+        jsonable_encoder(payload), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _write_variants(directory: str, key: str, body: bytes) -> None:
+    path = os.path.join(directory, f"{key}.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(body)
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(body, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + ".br", "wb") as f:
+            f.write(brotli.compress(body, quality=11))
+
+
+def _accepted_encodings(request: Request) -> List[str]:
+    accepted = []
+    for part in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = part.partition(";")
+        params = params.replace(" ", "")
+        try:
+            quality = float(params[2:]) if params.startswith("q=") else 1.0
+        except ValueError:
+            quality = 1.0
+        if name.strip() and quality > 0:
+            accepted.append(name.strip().lower())
+    return accepted
+
+
+class SnapshotStore:
+    def __init__(self, root: Optional[str] = None):
+        self._root = root
+        self._version: Optional[str] = None
+        self._version_started_at = 0.0
+        self._pointer_mtime: Optional[float] = None
+        self._next_check = 0.0
+        # 스냅샷 이후 바뀐 항목 {key: 변경 시각(epoch)}, "*"는 전체
+        self._dirty: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> str:
+        return self._root or settings.snapshot_dir
+
+    def version_dir(self, version: str) -> str:
+        return os.path.join(self.root, "versions", version)
+
+    # --- 현재 버전 ---
+    def current_version(self) -> Optional[str]:
+        """CURRENT 포인터가 가리키는 버전 (포인터 파일 mtime이 바뀔 때만 다시 읽음)"""
+        now = time.monotonic()
+        if now < self._next_check:
+            return self._version
+        self._next_check = now + POINTER_CHECK_SECONDS
+        pointer = os.path.join(self.root, POINTER_FILE)
+        try:
+            mtime = os.stat(pointer).st_mtime
+        except OSError:
+            self._version = None
+            self._pointer_mtime = None
+            return None
+        if mtime != self._pointer_mtime:
+            try:
+                with open(pointer, encoding="utf-8") as f:
+                    version = f.read().strip()
+                with open(os.path.join(self.version_dir(version), MANIFEST_FILE), encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"!!! 스냅샷 포인터를 읽을 수 없습니다: {e}")
+                return self._version
+            self._version = version
+            self._version_started_at = manifest.get("started_at_epoch", 0.0)
+            self._pointer_mtime = mtime
+            with self._lock:
+                # 새 스냅샷 렌더링 시작 전에 바뀐 항목은 이미 반영됨
+                self._dirty = {k: t for k, t in self._dirty.items() if t >= self._version_started_at}
+        return self._version
+
+    def mark_dirty(self, keys: Iterable[str]) -> None:
+        """스냅샷 이후 바뀐 항목 - 다음 스냅샷 전까지 DB 경로로 응답 (이벤트 스레드에서 호출)"""
+        now = time.time()
+        with self._lock:
+            for key in keys:
+                self._dirty[key] = now
+
+    def _is_dirty(self, key: str) -> bool:
+        started_at = self._version_started_at
+        return any(self._dirty.get(k, 0.0) >= started_at for k in (key, "*"))
+
+    # --- 응답 ---
+    def response(self, request: Request, key: Optional[str]) -> Optional[FileResponse]:
+        """스냅샷 파일 응답 (파일이 없거나, 변경되었거나, 쿼리 파라미터가 더 있으면 None)"""
+        if not settings.snapshot_serving_enabled or key is None:
+            return None
+        version = self.current_version()
+        if version is None:
+            return None
+        # sort_by 외 파라미터(페이지 등)가 붙은 요청은 스냅샷과 다를 수 있음
+        if set(request.query_params) - {"sort_by"} or self._is_dirty(key):
+            record_cache("snapshot", hit=False)
+            return None
+
+        path = os.path.join(self.version_dir(version), f"{key}.json")
+        accepted = _accepted_encodings(request)
+        for encoding, extension in ENCODINGS:
+            if encoding in accepted and os.path.exists(path + extension):
+                path, content_encoding = path + extension, encoding
+                break
+        else:
+            content_encoding = None
+        if not os.path.exists(path):
+            record_cache("snapshot", hit=False)
+            return None
+
+        record_cache("snapshot", hit=True)
+        headers = {
+            "Vary": "Accept-Encoding",
+            "Cache-Control": f"public, max-age={settings.snapshot_max_age_seconds}",
+            "X-Snapshot-Version": version,
+        }
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
+        return FileResponse(path, media_type="application/json", headers=headers)
+
+
+snapshot_store = SnapshotStore()
+
+
+def _on_change(event) -> None:
+    ids = event.ids
+    if event.kind == RESYNC:
+        snapshot_store.mark_dirty(["*"])
+    elif event.kind in (TOPICS_CREATED, TOPICS_UPDATED, ARTICLES_UPDATED):
+        keys = list(LIST_KEYS)
+        if event.kind == TOPICS_UPDATED:
+            keys += [f"topics/{i}" for i in ids]
+        snapshot_store.mark_dirty(keys)
+    elif event.kind == SHORT_UPDATED:
+        snapshot_store.mark_dirty(f"shorts/{i}" for i in ids)
+    elif event.kind == DEBATE_UPDATED:
+        snapshot_store.mark_dirty(f"debate/{i}" for i in ids)
+
+
+event_bus.subscribe(
+    (RESYNC, TOPICS_CREATED, TOPICS_UPDATED, ARTICLES_UPDATED, SHORT_UPDATED, DEBATE_UPDATED), _on_change
+)
+
+
+# --- 내보내기 ---
+async def _render_snapshot(directory: str) -> Dict[str, int]:
+    counts = {"topics": 0, "shorts": 0, "debates": 0, "bytes": 0}
+
+    def write(key: str, payload) -> None:
+        body = _render(payload)
+        _write_variants(directory, key, body)
+        counts["bytes"] += len(body)
+
+    # 파이프라인 스레드의 새 이벤트 루프에서 실행되므로 API 서버의 커넥션 풀을 쓰지 않음
+    standalone_engine = create_standalone_async_engine()
+    try:
+        async with AsyncSession(standalone_engine, autoflush=False, expire_on_commit=False) as db:
+            await _render_snapshot_entries(db, write, counts)
+    finally:
+        await standalone_engine.dispose()
+    return counts
+
+
+async def _render_snapshot_entries(db: AsyncSession, write: Callable[[str, object], None], counts: Dict[str, int]) -> None:
+    # api 패키지가 이 모듈을 import하므로 순환 import를 피해 사용 시점에 import
+    from api.topics import build_topic_list, build_topic_view
+    from api.shorts import build_short_response
+    from api.debate import build_debate_response
+
+    listed: List[int] = []
+    for key, sort_by in (("topics", None), ("topics_trending", "trending")):
+        topics = await build_topic_list(sort_by, db)
+        write(key, topics)
+        listed += [t.topic_id for t in topics]
+
+    # 목록에 노출된 토픽 + 최근 토픽 (오래된 토픽은 DB 경로로 응답)
+    recent = (await db.scalars(
+        select(Topic.id).order_by(Topic.id.desc()).limit(settings.snapshot_topic_limit)
+    )).all()
+    topic_ids = list(dict.fromkeys(listed + list(recent)))
+    with_short = set((await db.scalars(select(Short.topic_id).where(Short.topic_id.in_(topic_ids)))).all())
+    with_debate = set((await db.scalars(select(Debate.topic_id).where(Debate.topic_id.in_(topic_ids)))).all())
+
+    for topic_id in topic_ids:
+        view = await build_topic_view(topic_id, db)
+        if view is None:
+            continue
+        write(f"topics/{topic_id}", view)
+        counts["topics"] += 1
+        if topic_id in with_short:
+            short = await build_short_response(topic_id, db)
+            if short is not None:
+                write(f"shorts/{topic_id}", short)
+                counts["shorts"] += 1
+        if topic_id in with_debate:
+            debate = await build_debate_response(topic_id, db)
+            if debate is not None:
+                write(f"debate/{topic_id}", debate)
+                counts["debates"] += 1
+
+
+def _publish_version(root: str, version: str) -> None:
+    """CURRENT 포인터 교체 (임시 파일 → os.replace, 읽는 쪽은 이전/새 버전 중 하나만 봄)"""
+    pointer = os.path.join(root, POINTER_FILE)
+    temp = f"{pointer}.{uuid.uuid4().hex}.tmp"
+    with open(temp, "w", encoding="utf-8") as f:
+        f.write(version)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp, pointer)
+
+
+def _prune_versions(root: str, current: str, keep: int) -> None:
+    versions_dir = os.path.join(root, "versions")
+    # 교체 직전에 파일을 열어 둔 요청이 있을 수 있으므로 최근 몇 개는 남김
+    versions = sorted(name for name in os.listdir(versions_dir) if not name.startswith("."))
+    for name in versions[:-max(keep, 1)]:
+        if name != current:
+            shutil.rmtree(os.path.join(versions_dir, name), ignore_errors=True)
+    for name in os.listdir(versions_dir):
+        # 중단된 내보내기의 임시 디렉터리
+        path = os.path.join(versions_dir, name)
+        if name.startswith(".") and time.time() - os.path.getmtime(path) > 3600:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def export_snapshots(root: Optional[str] = None) -> Dict:
+    """
+    정적 스냅샷 생성 후 현재 버전으로 교체 (파이프라인 snapshot 단계)
+
+    Returns:
+        버전 이름과 항목 수
+    """
+    root = root or settings.snapshot_dir
+    started_at = datetime.datetime.utcnow()
+    started_epoch = time.time()
+    version = f"{started_at.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    versions_dir = os.path.join(root, "versions")
+    temp_dir = os.path.join(versions_dir, f".{version}.tmp")
+    os.makedirs(temp_dir, exist_ok=True)
+
+    try:
+        counts = asyncio.run(_render_snapshot(temp_dir))
+        manifest = {
+            "version": version,
+            "started_at": started_at.isoformat(),
+            "started_at_epoch": started_epoch,
+            "finished_at": datetime.datetime.utcnow().isoformat(),
+            "encodings": ["identity", "gzip"] + (["br"] if brotli is not None else []),
+            **counts,
+        }
+        with open(os.path.join(temp_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.rename(temp_dir, os.path.join(versions_dir, version))
+    except Exception:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+
+    _publish_version(root, version)
+    _prune_versions(root, version, settings.snapshot_keep_versions)
+    print(
+        f">>> 스냅샷 {version}: 토픽 {counts['topics']}개, 숏폼 {counts['shorts']}개, "
+        f"토론 {counts['debates']}개 ({counts['bytes'] / 1024:.0f}KB, 압축 전)"
+    )
+    return manifest
+
+
+if __name__ == "__main__":
+    export_snapshots()
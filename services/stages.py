@@ -0,0 +1,8 @@
+"""
+Pipeline stage names - 파이프라인 단계(작업 종류) 이름 정의
+"""
+STAGE_CLASSIFY = "classify"
+STAGE_TOPIC_SUMMARY = "topic_summary"
+STAGE_ARTICLE_DETAILS = "article_details"
+STAGE_SHORT = "short"
+STAGE_DEBATE = "debate"
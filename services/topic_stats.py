@@ -0,0 +1,160 @@
+"""
+Topic Stats - 토픽별 기사 집계(topic_stats) 갱신
+
+/topics, /topics/{id}가 요청마다 기사 전체를 읽어 계산하던 값(기사 수, 대표 카테고리, 썸네일,
+좌/중/우 기사 수, 대표 기사, 마지막 기사 시각)을 토픽당 한 행으로 저장합니다.
+기사를 쓰는 단계(크롤링 정보보강, 군집화 배정, 관점 분류)가 커밋한 뒤 바뀐 토픽만 다시 집계합니다.
+
+대표 카테고리는 가장 많은 카테고리(동률이면 먼저 수집된 기사의 카테고리), 썸네일은 이미지가 있는
+첫 기사, 대표 기사는 중립 → 진보 → 보수 → 미분류 순으로 각 관점의 첫 기사입니다.
+인기 점수(trending_score)는 시간 버킷 카운터로 계산합니다 (services/trending.py).
+"""
+import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import SessionLocal, Topic, Article, Source, TopicStats
+from services import trending
+
+# IN 절 하나에 넣는 토픽 수
+REFRESH_BATCH_SIZE = 500
+BIAS_LABELS = ("left", "center", "right")
+# 대표 기사를 고르는 관점 순서
+REPRESENTATIVE_ORDER = ("center", "left", "right", "unknown")
+
+
+def _compute_rows(db: Session, topic_ids: List[int]) -> List[Dict]:
+    topic_ids = list(db.scalars(select(Topic.id).where(Topic.id.in_(topic_ids))))
+    if not topic_ids:
+        return []
+    now = datetime.datetime.utcnow()
+    rows = {
+        topic_id: {
+            "topic_id": topic_id, "article_count": 0, "category": None, "thumb_url": None,
+            "left_count": 0, "center_count": 0, "right_count": 0, "unknown_count": 0,
+            "representative_article_id": None, "last_article_at": None,
+            "trending_score": None, "trending_bucket_at": None, "updated_at": now,
+        }
+        for topic_id in topic_ids
+    }
+
+    # 관점별 기사 수 / 첫 기사 / 마지막 수집 시각
+    first_by_bias: Dict[int, Dict[str, int]] = {}
+    bias_rows = db.execute(
+        select(
+            Article.topic_id, Source.bias_label,
+            func.count(Article.id), func.min(Article.id), func.max(Article.crawled_at)
+        )
+        .outerjoin(Source, Article.source_id == Source.id)
+        .where(Article.topic_id.in_(topic_ids))
+        .group_by(Article.topic_id, Source.bias_label)
+    ).all()
+    for topic_id, bias_label, count, first_id, last_at in bias_rows:
+        row = rows[topic_id]
+        bias = bias_label if bias_label in BIAS_LABELS else "unknown"
+        row[f"{bias}_count"] += count
+        row["article_count"] += count
+        first = first_by_bias.setdefault(topic_id, {})
+        first[bias] = min(first_id, first.get(bias, first_id))
+        if last_at is not None and (row["last_article_at"] is None or last_at > row["last_article_at"]):
+            row["last_article_at"] = last_at
+    for topic_id, first in first_by_bias.items():
+        rows[topic_id]["representative_article_id"] = next(
+            (first[bias] for bias in REPRESENTATIVE_ORDER if bias in first), None
+        )
+
+    # 대표 카테고리
+    best: Dict[int, tuple] = {}
+    category_rows = db.execute(
+        select(Article.topic_id, Article.category, func.count(Article.id), func.min(Article.id))
+        .where(Article.topic_id.in_(topic_ids), Article.category != None, Article.category != "")
+        .group_by(Article.topic_id, Article.category)
+    ).all()
+    for topic_id, category, count, first_id in category_rows:
+        # 많은 순, 동률이면 먼저 나온 카테고리
+        if topic_id not in best or (count, -first_id) > best[topic_id][:2]:
+            best[topic_id] = (count, -first_id, category)
+    for topic_id, (_, _, category) in best.items():
+        rows[topic_id]["category"] = category
+
+    # 썸네일
+    first_with_image = (
+        select(func.min(Article.id))
+        .where(Article.topic_id.in_(topic_ids), Article.image_url != None, Article.image_url != "")
+        .group_by(Article.topic_id)
+    )
+    for topic_id, image_url in db.execute(
+        select(Article.topic_id, Article.image_url).where(Article.id.in_(first_with_image))
+    ).all():
+        rows[topic_id]["thumb_url"] = image_url
+
+    for topic_id, (score, bucket_at) in trending.compute_scores(db, topic_ids).items():
+        rows[topic_id]["trending_score"] = score
+        rows[topic_id]["trending_bucket_at"] = bucket_at
+
+    return list(rows.values())
+
+
+def refresh_topic_stats(db: Session, topic_ids: Iterable[Optional[int]]) -> int:
+    """
+    지정한 토픽의 집계를 다시 계산해 저장 (커밋은 호출한 쪽에서)
+
+    AsyncSession에서는 await db.run_sync(refresh_topic_stats, topic_ids)로 호출합니다.
+
+    Returns:
+        저장한 토픽 수
+    """
+    ids = sorted({int(i) for i in topic_ids if i is not None})
+    saved = 0
+    for start in range(0, len(ids), REFRESH_BATCH_SIZE):
+        chunk = ids[start:start + REFRESH_BATCH_SIZE]
+        rows = _compute_rows(db, chunk)
+        db.execute(delete(TopicStats).where(TopicStats.topic_id.in_(chunk)))
+        if rows:
+            db.execute(insert(TopicStats), rows)
+        saved += len(rows)
+    return saved
+
+
+def backfill_topic_stats(rebuild: bool = False) -> int:
+    """
+    집계 행이 없는 토픽을 채움 (기존 DB / 직접 적재한 데이터, 서버 시작 시 호출)
+
+    집계 기간 안에 기사가 있는데 인기 점수가 없는 토픽(점수 도입 전 집계)도 버킷을 다시 세어 채웁니다.
+
+    Args:
+        rebuild: True면 모든 토픽을 다시 집계 (단계가 중간에 실패해 집계가 어긋났을 때, 반감기를 바꿨을 때)
+    """
+    db = SessionLocal()
+    try:
+        query = select(Topic.id)
+        if not rebuild:
+            query = query.outerjoin(TopicStats, TopicStats.topic_id == Topic.id).where(
+                (TopicStats.topic_id == None)
+                | ((TopicStats.last_article_at >= trending.window_start()) & (TopicStats.trending_bucket_at == None))
+            )
+        missing = list(db.scalars(query.order_by(Topic.id)))
+        if not missing:
+            return 0
+        saved = 0
+        for start in range(0, len(missing), REFRESH_BATCH_SIZE):
+            chunk = missing[start:start + REFRESH_BATCH_SIZE]
+            trending.rebuild_article_buckets(db, chunk)
+            saved += refresh_topic_stats(db, chunk)
+            db.commit()
+        trending.prune_buckets(db)
+        db.commit()
+        print(f">>> 토픽 집계 채움: {saved}개")
+        return saved
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_topic_stats(rebuild="--rebuild" in sys.argv)
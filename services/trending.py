@@ -0,0 +1,116 @@
+"""
+Trending - 토픽별 시간 버킷 기사 수와 감쇠 점수 (/topics?sort_by=trending)
+
+기사가 토픽에 배정되면(군집화) 수집 시각의 1시간 버킷 카운터(topic_trend_buckets)를 올리고,
+토픽 집계(services/topic_stats.py)를 갱신할 때 집계 기간 안의 버킷으로 점수를 계산해 topic_stats에 저장합니다.
+
+    점수(now) = Σ 버킷 기사 수 × 2^(-(now - 버킷 시각) / 반감기)
+
+now에 따른 배율 2^(-(now - 기준 시각) / 반감기)은 모든 토픽에 같으므로, 고정된 기준 시각으로 계산한
+log2 값을 저장하면 시간이 지나도 순위가 유지되어 다시 계산할 필요가 없습니다. 덕분에 상위 N개는
+trending_score 인덱스 역순 스캔으로 바로 읽습니다 (집계 기간 밖 토픽은 trending_bucket_at으로 제외).
+"""
+import datetime
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.database import Article, TopicTrendBucket
+
+# 점수 기준 시각 (변경하면 전체 재계산 필요)
+SCORE_EPOCH = datetime.datetime(2024, 1, 1)
+BUCKET = datetime.timedelta(hours=1)
+
+
+def bucket_start(moment: datetime.datetime) -> datetime.datetime:
+    """1시간 버킷 시작 시각"""
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def window_start(now: Optional[datetime.datetime] = None) -> datetime.datetime:
+    """집계 기간의 첫 버킷"""
+    now = now or datetime.datetime.utcnow()
+    return bucket_start(now - datetime.timedelta(hours=settings.trending_window_hours))
+
+
+def record_article_buckets(db: Session, articles: Iterable[Tuple[int, Optional[datetime.datetime]]]) -> int:
+    """
+    토픽에 배정된 기사를 시간 버킷 카운터에 더함 (커밋은 호출한 쪽에서, 점수는 refresh_topic_stats가 갱신)
+
+    Args:
+        articles: (토픽 id, 기사 수집 시각) 목록
+
+    Returns:
+        갱신한 버킷 수
+    """
+    cutoff = window_start()
+    now = datetime.datetime.utcnow()
+    deltas = Counter(
+        (topic_id, bucket_start(crawled_at or now))
+        for topic_id, crawled_at in articles
+        # 집계 기간이 지난 기사는 점수에 들어가지 않음
+        if topic_id is not None and (crawled_at or now) >= cutoff
+    )
+    for (topic_id, bucket), count in deltas.items():
+        updated = db.execute(
+            update(TopicTrendBucket)
+            .where(TopicTrendBucket.topic_id == topic_id, TopicTrendBucket.bucket_start == bucket)
+            .values(article_count=TopicTrendBucket.article_count + count)
+        ).rowcount
+        if not updated:
+            db.add(TopicTrendBucket(topic_id=topic_id, bucket_start=bucket, article_count=count))
+    db.flush()
+    return len(deltas)
+
+
+def rebuild_article_buckets(db: Session, topic_ids: List[int]) -> int:
+    """기사에서 버킷 카운터를 다시 셈 (기존 DB 백필 / 전체 재계산)"""
+    if not topic_ids:
+        return 0
+    db.execute(delete(TopicTrendBucket).where(TopicTrendBucket.topic_id.in_(topic_ids)))
+    rows = db.execute(
+        select(Article.topic_id, Article.crawled_at)
+        .where(Article.topic_id.in_(topic_ids), Article.crawled_at >= window_start())
+    ).all()
+    return record_article_buckets(db, rows)
+
+
+def prune_buckets(db: Session) -> int:
+    """집계 기간이 지난 버킷 삭제"""
+    return db.execute(delete(TopicTrendBucket).where(TopicTrendBucket.bucket_start < window_start())).rowcount
+
+
+def compute_scores(db: Session, topic_ids: List[int]) -> Dict[int, Tuple[float, datetime.datetime]]:
+    """
+    집계 기간 안의 버킷으로 토픽별 점수 계산
+
+    Returns:
+        {토픽 id: (log2 점수, 마지막 버킷 시각)} - 기간 안에 기사가 없는 토픽은 빠짐
+    """
+    half_life = settings.trending_half_life_hours * 3600
+    exponents: Dict[int, List[Tuple[float, int]]] = {}
+    latest: Dict[int, datetime.datetime] = {}
+    rows = db.execute(
+        select(TopicTrendBucket.topic_id, TopicTrendBucket.bucket_start, TopicTrendBucket.article_count)
+        .where(TopicTrendBucket.topic_id.in_(topic_ids), TopicTrendBucket.bucket_start >= window_start())
+    ).all()
+    for topic_id, bucket, count in rows:
+        if count <= 0:
+            continue
+        exponents.setdefault(topic_id, []).append(((bucket - SCORE_EPOCH).total_seconds() / half_life, count))
+        latest[topic_id] = max(bucket, latest.get(topic_id, bucket))
+
+    scores = {}
+    for topic_id, terms in exponents.items():
+        # log2(Σ count × 2^e) - 최댓값으로 나눠 계산해 2^e가 넘치지 않게 함
+        top = max(e for e, _ in terms)
+        scores[topic_id] = (top + math.log2(sum(count * 2 ** (e - top) for e, count in terms)), latest[topic_id])
+    return scores
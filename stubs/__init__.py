@@ -0,0 +1,3 @@
+"""
+Stubs - 오프라인 실행/벤치마크용 가짜 업스트림 (네이버 뉴스, 네이버 검색 OpenAPI, Perplexity)
+"""
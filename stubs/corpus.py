@@ -0,0 +1,247 @@
+"""
+Synthetic news corpus - 스텁 서버/벤치마크용 결정적(seed 고정) 가짜 기사 생성
+"""
+import random
+from html import escape
+from typing import Dict, List, Optional
+
+# (언론사 코드, 언론사 이름) - 네이버 기사 URL의 언론사 코드 형식
+PRESSES = [
+    ("032", "경향신문"), ("028", "한겨레"), ("047", "오마이뉴스"),
+    ("023", "조선일보"), ("025", "중앙일보"), ("020", "동아일보"),
+    ("005", "국민일보"), ("001", "연합뉴스"), ("469", "한국일보"),
+    ("052", "YTN"), ("009", "매일경제"), ("015", "한국경제"),
+]
+
+# 사건별 공통 어휘 - 같은 사건 기사끼리 제목/본문이 겹쳐 군집화/중복 탐지가 동작하도록 구성
+EVENTS = [
+    {
+        "section": "정치",
+        "subject": "내년도 예산안",
+        "titles": ["여야, 내년도 예산안 처리 시한 넘겨", "내년도 예산안 협상 재개", "예산안 처리 불발에 책임 공방"],
+        "facts": [
+            "국회가 법정 처리 시한인 12월 2일을 넘겨 내년도 예산안을 처리하지 못했다.",
+            "여야는 지역화폐 예산과 연구개발 예산 증액 규모를 두고 이견을 좁히지 못했다.",
+            "국회의장은 주말 본회의 개최 가능성을 열어뒀다.",
+        ],
+    },
+    {
+        "section": "경제",
+        "subject": "기준금리",
+        "titles": ["한국은행, 기준금리 3.25% 동결", "기준금리 동결에 시장 관망세", "한은 총재 \"환율 불확실성 여전\""],
+        "facts": [
+            "한국은행 금융통화위원회가 기준금리를 연 3.25%로 동결했다.",
+            "총재는 환율 변동성과 가계부채 증가세를 고려했다고 밝혔다.",
+            "시장에서는 내년 상반기 인하 가능성에 무게를 두고 있다.",
+        ],
+    },
+    {
+        "section": "사회",
+        "subject": "한파 특보",
+        "titles": ["전국 한파 특보…출근길 영하 12도", "한파에 수도관 동파 잇따라", "기상청 \"이번 주 내내 강추위\""],
+        "facts": [
+            "기상청은 중부지방 대부분에 한파 특보를 발령했다.",
+            "서울의 아침 최저기온은 영하 12도까지 떨어질 것으로 예상된다.",
+            "수도관 동파와 빙판길 낙상 사고에 주의가 필요하다.",
+        ],
+    },
+    {
+        "section": "IT/과학",
+        "subject": "AI 기본법 시행령",
+        "titles": ["AI 기본법 시행령 입법예고", "고영향 AI 사업자 의무 구체화", "AI 기본법 시행령에 업계 우려"],
+        "facts": [
+            "과학기술정보통신부가 AI 기본법 시행령 제정안을 입법예고했다.",
+            "고영향 AI를 제공하는 사업자는 위험 관리 방안을 수립해야 한다.",
+            "업계는 규제 부담을, 시민단체는 처벌 조항 미비를 지적했다.",
+        ],
+    },
+    {
+        "section": "세계",
+        "subject": "미중 관세 협상",
+        "titles": ["미중, 관세 협상 재개 합의", "미중 무역 협상 타결 기대감", "미국, 중국산 반도체 관세 유예"],
+        "facts": [
+            "미국과 중국이 고위급 관세 협상을 재개하기로 합의했다.",
+            "양국은 반도체와 희토류 수출 통제 문제를 주요 의제로 다룰 예정이다.",
+            "국내 수출 기업들은 협상 결과에 촉각을 곤두세우고 있다.",
+        ],
+    },
+    {
+        "section": "경제",
+        "subject": "코스피",
+        "titles": ["코스피 2% 하락 마감", "외국인 매도에 코스피 2480선", "반도체주 약세에 증시 하락"],
+        "facts": [
+            "코스피가 외국인 매도세에 전일 대비 2.1% 하락한 2480선에서 마감했다.",
+            "반도체 업종의 실적 우려와 미국 국채 금리 상승이 투자심리를 위축시켰다.",
+            "개인 투자자는 순매수를 이어갔다.",
+        ],
+    },
+    {
+        "section": "생활/문화",
+        "subject": "국립중앙박물관 특별전",
+        "titles": ["국립중앙박물관 특별전 관람객 50만 돌파", "특별전 연장 운영 결정", "박물관 특별전 예매 매진 행렬"],
+        "facts": [
+            "국립중앙박물관 특별전 누적 관람객이 50만 명을 넘어섰다.",
+            "박물관은 관람 수요를 고려해 전시를 한 달 연장하기로 했다.",
+            "주말 회차는 예매 시작과 동시에 매진되고 있다.",
+        ],
+    },
+    {
+        "section": "정치",
+        "subject": "노동조합법 개정안",
+        "titles": ["노동조합법 개정안 본회의 통과", "노조법 개정안 통과에 노사 엇갈린 반응", "경영계 \"노조법 개정 유감\""],
+        "facts": [
+            "하청 노동자의 교섭권을 보장하는 노동조합법 개정안이 본회의를 통과했다.",
+            "파업에 대한 과도한 손해배상 청구를 제한하는 조항도 포함됐다.",
+            "노동계는 환영 입장을, 경영계는 유감을 표했다.",
+        ],
+    },
+]
+
+# 언론사 성향별 논조 문장
+FRAMINGS = {
+    "left": "시민사회와 노동계의 목소리를 충분히 반영해야 한다는 지적이 나온다.",
+    "right": "시장과 기업의 부담을 고려한 신중한 접근이 필요하다는 목소리가 크다.",
+    "center": "관계 기관은 추가 논의를 거쳐 세부 내용을 확정할 계획이다.",
+}
+PRESS_BIAS = {
+    "경향신문": "left", "한겨레": "left", "오마이뉴스": "left",
+    "조선일보": "right", "중앙일보": "right", "동아일보": "right",
+    "매일경제": "right", "한국경제": "right",
+}
+FILLER = [
+    "관계자는 \"상황을 면밀히 지켜보고 있다\"고 말했다.",
+    "전문가들은 후속 조치가 중요하다고 입을 모았다.",
+    "이번 결정은 향후 정책 방향에 영향을 미칠 것으로 보인다.",
+    "정부는 다음 주 관련 회의를 열 예정이다.",
+    "현장에서는 혼란을 우려하는 목소리도 나왔다.",
+]
+REPORTER_NAMES = ["김민수", "이서연", "박지훈", "최유진", "정하늘", "강도윤", "윤서아", "임재원"]
+
+# 통신사 기사를 그대로 전재하는 비율 (유사 중복 탐지 재현)
+WIRE_COPY_RATIO = 0.15
+
+
+def article_path(press_code: str, article_no: int) -> str:
+    return f"/mnews/article/{press_code}/{article_no:010d}"
+
+
+def synthetic_article(index: int, seed: int = 0, event_count: Optional[int] = None) -> Dict:
+    """
+    index번째 가짜 기사 (같은 index/seed면 항상 같은 결과)
+
+    Returns:
+        press_code, press, article_no, path, title, body, reporter_name, section, image_url, event
+    """
+    rng = random.Random(seed * 1_000_003 + index)
+    press_code, press = PRESSES[index % len(PRESSES)]
+    event_index = (index // len(PRESSES)) % (event_count or len(EVENTS))
+    event = EVENTS[event_index % len(EVENTS)]
+    bias = PRESS_BIAS.get(press, "center")
+
+    if rng.random() < WIRE_COPY_RATIO:
+        # 통신사 기사 전재: 통신사 본문과 거의 같은 본문
+        wire_rng = random.Random(seed * 7_919 + event_index)
+        sentences = list(event["facts"]) + wire_rng.sample(FILLER, 2)
+        sentences.append(f"({press} 제공)")
+    else:
+        sentences = list(event["facts"])
+        rng.shuffle(sentences)
+        sentences.insert(rng.randint(0, len(sentences)), FRAMINGS[bias])
+        sentences += rng.sample(FILLER, rng.randint(1, 3))
+
+    title = rng.choice(event["titles"])
+    if rng.random() < 0.5:
+        title = f"[{event['subject']}] {title}"
+
+    article_no = seed * 10_000_000 + index + 1
+    return {
+        "press_code": press_code,
+        "press": press,
+        "article_no": article_no,
+        "path": article_path(press_code, article_no),
+        "title": title,
+        "body": " ".join(sentences),
+        "reporter_name": rng.choice(REPORTER_NAMES),
+        "section": event["section"],
+        "image_url": f"https://imgnews.example/{press_code}/{article_no}.jpg",
+        "event": event_index,
+    }
+
+
+def ranking_articles(seed: int = 0, per_press: int = 1, event_count: int = 4) -> List[Dict]:
+    """
+    랭킹 페이지용 기사 목록 (언론사별 per_press건)
+
+    언론사들이 event_count개 사건을 나눠 다루도록 배치해 군집화 단계에서 토픽이 생기게 합니다.
+    """
+    articles = []
+    for press_index in range(len(PRESSES)):
+        for rank in range(per_press):
+            event_index = (press_index + rank) % event_count
+            index = (rank * len(EVENTS) + event_index) * len(PRESSES) + press_index
+            articles.append(synthetic_article(index, seed))
+    return articles
+
+
+def find_article(press_code: str, article_no: int) -> Optional[Dict]:
+    """URL의 언론사 코드/기사 번호로 기사 복원"""
+    seed, remainder = divmod(article_no - 1, 10_000_000)
+    article = synthetic_article(remainder, seed)
+    return article if article["press_code"] == press_code else None
+
+
+def render_ranking_html(articles: List[Dict]) -> str:
+    """네이버 랭킹 페이지 구조(.rankingnews_box)를 흉내낸 HTML"""
+    boxes = {}
+    for article in articles:
+        boxes.setdefault(article["press"], []).append(article)
+
+    parts = ["<html><body><div class=\"rankingnews_box_wrap\">"]
+    for press, items in boxes.items():
+        parts.append("<div class=\"rankingnews_box\">")
+        parts.append(f"<strong class=\"rankingnews_name\">{escape(press)}</strong><ul class=\"rankingnews_list\">")
+        for item in items:
+            parts.append(f"<li><a href=\"{item['path']}\">{escape(item['title'])}</a></li>")
+        parts.append("</ul></div>")
+    parts.append("</div></body></html>")
+    return "".join(parts)
+
+
+def render_article_html(article: Dict) -> str:
+    """네이버 기사 페이지 구조(#dic_area, og 메타태그)를 흉내낸 HTML"""
+    return (
+        "<html><head>"
+        f"<meta property=\"og:image\" content=\"{escape(article['image_url'])}\">"
+        f"<meta property=\"og:article:section\" content=\"{escape(article['section'])}\">"
+        f"<title>{escape(article['title'])}</title></head><body>"
+        f"<span class=\"media_end_head_journalist_name\">{escape(article['reporter_name'])} 기자</span>"
+        f"<article id=\"dic_area\">{escape(article['body'])}</article>"
+        "</body></html>"
+    )
+
+
+def search_items(query: str, display: int = 10, base_url: str = "", seed: int = 0) -> Dict:
+    """네이버 검색 OpenAPI(news.json) 형식 응답"""
+    items = []
+    index = 0
+    # 제목/본문에 검색어가 들어간 기사 우선, 없으면 앞에서부터 채움
+    while len(items) < display and index < len(PRESSES) * len(EVENTS) * 4:
+        article = synthetic_article(index, seed)
+        index += 1
+        if query and query not in article["title"] + article["body"] and index < len(PRESSES) * len(EVENTS) * 2:
+            continue
+        title = article["title"].replace(query, f"<b>{query}</b>") if query else article["title"]
+        items.append({
+            "title": title,
+            "originallink": f"https://press.example/{article['press_code']}/{article['article_no']}",
+            "link": base_url + article["path"],
+            "description": article["body"][:120],
+            "pubDate": "Mon, 19 Oct 2026 09:00:00 +0900",
+        })
+    return {
+        "lastBuildDate": "Mon, 19 Oct 2026 09:00:00 +0900",
+        "total": len(items),
+        "start": 1,
+        "display": len(items),
+        "items": items,
+    }
@@ -0,0 +1,447 @@
+"""
+Stub Upstream Server - 네이버 뉴스 페이지 / 네이버 검색 OpenAPI / Perplexity(OpenAI 호환) 대체 서버
+
+라이브 네이버 페이지와 유료 Perplexity 키 없이 파이프라인 전체를 실행/측정하기 위한 로컬 서버입니다.
+카세트(stubs/cassettes/<name>)에 기록된 응답을 재생하고, 기록이 없으면 synthetic corpus로 응답을 만듭니다.
+
+사용법:
+    python stubs/server.py --port 8900 --llm-latency-ms 800 --llm-jitter-ms 300 --error-rate 0.05
+    python stubs/server.py --record              # 실제 서비스로 전달하며 응답을 카세트에 기록
+
+앱/스크립트를 스텁으로 향하게 하는 환경변수:
+    NAVER_NEWS_BASE_URL=http://127.0.0.1:8900
+    NAVER_OPENAPI_BASE_URL=http://127.0.0.1:8900
+    PPLX_BASE_URL=http://127.0.0.1:8900
+    PPLX_API_KEY=stub  NAVER_CLIENT_ID=stub  NAVER_CLIENT_SECRET=stub
+    CRAWL_REQUEST_DELAY_SECONDS=0
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stubs import corpus
+
+STUB_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CASSETTE_DIR = os.path.join(STUB_DIR, "cassettes", "default")
+
+# 기록 모드에서 요청을 전달할 실제 서비스
+UPSTREAM_NEWS = "https://news.naver.com"
+UPSTREAM_ARTICLE = "https://n.news.naver.com"
+UPSTREAM_OPENAPI = "https://openapi.naver.com"
+UPSTREAM_PPLX = "https://api.perplexity.ai"
+_NAVER_HOSTS = re.compile(r"https?://n?\.?news\.naver\.com")
+
+_HANGUL_WORD = re.compile(r"[가-힣]{2,}")
+DEBATE_SPEAKERS = ("positive", "neutral", "negative")
+
+
+@dataclass
+class StubConfig:
+    seed: int = 0
+    per_press: int = 1
+    llm_latency_ms: float = 0.0
+    llm_jitter_ms: float = 0.0
+    page_latency_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 429
+    cassette_dir: str = DEFAULT_CASSETTE_DIR
+    record: bool = False
+    strict: bool = False
+    verbose: bool = False
+
+
+class Cassette:
+    """기록된 페이지/검색/LLM 응답 저장소 (디렉터리 단위)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.pages_dir = os.path.join(directory, "pages")
+        self.completions_path = os.path.join(directory, "completions.jsonl")
+        self._lock = threading.Lock()
+        self._completions: Dict[str, Dict] = {}
+        if os.path.exists(self.completions_path):
+            with open(self.completions_path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._completions[entry["key"]] = entry["response"]
+
+    @staticmethod
+    def _page_file(key: str) -> str:
+        return hashlib.sha1(key.encode("utf-8")).hexdigest() + ".txt"
+
+    def page(self, key: str) -> Optional[str]:
+        path = os.path.join(self.pages_dir, self._page_file(key))
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    def save_page(self, key: str, text: str) -> None:
+        os.makedirs(self.pages_dir, exist_ok=True)
+        with open(os.path.join(self.pages_dir, self._page_file(key)), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def completion(self, key: str) -> Optional[Dict]:
+        return self._completions.get(key)
+
+    def save_completion(self, key: str, request_body: Dict, response: Dict) -> None:
+        with self._lock:
+            self._completions[key] = response
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.completions_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({
+                    "key": key,
+                    "model": request_body.get("model"),
+                    "response": response,
+                }, ensure_ascii=False) + "\n")
+
+
+def completion_key(body: Dict) -> str:
+    """같은 모델/메시지/응답 형식이면 같은 키"""
+    material = {
+        "model": body.get("model"),
+        "messages": body.get("messages"),
+        "response_format": body.get("response_format"),
+    }
+    return hashlib.sha256(json.dumps(material, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 2)
+
+
+def _fake_text(rng: random.Random, words, name: str) -> str:
+    picked = rng.sample(words, min(len(words), 8)) if words else ["스텁", "응답"]
+    return f"{' '.join(picked)} ({name})"
+
+
+def _fake_value(schema: Dict, name: str, rng: random.Random, words, position: int = 0):
+    kind = schema.get("type")
+    if kind == "object":
+        return {
+            key: _fake_value(sub_schema, key, rng, words, position)
+            for key, sub_schema in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        item_schema = schema.get("items", {"type": "string"})
+        return [_fake_value(item_schema, name, rng, words, index) for index in range(3)]
+    if kind in ("integer", "number"):
+        return position + 1
+    if kind == "boolean":
+        return True
+    if name == "speaker":
+        return DEBATE_SPEAKERS[position % len(DEBATE_SPEAKERS)]
+    if name == "avatar_color":
+        return "#6366f1"
+    return _fake_text(rng, words, name)
+
+
+def synthesize_completion(body: Dict) -> str:
+    """기록이 없을 때 요청 형식에 맞는 가짜 응답 본문 생성"""
+    prompt = "\n".join(message.get("content", "") for message in body.get("messages", []))
+    rng = random.Random(completion_key(body))
+    words = _HANGUL_WORD.findall(prompt)
+
+    response_format = body.get("response_format") or {}
+    schema = response_format.get("json_schema", {}).get("schema")
+    if schema:
+        return json.dumps(_fake_value(schema, "root", rng, words), ensure_ascii=False)
+
+    if "press_name" in prompt:
+        _, press = rng.choice(corpus.PRESSES)
+        return json.dumps({"press_name": press, "bias": corpus.PRESS_BIAS.get(press, "center")}, ensure_ascii=False)
+    if "alternative_title" in prompt:
+        return "```json\n" + json.dumps({
+            "alternative_title": _fake_text(rng, words, "제목"),
+            "bias_score": rng.randint(0, 10),
+            "reporter_summary": _fake_text(rng, words, "논조"),
+            "sentiment": rng.choice(["positive", "neutral", "negative"]),
+        }, ensure_ascii=False) + "\n```"
+    return _fake_text(rng, words, "응답")
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: StubConfig):
+        super().__init__(address, StubHandler)
+        self.config = config
+        self.cassette = Cassette(config.cassette_dir)
+        self.rng = random.Random(config.seed)
+        self.rng_lock = threading.Lock()
+        self.stats_lock = threading.Lock()
+        self.stats: Dict[str, int] = {}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key: str) -> None:
+        with self.stats_lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def random(self) -> float:
+        with self.rng_lock:
+            return self.rng.random()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server: StubServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.config.verbose:
+            super().log_message(format, *args)
+
+    # --- 공통 응답 ---
+    def _send(self, status: int, body: str, content_type: str) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_json(self, status: int, data) -> None:
+        self._send(status, json.dumps(data, ensure_ascii=False), "application/json; charset=utf-8")
+
+    def _not_recorded(self, what: str) -> None:
+        self.server.count("cassette_miss")
+        self._send_json(404, {"error": {"message": f"카세트에 기록되지 않은 요청입니다: {what}"}})
+
+    # --- GET: 네이버 페이지 / 검색 OpenAPI / 통계 ---
+    def do_GET(self):
+        parsed = urlsplit(self.path)
+        config = self.server.config
+
+        if parsed.path == "/__stats":
+            self._send_json(200, self.server.stats)
+            return
+
+        if config.page_latency_ms:
+            time.sleep(config.page_latency_ms / 1000)
+
+        if parsed.path == "/v1/search/news.json":
+            self._handle_search(parsed)
+        elif parsed.path.startswith("/main/ranking"):
+            self._handle_page(parsed, UPSTREAM_NEWS, self._synthesize_ranking)
+        elif parsed.path.startswith(("/mnews/article/", "/article/")):
+            self._handle_page(parsed, UPSTREAM_ARTICLE, self._synthesize_article)
+        else:
+            self._send_json(404, {"error": {"message": "unknown stub path"}})
+
+    def _handle_page(self, parsed, upstream: str, synthesize) -> None:
+        self.server.count("page")
+        cassette = self.server.cassette
+        key = parsed.path + ("?" + parsed.query if parsed.query else "")
+
+        if self.server.config.record:
+            response = requests.get(upstream + key, headers={"User-Agent": self.headers.get("User-Agent", "")}, timeout=10)
+            # 기록 재생 시 기사 링크가 스텁 서버를 가리키도록 네이버 도메인 제거
+            text = _NAVER_HOSTS.sub("", response.text)
+            cassette.save_page(key, text)
+            self._send(response.status_code, text, "text/html; charset=utf-8")
+            return
+
+        text = cassette.page(key)
+        if text is None:
+            if self.server.config.strict:
+                self._not_recorded(key)
+                return
+            text = synthesize(parsed)
+            if text is None:
+                self._send(404, "<html><body>not found</body></html>", "text/html; charset=utf-8")
+                return
+        self._send(200, text, "text/html; charset=utf-8")
+
+    def _synthesize_ranking(self, parsed) -> str:
+        config = self.server.config
+        return corpus.render_ranking_html(corpus.ranking_articles(config.seed, config.per_press))
+
+    def _synthesize_article(self, parsed) -> Optional[str]:
+        parts = parsed.path.rstrip("/").split("/")
+        try:
+            press_code, article_no = parts[-2], int(parts[-1])
+        except (IndexError, ValueError):
+            return None
+        article = corpus.find_article(press_code, article_no)
+        return corpus.render_article_html(article) if article else None
+
+    def _handle_search(self, parsed) -> None:
+        self.server.count("search")
+        params = parse_qs(parsed.query)
+        query = params.get("query", [""])[0]
+        display = int(params.get("display", ["10"])[0])
+        key = f"search:{query}:{display}"
+        cassette = self.server.cassette
+
+        if self.server.config.record:
+            response = requests.get(
+                UPSTREAM_OPENAPI + parsed.path, params={k: v[0] for k, v in params.items()},
+                headers={
+                    "X-Naver-Client-Id": self.headers.get("X-Naver-Client-Id", ""),
+                    "X-Naver-Client-Secret": self.headers.get("X-Naver-Client-Secret", ""),
+                },
+                timeout=10
+            )
+            cassette.save_page(key, response.text)
+            self._send(response.status_code, response.text, "application/json; charset=utf-8")
+            return
+
+        text = cassette.page(key)
+        if text is None:
+            if self.server.config.strict:
+                self._not_recorded(key)
+                return
+            self._send_json(200, corpus.search_items(query, display, self.server.base_url, self.server.config.seed))
+            return
+        self._send(200, text, "application/json; charset=utf-8")
+
+    # --- POST: OpenAI 호환 chat completions ---
+    def do_POST(self):
+        parsed = urlsplit(self.path)
+        if not parsed.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "unknown stub path"}})
+            return
+
+        length = int(self.headers.get("Content-Length", "0"))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        config = self.server.config
+        self.server.count("completion")
+
+        if config.llm_latency_ms or config.llm_jitter_ms:
+            jitter = (self.server.random() * 2 - 1) * config.llm_jitter_ms
+            time.sleep(max(config.llm_latency_ms + jitter, 0) / 1000)
+
+        if config.error_rate and self.server.random() < config.error_rate:
+            self.server.count("injected_error")
+            error_type = "rate_limit_error" if config.error_status == 429 else "server_error"
+            self._send_json(config.error_status, {"error": {"message": "stub injected error", "type": error_type}})
+            return
+
+        key = completion_key(body)
+        cassette = self.server.cassette
+
+        if config.record:
+            response = requests.post(
+                UPSTREAM_PPLX + "/chat/completions", json=body,
+                headers={"Authorization": self.headers.get("Authorization", "")},
+                timeout=120
+            )
+            if response.status_code == 200:
+                cassette.save_completion(key, body, response.json())
+            self._send(response.status_code, response.text, "application/json")
+            return
+
+        recorded = cassette.completion(key)
+        if recorded is not None:
+            self.server.count("cassette_hit")
+            self._send_json(200, recorded)
+            return
+        if config.strict:
+            self._not_recorded(f"completion {key[:12]}")
+            return
+
+        content = synthesize_completion(body)
+        prompt_tokens = sum(_estimate_tokens(m.get("content", "")) for m in body.get("messages", []))
+        completion_tokens = _estimate_tokens(content)
+        self._send_json(200, {
+            "id": f"stub-{key[:16]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        })
+
+
+def start_stub_server(config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0) -> StubServer:
+    """백그라운드 스레드에서 스텁 서버 시작 (port=0이면 빈 포트 자동 선택)"""
+    server = StubServer((host, port), config or StubConfig())
+    thread = threading.Thread(target=server.serve_forever, name="stub-server", daemon=True)
+    thread.start()
+    return server
+
+
+def stub_environment(base_url: str) -> Dict[str, str]:
+    """앱/스크립트를 스텁 서버로 향하게 하는 환경변수"""
+    return {
+        "NAVER_NEWS_BASE_URL": base_url,
+        "NAVER_OPENAPI_BASE_URL": base_url,
+        "PPLX_BASE_URL": base_url,
+        "PPLX_API_KEY": os.environ.get("PPLX_API_KEY") or "stub",
+        "NAVER_CLIENT_ID": os.environ.get("NAVER_CLIENT_ID") or "stub",
+        "NAVER_CLIENT_SECRET": os.environ.get("NAVER_CLIENT_SECRET") or "stub",
+        "CRAWL_REQUEST_DELAY_SECONDS": "0",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="네이버/Perplexity 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--seed", type=int, default=0, help="synthetic corpus seed (랭킹 기사 구성)")
+    parser.add_argument("--per-press", type=int, default=1, help="랭킹 페이지 언론사별 기사 수")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="LLM 응답 지연")
+    parser.add_argument("--llm-jitter-ms", type=float, default=0.0, help="LLM 응답 지연 편차(±)")
+    parser.add_argument("--page-latency-ms", type=float, default=0.0, help="페이지/검색 응답 지연")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="LLM 오류 주입 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, default=429, help="주입할 오류 상태 코드")
+    parser.add_argument("--cassette", default=DEFAULT_CASSETTE_DIR, help="카세트 디렉터리")
+    parser.add_argument("--record", action="store_true", help="실제 서비스로 전달하며 응답 기록")
+    parser.add_argument("--strict", action="store_true", help="기록되지 않은 요청은 합성하지 않고 404")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    config = StubConfig(
+        seed=args.seed,
+        per_press=args.per_press,
+        llm_latency_ms=args.llm_latency_ms,
+        llm_jitter_ms=args.llm_jitter_ms,
+        page_latency_ms=args.page_latency_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        cassette_dir=args.cassette,
+        record=args.record,
+        strict=args.strict,
+        verbose=args.verbose,
+    )
+    server = StubServer((args.host, args.port), config)
+    mode = "기록" if config.record else "재생"
+    print(f">>> 스텁 서버 시작 ({mode} 모드): {server.base_url}")
+    for key, value in stub_environment(server.base_url).items():
+        print(f"    {key}={value}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
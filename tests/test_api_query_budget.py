@@ -0,0 +1,84 @@
+"""
+API 라우터별 쿼리 예산 (core/query_budget.py ROUTER_QUERY_BUDGETS)
+
+라우터마다 대표 조회 라우트를 seed corpus에 요청하고, 요청당 쿼리 수가 예산을 넘거나
+같은 형태의 SELECT가 반복(N+1)되면 api_query_budget fixture가 테스트를 실패시킵니다.
+"""
+import pytest
+from sqlalchemy import select
+
+from conftest import CRON_SECRET
+from core.database import Article, Debate, Short, Topic
+
+
+@pytest.fixture(scope="module")
+def ids(corpus):
+    from core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return {
+            "topic": db.scalar(select(Topic.id).order_by(Topic.id.desc())),
+            "article": db.scalar(select(Article.id).order_by(Article.id.desc())),
+            "short": db.scalar(select(Short.topic_id).order_by(Short.topic_id.desc())),
+            "debate": db.scalar(select(Debate.topic_id).order_by(Debate.topic_id.desc())),
+        }
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="module")
+def auth_headers(client):
+    response = client.post("/auth/signup", json={
+        "email": "budget@example.com", "password": "budget-password", "username": "budget"
+    })
+    assert response.status_code == 200, response.text
+    client.post("/users", json={"username": "budget", "keywords": "정부,경제"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.parametrize("path", [
+    "/topics",
+    "/topics?sort_by=trending",
+    "/topics/{topic}",
+    "/topic/{topic}",
+    "/articles",
+    "/articles/{article}",
+    "/shorts/{short}",
+    "/debate/{debate}",
+    "/debate/{debate}/rounds/1",
+    "/debate/{debate}/conclusion",
+    "/debate/{debate}/status",
+    "/users/budget",
+])
+def test_public_routes(client, ids, auth_headers, api_query_budget, path):
+    response = client.get(path.format(**ids))
+    assert response.status_code == 200, response.text
+
+
+def test_feed(client, auth_headers, api_query_budget):
+    response = client.get("/feed", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["items"]
+
+
+def test_admin(client, api_query_budget):
+    for path in ("/admin/failures", "/admin/llm-usage"):
+        response = client.get(path, headers={"X-Cron-Secret": CRON_SECRET})
+        assert response.status_code == 200, response.text
+
+
+def test_over_budget_is_reported(client, ids):
+    """예산 검사가 실제로 요청을 집계하는지 확인 (예산 0으로 낮춰 초과시킴)"""
+    from core import query_budget
+
+    reports = query_budget.start_collecting()
+    original = dict(query_budget.ROUTER_QUERY_BUDGETS)
+    query_budget.ROUTER_QUERY_BUDGETS["/articles"] = 0
+    try:
+        client.get(f"/articles/{ids['article']}")
+    finally:
+        query_budget.ROUTER_QUERY_BUDGETS.clear()
+        query_budget.ROUTER_QUERY_BUDGETS.update(original)
+        query_budget.stop_collecting()
+    assert [report.route for report in reports if report.over_budget] == ["/articles/{article_id}"]
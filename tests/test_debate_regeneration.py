@@ -0,0 +1,38 @@
+"""
+토론 재생성 - 새 토론을 만든 뒤에만 기존 토론을 교체
+"""
+import pytest
+from sqlalchemy import select
+
+from core.database import Debate
+from services.debate_service import DebateService
+
+
+@pytest.fixture
+def debate(db):
+    return db.scalar(select(Debate).order_by(Debate.topic_id))
+
+
+def test_failed_regeneration_keeps_existing_debate(db, debate, monkeypatch):
+    previous = debate.content_json
+
+    def fail(*args, **kwargs):
+        raise TimeoutError("LLM timeout")
+
+    monkeypatch.setattr(DebateService, "_generate_debate_content", fail)
+    with pytest.raises(TimeoutError):
+        DebateService().regenerate_debate(debate.topic_id, db, force=True)
+
+    db.expire_all()
+    assert db.scalar(select(Debate.content_json).where(Debate.topic_id == debate.topic_id)) == previous
+
+
+def test_regeneration_updates_row_in_place(db, debate, monkeypatch):
+    replacement = {**debate.content_json, "topic_headline": "새 토론"}
+    monkeypatch.setattr(DebateService, "_generate_debate_content", lambda *args, **kwargs: replacement)
+
+    assert DebateService().regenerate_debate(debate.topic_id, db, force=True) == replacement
+    db.expire_all()
+    row = db.scalar(select(Debate).where(Debate.topic_id == debate.topic_id))
+    assert row.id == debate.id
+    assert row.content_json == replacement
@@ -0,0 +1,24 @@
+"""
+유사 중복 탐지 - 밴드 인덱스가 찾을 수 없는 해밍 거리는 허용하지 않음
+"""
+from core.config import settings
+from services import dedup
+
+
+def test_max_hamming_is_limited_by_band_index(monkeypatch):
+    monkeypatch.setattr(settings, "dedup_max_hamming", 8)
+    assert dedup.max_hamming() == dedup.BAND_COUNT - 1
+
+    monkeypatch.setattr(settings, "dedup_max_hamming", 1)
+    assert dedup.max_hamming() == 1
+
+
+def test_indexed_distance_shares_a_band():
+    fingerprint = 0x0123456789ABCDEF
+    # 밴드마다 하나씩, 밴드 수보다 하나 적은 비트를 뒤집어도 같은 밴드가 남음
+    flipped = fingerprint
+    for band in range(dedup.MAX_INDEXED_HAMMING):
+        flipped ^= 1 << (band * dedup.BAND_BITS)
+
+    assert dedup.hamming_distance(fingerprint, flipped) == dedup.max_hamming()
+    assert set(dedup._bands(fingerprint)) & set(dedup._bands(flipped))
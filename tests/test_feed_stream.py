@@ -0,0 +1,56 @@
+"""
+관심 키워드 실시간 알림 - 스트림 전용 토큰, 연결 수 한도는 스트림 응답을 시작하기 전에 503으로 거절
+"""
+import logging
+
+import pytest
+
+from api import feed
+from core.config import settings
+from services.keyword_watch import keyword_watch
+
+
+@pytest.fixture(scope="module")
+def access_token(client):
+    response = client.post("/auth/signup", json={
+        "email": "stream@example.com", "password": "stream-password", "username": "stream"
+    })
+    assert response.status_code == 200, response.text
+    client.post("/users", json={"username": "stream", "keywords": "정부,경제"})
+    return response.json()["access_token"]
+
+
+def _stream_token(client, access_token):
+    response = client.post("/feed/stream-token", headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == 200, response.text
+    assert response.json()["expires_in"] == settings.keyword_watch_stream_token_seconds
+    return response.json()["token"]
+
+
+def test_access_token_not_accepted_in_url(client, access_token):
+    assert client.get("/feed/stream", params={"token": access_token}).status_code == 401
+
+
+def test_stream_token_only_for_stream(client, access_token):
+    stream_token = _stream_token(client, access_token)
+    assert client.get("/feed", headers={"Authorization": f"Bearer {stream_token}"}).status_code == 401
+
+
+def test_stream_over_capacity_is_rejected(client, access_token, monkeypatch):
+    stream_token = _stream_token(client, access_token)
+    monkeypatch.setattr(settings, "keyword_watch_max_connections", 0)
+
+    response = client.get("/feed/stream", params={"token": stream_token})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "30"
+    assert keyword_watch.connection_count == 0
+
+
+def test_token_redacted_from_access_log():
+    record = logging.LogRecord(
+        "uvicorn.access", logging.INFO, __file__, 0, '%s - "%s %s HTTP/%s" %d',
+        ("127.0.0.1:5000", "GET", "/feed/stream?token=secret.jwt&x=1", "1.1", 200), None
+    )
+    feed._RedactTokenFilter().filter(record)
+    assert "secret" not in record.getMessage()
@@ -0,0 +1,51 @@
+"""
+LLM 사용량 집계 - 합계는 DB GROUP BY, 지연시간은 일자/단계별 최근 호출 표본, 기간 제한
+"""
+import datetime
+
+from conftest import CRON_SECRET
+from core.config import settings
+from core.database import LLMCall
+from services.llm_ledger import estimate_cost, summarize_usage
+
+STAGE = "usage_test"
+
+
+def test_summarize_usage(db, monkeypatch):
+    now = datetime.datetime.utcnow().replace(hour=12)
+    yesterday = now - datetime.timedelta(days=1)
+    db.add_all([
+        LLMCall(stage=STAGE, model="sonar", prompt_tokens=100, completion_tokens=10, latency_ms=100, created_at=now),
+        LLMCall(stage=STAGE, model="sonar-pro", prompt_tokens=200, completion_tokens=20, latency_ms=300, created_at=now),
+        LLMCall(stage=STAGE, model="sonar", prompt_tokens=50, completion_tokens=5, latency_ms=200, created_at=now),
+        LLMCall(stage=STAGE, model="sonar", prompt_tokens=999, completion_tokens=999, latency_ms=1,
+                cache_hit=True, created_at=now),
+        LLMCall(stage=STAGE, model="sonar", latency_ms=5000, error_class="TimeoutError", created_at=now),
+        LLMCall(stage=STAGE, model="sonar", prompt_tokens=10, completion_tokens=1, latency_ms=50, created_at=yesterday),
+        LLMCall(stage=STAGE, model="sonar", prompt_tokens=10, completion_tokens=1, latency_ms=50,
+                created_at=now - datetime.timedelta(days=30)),
+    ])
+    db.commit()
+    # 일자/단계마다 최근 2건의 지연시간만 사용 (200ms, 300ms - 먼저 기록된 100ms 호출은 제외)
+    monkeypatch.setattr(settings, "llm_usage_latency_samples", 2)
+
+    today, previous = summarize_usage(db, days=7, stage=STAGE)
+
+    assert today == {
+        "day": now.date(), "stage": STAGE, "calls": 5, "errors": 1, "cache_hits": 1,
+        "prompt_tokens": 350, "completion_tokens": 35,
+        "cost_usd": round(estimate_cost("sonar", 150, 15) + estimate_cost("sonar-pro", 200, 20), 6),
+        "latency_p50_ms": 200.0, "latency_p95_ms": 300.0,
+    }
+    assert (previous["day"], previous["calls"], previous["latency_p50_ms"]) == (yesterday.date(), 1, 50.0)
+
+    # 최대 기간보다 길게 요청하면 최대 기간으로 제한 (30일 전 호출 제외)
+    assert len(summarize_usage(db, days=365, stage=STAGE)) == 3
+    monkeypatch.setattr(settings, "llm_usage_max_days", 7)
+    assert summarize_usage(db, days=365, stage=STAGE) == [today, previous]
+
+
+def test_llm_usage_route_bounds_days(client):
+    headers = {"X-Cron-Secret": CRON_SECRET}
+    assert client.get("/admin/llm-usage", params={"days": settings.llm_usage_max_days + 1}, headers=headers).status_code == 422
+    assert client.get("/admin/llm-usage", params={"stage": STAGE}, headers=headers).status_code == 200
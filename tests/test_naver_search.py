@@ -0,0 +1,76 @@
+"""
+네이버 검색 프록시 - 동일 요청 병합(취소된 요청은 남은 요청이 이어받음), upstream 검색어
+"""
+import asyncio
+
+from services.naver_search import NaverSearchService
+
+
+def test_follower_takes_over_when_leader_is_cancelled(monkeypatch):
+    service = NaverSearchService()
+    calls = []
+
+    async def fetch(*args):
+        calls.append(args)
+        if len(calls) == 1:
+            await asyncio.Event().wait()  # 첫 호출(취소될 요청)은 끝나지 않음
+        return {"items": ["경제"]}
+
+    monkeypatch.setattr(service, "_fetch", fetch)
+
+    async def scenario():
+        leader = asyncio.create_task(service.search("경제"))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(service.search("경제")) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        results = await asyncio.wait_for(asyncio.gather(*followers), timeout=1)
+        assert leader.cancelled()
+        return results
+
+    assert asyncio.run(scenario()) == [{"items": ["경제"]}] * 2
+    # 남은 요청 중 하나만 upstream 호출을 이어받음
+    assert len(calls) == 2
+
+
+def test_cancelled_follower_does_not_cancel_leader(monkeypatch):
+    service = NaverSearchService()
+    release = None
+
+    async def fetch(*args):
+        await release.wait()
+        return {"items": []}
+
+    monkeypatch.setattr(service, "_fetch", fetch)
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        leader = asyncio.create_task(service.search("경제"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(service.search("경제"))
+        await asyncio.sleep(0)
+        follower.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.wait_for(leader, timeout=1)
+
+    assert asyncio.run(scenario()) == {"items": []}
+
+
+def test_original_query_sent_upstream(monkeypatch):
+    service = NaverSearchService()
+    queries = []
+
+    async def fetch(query, display, start, sort, max_wait):
+        queries.append(query)
+        return {"items": []}
+
+    monkeypatch.setattr(service, "_fetch", fetch)
+
+    async def scenario():
+        await service.search("OpenAI  GPT")
+        await service.search("openai gpt")  # 정규화한 키가 같으면 캐시에서 응답
+
+    asyncio.run(scenario())
+    assert queries == ["OpenAI  GPT"]
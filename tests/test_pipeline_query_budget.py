@@ -0,0 +1,64 @@
+"""
+파이프라인 단계 쿼리 예산 (스텁 LLM 서버 사용)
+
+대상을 고르는 쿼리가 토픽/기사 수에 비례해 늘어나지 않는지(N+1) 확인합니다.
+생성할 것이 없는 주기 실행은 corpus 크기와 관계없이 몇 개의 쿼리로 끝나야 합니다.
+"""
+import datetime
+
+import pytest
+from sqlalchemy import func, select
+
+from classify_articles import classify_articles_by_topic
+from core.database import Article, Debate, Short, Source, Topic
+from services.bias_classifier import DEFAULT_SOURCE_NAME
+from services.content_service import generate_shorts
+from services.debate_service import generate_debates_for_all_topics
+from services.llm_ledger import ledger
+
+# 생성할 것이 없을 때 단계 하나의 최대 쿼리 수
+IDLE_STAGE_BUDGET = 3
+
+
+@pytest.fixture
+def unclassified_articles(db):
+    """언론사가 확인되지 않은 기사(기본 언론사)를 토픽마다 하나씩 추가"""
+    default_source = db.scalar(select(Source).where(Source.name == DEFAULT_SOURCE_NAME))
+    if default_source is None:
+        default_source = Source(name=DEFAULT_SOURCE_NAME, bias_label="unknown")
+        db.add(default_source)
+        db.flush()
+    topics = db.execute(select(Topic.id, Topic.ai_neutral_headline)).all()
+    for topic_id, headline in topics:
+        db.add(Article(
+            title=f"{headline} 후속 보도", url=f"https://example.com/unclassified/{topic_id}",
+            body=f"{headline} 관련 후속 기사 본문입니다.", crawled_at=datetime.datetime.utcnow(),
+            source_id=default_source.id, topic_id=topic_id
+        ))
+    db.commit()
+    return len(topics)
+
+
+def test_classify_batches_queries(db, unclassified_articles, query_budget):
+    with query_budget(15, "classify"):
+        stats = classify_articles_by_topic()
+    ledger.flush()
+    assert stats["total"] == unclassified_articles
+
+
+def test_generate_shorts_idle_run(db, query_budget):
+    generate_shorts()
+    assert db.scalar(select(func.count(Short.id))) == db.scalar(select(func.count(Topic.id)))
+
+    with query_budget(IDLE_STAGE_BUDGET, "short"):
+        generate_shorts()
+    ledger.flush()
+
+
+def test_generate_debates_idle_run(db, query_budget):
+    generate_debates_for_all_topics()
+    assert db.scalar(select(func.count(Debate.id))) == db.scalar(select(func.count(Topic.id)))
+
+    with query_budget(IDLE_STAGE_BUDGET, "debate"):
+        generate_debates_for_all_topics()
+    ledger.flush()
@@ -0,0 +1,23 @@
+"""
+프롬프트 컨텍스트 - 토큰 단위로 자른 본문에 깨진 글자(U+FFFD)가 남지 않음
+"""
+from services import prompt_builder
+
+
+class ByteEncoding:
+    """UTF-8 바이트 하나를 토큰 하나로 세는 인코딩 (한글 음절 중간에서 잘리는 경우 재현)"""
+
+    def encode(self, text):
+        return list(text.encode("utf-8"))
+
+    def decode_bytes(self, tokens):
+        return bytes(tokens)
+
+
+def test_truncate_drops_partial_syllable(monkeypatch):
+    monkeypatch.setattr(prompt_builder, "_get_encoding", lambda: ByteEncoding())
+
+    truncated = prompt_builder._truncate_to_tokens("국회가 예산안을 처리했다", 8)
+
+    assert truncated == "국회"
+    assert "�" not in truncated
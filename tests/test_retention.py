@@ -0,0 +1,35 @@
+"""
+Retention - 보관은 ARCHIVE_DIR을 지정했을 때만, 보관된 토픽은 보관 경로로 응답
+"""
+import datetime
+
+from sqlalchemy import func, select, update
+
+from core.config import settings
+from core.database import Debate, Topic, TopicStats
+from services.retention import archive_topics, run_retention
+
+
+def test_retention_requires_archive_dir(db, monkeypatch):
+    monkeypatch.setattr(settings, "archive_dir", "")
+    topics = db.scalar(select(func.count(Topic.id)))
+
+    stats = run_retention(days=1, run_vacuum=False)
+
+    assert stats["topics"] == 0
+    assert db.scalar(select(func.count(Topic.id))) == topics
+
+
+def test_archived_debate_status(client, db):
+    topic_id = db.scalar(select(Debate.topic_id).order_by(Debate.topic_id))
+    long_ago = datetime.datetime.utcnow() - datetime.timedelta(days=400)
+    db.execute(update(Topic).where(Topic.id == topic_id).values(created_at=long_ago))
+    db.execute(update(TopicStats).where(TopicStats.topic_id == topic_id).values(last_article_at=long_ago))
+    db.commit()
+
+    stats = archive_topics(db, long_ago + datetime.timedelta(days=1))
+
+    assert stats["topics"] == 1
+    assert db.scalar(select(Debate.id).where(Debate.topic_id == topic_id)) is None
+    assert client.get(f"/debate/{topic_id}/status").json()["has_debate"] is True
+    assert client.get(f"/debate/{topic_id}").status_code == 200
@@ -0,0 +1,28 @@
+"""
+정적 스냅샷 - 파이프라인 스레드에서 내보내도 API 서버의 비동기 커넥션 풀을 쓰지 않음
+"""
+import json
+import os
+
+from sqlalchemy import event
+
+from core.database import async_engine
+from services.snapshots import export_snapshots, MANIFEST_FILE, POINTER_FILE
+
+
+def test_export_uses_its_own_engine(client, tmp_path):
+    client.get("/topics")  # API 이벤트 루프에서 공용 풀 커넥션 생성
+    checkouts = []
+    listener = lambda *args: checkouts.append(args)
+    event.listen(async_engine.sync_engine.pool, "checkout", listener)
+    try:
+        manifest = export_snapshots(str(tmp_path))
+    finally:
+        event.remove(async_engine.sync_engine.pool, "checkout", listener)
+
+    assert checkouts == []
+    assert (tmp_path / POINTER_FILE).read_text(encoding="utf-8") == manifest["version"]
+    version_dir = tmp_path / "versions" / manifest["version"]
+    assert json.loads((version_dir / MANIFEST_FILE).read_text(encoding="utf-8"))["topics"] == manifest["topics"] > 0
+    assert json.loads((version_dir / "topics.json").read_bytes()) == client.get("/topics").json()
+    assert os.path.exists(version_dir / "topics.json.gz")
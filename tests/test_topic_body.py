@@ -0,0 +1,33 @@
+"""
+토픽 본문 - 저장하지 않고 요약 입력 기사(get_input_articles)로 요청 시 만듦, 목록은 기사 본문을 읽지 않음
+"""
+from sqlalchemy import select
+
+from core import compression
+from core.database import Topic
+from services.content_hash import get_input_articles, TOPIC_SUMMARY_ARTICLE_LIMIT
+from services.content_service import ContentService, build_topic_body
+from services.llm_ledger import ledger
+
+
+def test_topic_body_is_derived(client, db):
+    topic_id = db.scalar(select(Topic.id).order_by(Topic.id.desc()))
+
+    ContentService().generate_topic_summary(topic_id)
+    ledger.flush()
+
+    db.expire_all()
+    assert db.get(Topic, topic_id).body is None
+    expected = build_topic_body(get_input_articles(db, topic_id, TOPIC_SUMMARY_ARTICLE_LIMIT))
+    assert client.get(f"/topics/{topic_id}").json()["topic_body"] == expected
+
+
+def test_article_list_skips_bodies(client, monkeypatch):
+    calls = []
+    original = compression.decompress_text
+    monkeypatch.setattr(compression, "decompress_text", lambda value: calls.append(1) or original(value))
+
+    response = client.get("/articles")
+
+    assert response.status_code == 200 and response.json()
+    assert calls == []